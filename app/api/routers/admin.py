@@ -2,7 +2,11 @@ from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from app.util.cache import cache_stats
 from app.util.functions.auth import internal_service_auth
+from app.util.functions.token_cache import token_cache
+from app.util.response_cache import experience_response_cache
+from app.util.singleflight import singleflight_stats
 
 router = APIRouter()
 templates = Jinja2Templates(directory='templates')
@@ -11,3 +15,10 @@ templates = Jinja2Templates(directory='templates')
 async def admin_dashboard(request: Request):
     context = {'request': request, 'title': 'Admin Dashboard'}
     return templates.TemplateResponse('admin/dashboard.html', context)
+
+
+@router.get('/cache-stats', dependencies=[Depends(internal_service_auth)])
+async def get_cache_stats():
+    """Hit/miss and coalescing counters of the in-process caches of the worker serving this request."""
+    return {'caches': cache_stats(), 'auth_tokens': token_cache.stats(), 'singleflight': singleflight_stats(),
+            'responses': {'experiences': experience_response_cache.stats()}}
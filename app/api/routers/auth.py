@@ -1,4 +1,7 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+
+from app.util.functions.auth import authenticate_request, bearer_token
+from app.util.functions.token_cache import token_cache
 
 
 router = APIRouter()
@@ -10,3 +13,11 @@ async def login():
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
         detail='Authentication is handled outside this service.',
     )
+
+
+@router.post('/logout', status_code=status.HTTP_204_NO_CONTENT)
+async def logout(request: Request, token: str = Depends(bearer_token)):
+    """Revoke the presented token on every worker until it expires; it is refused from then on."""
+    context = await authenticate_request(request, token)
+    await token_cache.revoke(token, context.claims.get("exp"))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
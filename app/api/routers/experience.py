@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from email.utils import parsedate_to_datetime
+from fastapi import APIRouter, Depends, Request, Response
 from typing import Optional
 
 from app.util.functions.auth import operator_auth, internal_service_auth, AuthContext
@@ -8,24 +9,106 @@ from app.schemas.experience import (
     ExperienceOutSchema,
     ExperienceListOutSchema,
     ExperienceListingQuery,
+    ExperienceClusterQuery,
+    ExperienceClusterOutSchema,
     RejectExperienceSchema,
+    ModerationQueueQuery,
+    ModerationQueueOutSchema,
+    BatchApproveSchema,
+    BatchRejectSchema,
+    BatchModerationOutSchema,
 )
+from app.schemas.review import ReviewListingQuery, ReviewListingResult
 from app.services.experience_service import ExperienceService
+from app.services.review_service import ReviewService
+from app.util.functions.conditional import (
+    PUBLIC_REVALIDATE,
+    etag_for_version,
+    is_not_modified,
+    not_modified,
+    set_validators,
+)
+from app.util.functions.fast_json import FastJSONResponse, dumps
+from app.util.response_cache import LISTING_TAG, experience_response_cache, experience_tag, operator_tag
 
 router = APIRouter()
 service = ExperienceService()
+review_service = ReviewService()
 
 
 @router.get("/", response_model=ExperienceListOutSchema, summary="List experiences")
 async def list_experiences(query: ExperienceListingQuery = Depends()):
     """Return a paginated list of experiences. Supports filtering by operator, status, price and location."""
-    return await service.list_experiences(query)
+    key = experience_response_cache.key("list", query.model_dump(mode="json"))
+    cached = await experience_response_cache.get(key)
+    if cached is not None:
+        return Response(cached.body, media_type="application/json")
+
+    generation = experience_response_cache.generation()
+    result = await service.list_experiences(query)
+    # Items are built in response shape by the repository; serialize them without re-validating
+    body = dumps(result)
+    tags = [LISTING_TAG, *(experience_tag(item["id"]) for item in result.items)]
+    if query.operator_id:
+        tags.append(operator_tag(query.operator_id))
+    await experience_response_cache.set(key, body, tags, generation=generation)
+    return Response(body, media_type="application/json")
+
+
+@router.get("/map/clusters", response_model=ExperienceClusterOutSchema, summary="Cluster experiences for a map viewport")
+async def get_map_clusters(query: ExperienceClusterQuery = Depends()):
+    """Return grid clusters (count, centroid, cheapest price, image) for a bbox at a zoom level, plus the experiences themselves when the viewport is sparse."""
+    return await service.get_map_clusters(query)
+
+
+@router.get("/moderation/queue", response_model=ModerationQueueOutSchema, dependencies=[Depends(internal_service_auth)], summary="Moderation queue")
+async def get_moderation_queue(query: ModerationQueueQuery = Depends()):
+    """List submitted experiences awaiting review, longest waiting first, paged by cursor (admin/internal service)."""
+    return await service.get_moderation_queue(query)
+
+
+@router.post("/moderation/approve", response_model=BatchModerationOutSchema, dependencies=[Depends(internal_service_auth)], summary="Approve experiences in bulk")
+async def approve_experiences(data: BatchApproveSchema, current_auth: AuthContext = Depends(internal_service_auth)):
+    """Approve up to 500 submitted experiences at once, reporting the outcome per experience (admin/internal service)."""
+    return await service.approve_experiences(data, current_auth.user_id)
+
+
+@router.post("/moderation/reject", response_model=BatchModerationOutSchema, dependencies=[Depends(internal_service_auth)], summary="Reject experiences in bulk")
+async def reject_experiences(data: BatchRejectSchema, current_auth: AuthContext = Depends(internal_service_auth)):
+    """Reject up to 500 submitted experiences at once with a reason each, reporting the outcome per experience (admin/internal service)."""
+    return await service.reject_experiences(data, current_auth.user_id)
 
 
 @router.get("/{experience_id}", response_model=ExperienceOutSchema, summary="Get experience")
-async def get_experience(experience_id: str):
-    """Retrieve a single experience by id."""
-    return await service.get_experience(experience_id)
+async def get_experience(experience_id: str, request: Request):
+    """Retrieve a single experience by id. Answers 304 when `If-None-Match`/`If-Modified-Since` match."""
+    key = experience_response_cache.key("detail", experience_id)
+    cached = await experience_response_cache.get(key)
+    if cached is not None:
+        etag = cached.headers["ETag"]
+        updated_at = parsedate_to_datetime(cached.headers["Last-Modified"]) if "Last-Modified" in cached.headers else None
+        if is_not_modified(request, etag, updated_at):
+            return not_modified(etag, updated_at, PUBLIC_REVALIDATE)
+        return Response(cached.body, media_type="application/json", headers=cached.headers)
+
+    generation = experience_response_cache.generation()
+    updated_at = await service.get_experience_updated_at(experience_id)
+    etag = etag_for_version(experience_id, updated_at)
+    if is_not_modified(request, etag, updated_at):
+        return not_modified(etag, updated_at, PUBLIC_REVALIDATE)
+
+    experience = await service.get_experience(experience_id)
+    response = Response(experience.model_dump_json(by_alias=True).encode("utf-8"), media_type="application/json")
+    set_validators(response, etag_for_version(experience_id, experience.updated_at), experience.updated_at, PUBLIC_REVALIDATE)
+    headers = {name: response.headers[name] for name in ("ETag", "Last-Modified", "Cache-Control") if name in response.headers}
+    await experience_response_cache.set(key, response.body, [experience_tag(experience_id), operator_tag(experience.operator_id)], headers, generation=generation)
+    return response
+
+
+@router.get("/{experience_id}/reviews", response_model=ReviewListingResult, summary="List experience reviews")
+async def list_experience_reviews(experience_id: str, query: ReviewListingQuery = Depends()):
+    """Return the visible reviews of an experience, newest first, with trip date and party size."""
+    return FastJSONResponse(await review_service.list_experience_reviews(experience_id, query))
 
 
 @router.post("/", response_model=ExperienceOutSchema, dependencies=[Depends(operator_auth)], summary="Create experience")
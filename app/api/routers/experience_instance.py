@@ -0,0 +1,41 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.schemas.experience_instance import (
+    ExperienceInstanceExportQuery,
+    ExperienceInstanceListingQuery,
+    ExperienceInstanceListingResult,
+)
+from app.services.experience_instance_service import ExperienceInstanceService
+from app.util.functions.auth import AuthContext
+from app.util.functions.fast_json import FastJSONResponse
+from app.util.functions.instance_export import ics, ndjson
+from app.util.functions.roles import require_operator
+
+router = APIRouter()
+service = ExperienceInstanceService()
+
+
+@router.get("/", response_model=ExperienceInstanceListingResult, summary="List experience instances")
+async def list_experience_instances(query: ExperienceInstanceListingQuery = Depends()):
+    """Return scheduled and recurring instances ordered by date, paged by cursor. Filter by experience, operator, status and date range."""
+    return FastJSONResponse(await service.list_experience_instances(query))
+
+
+@router.get("/export", dependencies=[Depends(require_operator)], summary="Export the operator's instances")
+async def export_experience_instances(
+    query: ExperienceInstanceExportQuery = Depends(),
+    format: Literal["ndjson", "ics"] = Query("ndjson", description="`ndjson` (one instance per line) or `ics` (iCalendar)."),
+    current_auth: AuthContext = Depends(require_operator),
+):
+    """Stream up to a year of the authenticated operator's instances as NDJSON or an iCalendar file, ordered by date."""
+    instances = await service.stream_operator_instances(current_auth.user_id, query)
+    if format == "ics":
+        return StreamingResponse(
+            ics(instances, "Pica-Bo experiences"),
+            media_type="text/calendar; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="experience-instances.ics"'},
+        )
+    return StreamingResponse(ndjson(instances), media_type="application/x-ndjson")
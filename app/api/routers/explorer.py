@@ -2,15 +2,23 @@ from __future__ import annotations
 
 from typing import List, Optional
 
+from typing import Annotated
+
 from fastapi import APIRouter, Depends, Query, status
 
 from app.schemas.explorer import ExplorerCreate, ExplorerOut, ExplorerUpdate
+from app.schemas.booking import BookingListingQuery, BookingListingResult
+from app.services.booking_service import BookingService
 from app.services.explorer_service import ExplorerService
+from app.util.functions.auth import AuthContext
+from app.util.functions.fast_json import FastJSONResponse
+from app.util.functions.roles import require_explorer
 from app.util.enums.enums import ExplorerStatus
 
 router = APIRouter()
 
 _explorer_service = ExplorerService()
+_booking_service = BookingService()
 
 
 def get_explorer_service() -> ExplorerService:
@@ -33,6 +41,15 @@ async def list_explorers(
     )
 
 
+@router.get("/me/bookings", response_model=BookingListingResult, dependencies=[Depends(require_explorer)])
+async def list_my_bookings(
+    query: Annotated[BookingListingQuery, Query()],
+    current_auth: AuthContext = Depends(require_explorer),
+) -> BookingListingResult:
+    """The authenticated explorer's bookings, newest first, with the booked date and experience."""
+    return FastJSONResponse(await _booking_service.list_explorer_bookings(current_auth.user_id, query))
+
+
 @router.get("/{explorer_id}", response_model=ExplorerOut)
 async def get_explorer(explorer_id: str, service: ExplorerService = Depends(get_explorer_service)) -> ExplorerOut:
     return await service.get_explorer(explorer_id)
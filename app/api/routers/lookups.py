@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Request, Response
 
 from app.services.lookup_service import LookupService
+from app.util.functions.conditional import PUBLIC_REFERENCE, is_not_modified, not_modified, set_validators
 
 router = APIRouter()
 
@@ -22,15 +23,34 @@ async def list_lookup_types(service: LookupService = Depends(get_lookup_service)
 
 
 @router.get("/{lookup_type}", response_model=List[Dict[str, Any]])
-async def list_lookup_items(lookup_type: str, service: LookupService = Depends(get_lookup_service)) -> List[Dict[str, Any]]:
-    """Fetch lookup values. Accessible to explorer/operator/admin."""
-    return await service.list_items(lookup_type)
+async def list_lookup_items(
+    lookup_type: str,
+    request: Request,
+    response: Response,
+    service: LookupService = Depends(get_lookup_service),
+) -> List[Dict[str, Any]]:
+    """Fetch lookup values. Accessible to explorer/operator/admin. Supports `If-None-Match`."""
+    items, etag = await service.list_items_versioned(lookup_type)
+    if is_not_modified(request, etag):
+        return not_modified(etag, None, PUBLIC_REFERENCE)
+    set_validators(response, etag, None, PUBLIC_REFERENCE)
+    return items
 
 
 @router.get("/{lookup_type}/{item_id}", response_model=Dict[str, Any])
-async def get_lookup_item(lookup_type: str, item_id: str, service: LookupService = Depends(get_lookup_service)) -> Dict[str, Any]:
-    """Fetch a single lookup entry. Accessible to explorer/operator/admin."""
-    return await service.get_item(lookup_type, item_id)
+async def get_lookup_item(
+    lookup_type: str,
+    item_id: str,
+    request: Request,
+    response: Response,
+    service: LookupService = Depends(get_lookup_service),
+) -> Dict[str, Any]:
+    """Fetch a single lookup entry. Accessible to explorer/operator/admin. Supports `If-None-Match`."""
+    item, etag = await service.get_item_versioned(lookup_type, item_id)
+    if is_not_modified(request, etag):
+        return not_modified(etag, None, PUBLIC_REFERENCE)
+    set_validators(response, etag, None, PUBLIC_REFERENCE)
+    return item
 
 
 @router.post("/{lookup_type}", response_model=Dict[str, Any], status_code=201)
@@ -1,10 +1,20 @@
 from typing import List, Optional, Annotated
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, Response, status, Query
 
 from app.schemas.operator import OperatorUpdate, OperatorListingQuery, OperatorListingResult, OperatorOut
+from app.schemas.settlement import SettlementListingQuery, SettlementListingResult
 from app.services.operator_service import OperatorService
+from app.services.settlement_service import SettlementService
 from app.util.functions.auth import operator_auth, AuthContext
+from app.util.functions.conditional import (
+	PRIVATE_REVALIDATE,
+	etag_for_version,
+	is_not_modified,
+	not_modified,
+	set_validators,
+)
+from app.util.functions.fast_json import FastJSONResponse
 from app.util.functions.roles import require_operator
 
 
@@ -44,6 +54,8 @@ async def list_operators(
 	- blocked: bool (optional) — Filter by blocked status.
 	- activities: List[str] (optional) — Filter by activity IDs.
 	- languages: List[str] (optional) — Filter by preferred language IDs.
+	- include_total: bool (optional) — Set to false to skip counting the total.
+	- estimate_total: bool (optional) — Return a cached, approximate total.
 
 	Authentication:
 	---------------
@@ -59,25 +71,34 @@ async def list_operators(
 		activities_ids=query.activities_ids,
 		preferred_language_ids=query.preferred_language_ids,
 		page=query.page,
-		page_size=query.page_size
+		page_size=query.page_size,
+		include_total=query.include_total,
+		estimate_total=query.estimate_total,
 	)
 
 
 @router.get("/", response_model=OperatorOut, dependencies=[Depends(require_operator)])
+@router.get("/me", response_model=OperatorOut, dependencies=[Depends(require_operator)])
 async def get_operator(
+	request: Request,
+	response: Response,
 	service: OperatorService = Depends(get_operator_service),
 	current_auth: AuthContext = Depends(require_operator),
 ) -> OperatorOut:
 	"""
-	Get a single operator profile by ID.
+	Get the authenticated operator's profile.
 
 	What this API does:
 	-------------------
-	Returns the operator profile for the given operator_id.
+	Returns the operator profile of the caller. Kept at its original path
+	`/`, which is declared after the operator listing, and also served at
+	`/me`, which only resolves to the profile.
 
-	Path Variables:
-	--------------
-	- operator_id: str — The unique identifier of the operator to retrieve.
+	Conditional requests:
+	---------------------
+	- Responses carry an ETag and Last-Modified derived from `updated_at`.
+	- A matching `If-None-Match` or `If-Modified-Since` is answered with 304
+	  after reading only `updated_at`.
 
 	Authentication:
 	---------------
@@ -88,7 +109,38 @@ async def get_operator(
 	- Only authenticated operators are authorized to access this API.
 	"""
 	auth_user_id = current_auth.user_id
-	return await service.get_operator(auth_user_id)
+	updated_at = await service.get_operator_updated_at(auth_user_id)
+	etag = etag_for_version(auth_user_id, updated_at)
+	if is_not_modified(request, etag, updated_at):
+		return not_modified(etag, updated_at, PRIVATE_REVALIDATE)
+
+	operator = await service.get_operator(auth_user_id)
+	set_validators(response, etag_for_version(auth_user_id, operator.updated_at), operator.updated_at, PRIVATE_REVALIDATE)
+	return operator
+
+
+_settlement_service = SettlementService()
+
+
+@router.get("/me/settlements", response_model=SettlementListingResult, dependencies=[Depends(require_operator)])
+async def list_operator_settlements(
+	query: Annotated[SettlementListingQuery, Query()],
+	current_auth: AuthContext = Depends(require_operator),
+) -> SettlementListingResult:
+	"""
+	List the authenticated operator's settlements.
+
+	What this API does:
+	-------------------
+	Returns settlements by due date, newest first, each with its payment and,
+	once batched, its payout batch. Linked documents are loaded with one query
+	per collection for the whole page.
+
+	Authorization:
+	--------------
+	- Only authenticated operators are authorized to access this API.
+	"""
+	return FastJSONResponse(await _settlement_service.list_operator_settlements(current_auth.user_id, query))
 
 
 @router.post("/", response_model=OperatorOut, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_operator)])
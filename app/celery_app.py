@@ -27,6 +27,13 @@ def make_celery():
 	celery.conf.beat_scheduler = (
 		"django_celery_beat.schedulers:DatabaseScheduler"
 		)
+	# Static entries are synced into the database scheduler on beat start
+	celery.conf.beat_schedule = {
+		"materialize-experience-occurrences": {
+			"task": "experiences.materialize_occurrences",
+			"schedule": settings.occurrence_refresh_seconds,
+		},
+	}
 	return celery
 
 celery_app = make_celery()
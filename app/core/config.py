@@ -49,6 +49,44 @@ class Settings(BaseSettings):
     internal_service_jwks_url: str = os.getenv("INTERNAL_SERVICE_JWKS_URL", "")
     internal_service_client_id: str = os.getenv("INTERNAL_SERVICE_CLIENT_ID", "")
 
+    # JWKS key store: background refresh period, minimum gap between on-demand
+    # refetches for unknown key ids, and HTTP timeout for a single fetch.
+    jwks_refresh_interval_seconds: int = int(os.getenv("JWKS_REFRESH_INTERVAL_SECONDS", "300"))
+    jwks_min_refetch_interval_seconds: int = int(os.getenv("JWKS_MIN_REFETCH_INTERVAL_SECONDS", "30"))
+    jwks_fetch_timeout_seconds: float = float(os.getenv("JWKS_FETCH_TIMEOUT_SECONDS", "5"))
+
+    # Verified-token cache: per-worker LRU size and optional shared Redis tier.
+    auth_token_cache_size: int = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "10000"))
+    auth_token_cache_redis: bool = os.getenv("AUTH_TOKEN_CACHE_REDIS", "false").lower() in ("1", "true", "yes")
+
+    # Listing totals and facets: how long an estimated count or facet counts are
+    # reused per filter, and how many distinct filters are remembered per worker.
+    listing_count_cache_ttl_seconds: int = int(os.getenv("LISTING_COUNT_CACHE_TTL_SECONDS", "60"))
+    listing_count_cache_size: int = int(os.getenv("LISTING_COUNT_CACHE_SIZE", "1024"))
+    listing_facet_cache_ttl_seconds: int = int(os.getenv("LISTING_FACET_CACHE_TTL_SECONDS", "30"))
+
+    # Map clustering: per-worker cache of computed grid cells.
+    map_cluster_cache_ttl_seconds: int = int(os.getenv("MAP_CLUSTER_CACHE_TTL_SECONDS", "60"))
+    map_cluster_cache_size: int = int(os.getenv("MAP_CLUSTER_CACHE_SIZE", "50000"))
+
+    # Occurrence calendar: how far ahead recurring experiences are materialized,
+    # and how often the Celery beat task refreshes it.
+    occurrence_horizon_days: int = int(os.getenv("OCCURRENCE_HORIZON_DAYS", "180"))
+    occurrence_refresh_seconds: int = int(os.getenv("OCCURRENCE_REFRESH_SECONDS", "900"))
+
+    # Recurrence expansion: per-worker parsed rules and expanded windows, keyed
+    # by experience version. Hit rates are reported by the admin cache stats.
+    recurrence_cache_size: int = int(os.getenv("RECURRENCE_CACHE_SIZE", "10000"))
+    recurrence_window_cache_size: int = int(os.getenv("RECURRENCE_WINDOW_CACHE_SIZE", "20000"))
+
+    # Mongo commands a single request may send before it is logged as over budget.
+    mongo_round_trip_budget: int = int(os.getenv("MONGO_ROUND_TRIP_BUDGET", "8"))
+
+    # Public experience responses: lifetime in Redis and of each worker's local copy.
+    # Writes purge affected entries by tag, so these only bound memory use.
+    experience_response_cache_ttl_seconds: int = int(os.getenv("EXPERIENCE_RESPONSE_CACHE_TTL_SECONDS", "300"))
+    experience_response_cache_local_ttl_seconds: int = int(os.getenv("EXPERIENCE_RESPONSE_CACHE_LOCAL_TTL_SECONDS", "30"))
+
     # AWS S3 configuration
     gcp_access_key_id: str = os.getenv("GCP_ACCESS_KEY_ID", "")
     gcp_secret_access_key: str = os.getenv("GCP_SECRET_ACCESS_KEY", "")
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 import os
 
 from app.core.config import settings
@@ -9,12 +9,14 @@ from app.models import *
 from app.lookups import LOOKUP_DOCUMENTS
 from app.migrations.runner import MigrationRunner
 from app.migrations.registry import MIGRATIONS
+from app.repositories.unit_of_work import round_trip_listener
 
 logger = logging.getLogger(__name__)
 
 
 async def init_db():
-    client = AsyncIOMotorClient(settings.mongo_uri)
+    # Beanie 2 drives pymongo's async client; its command events are counted per request
+    client = AsyncMongoClient(settings.mongo_uri, event_listeners=[round_trip_listener])
     
     # Run migrations before initializing Beanie
     # logger.info("Running database migrations...")
@@ -25,7 +27,7 @@ async def init_db():
 
     # Add all new models for Beanie initialization
     from app.models import (
-        Experience,
+        Experience, ExperienceStatusChange, ExperienceOccurrence,
         ExperienceInstance, Booking,
         OperatorPayoutProfile,
         SavedPaymentMethod, Payment,
@@ -35,7 +37,7 @@ async def init_db():
     )
 
     base_documents = [Operator, Team, TeamMember, User, Explorer, OperatorPayoutProfile,
-        Experience, ExperienceInstance, Booking, SavedPaymentMethod, Payment,
+        Experience, ExperienceStatusChange, ExperienceOccurrence, ExperienceInstance, Booking, SavedPaymentMethod, Payment,
         Settlement, PayoutBatch, ExperienceReview, ExplorerReview,
         Notification, OperatorNotification, ExplorerNotification, AdminNotification
     ] #OperatorPayoutProfile
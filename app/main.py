@@ -12,8 +12,14 @@ from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 
 from app.core.config import settings
-from app.api.routers import admin, auth, activity, team, team_member, operator, lookups, explorer, experience
+from app.api.routers import admin, auth, activity, team, team_member, operator, lookups, explorer, experience, experience_instance
 from app.util.error_handling import DomainError
+from app.repositories.unit_of_work import stream_in, unit_of_work
+from app.util.cache import invalidation_bus
+from app.util.functions.auth import provider_router
+from app.util.functions.jwks import jwks_store
+from app.util.functions.token_cache import token_cache
+from app.util.response_cache import experience_response_cache
 
 # ensure DB init runs
 from app.core import db_init  # noqa: F401
@@ -35,8 +41,17 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("FastAPICache initialization failed: %s", exc)
     logger.info(f"Redis client connected to {settings.redis_url}")
+    # Cross-worker invalidation of in-process caches, and the shared token cache tier
+    await invalidation_bus.start(app.state.redis)
+    token_cache.attach_redis(app.state.redis)
+    experience_response_cache.attach_redis(app.state.redis)
+    # Prefetch JWKS signing keys and keep them refreshed in the background
+    await jwks_store.start(provider["jwks_url"] for provider in settings.zitadel_providers.values())
+    provider_router.rebuild()
     yield
     # Shutdown: Close connections
+    await jwks_store.stop()
+    await invalidation_bus.stop()
     await app.state.redis.close()
     logger.info("Redis client closed")
 
@@ -56,6 +71,37 @@ async def domain_error_handler(request: Request, exc: DomainError):
     return JSONResponse(status_code=exc.status_code, content=payload)
 
 
+def _check_round_trip_budget(request: Request, uow) -> None:
+    if uow.round_trips > settings.mongo_round_trip_budget:
+        logger.warning(
+            "%s %s used %d Mongo round trips (budget %d): %s",
+            request.method, request.url.path, uow.round_trips, settings.mongo_round_trip_budget, dict(uow.commands),
+        )
+
+
+async def _body_in_scope(request: Request, uow, body):
+    try:
+        async for chunk in stream_in(uow, body):
+            yield chunk
+    finally:
+        _check_round_trip_budget(request, uow)
+
+
+@app.middleware("http")
+async def mongo_unit_of_work(request: Request, call_next):
+    """Scope the repositories' identity map to the request and report its Mongo round trips.
+
+    The body is sent inside the same scope, so streamed exports are counted;
+    headers go out first, so X-Mongo-Round-Trips only covers what ran before
+    the response started and the budget is checked once the body is complete.
+    """
+    with unit_of_work() as uow:
+        response = await call_next(request)
+    response.headers["X-Mongo-Round-Trips"] = str(uow.round_trips)
+    response.body_iterator = _body_in_scope(request, uow, response.body_iterator)
+    return response
+
+
 # Include routers
 app.include_router(admin.router, prefix='/admin', tags=['admin'])
 app.include_router(auth.router, prefix='/auth', tags=['auth'])
@@ -66,6 +112,7 @@ app.include_router(operator.router, prefix='/operators', tags=['operators'])
 app.include_router(lookups.router, prefix='/lookups', tags=['lookups'])
 app.include_router(explorer.router, prefix='/explorers', tags=['explorers'])
 app.include_router(experience.router, prefix='/experiences', tags=['experiences'])
+app.include_router(experience_instance.router, prefix='/experience-instances', tags=['experience_instances'])
 
 @app.get('/health')
 async def health():
@@ -8,10 +8,30 @@ from app.migrations import BaseMigration
 from app.migrations.versions.m001_initial import CreateCollectionsAndIndexes
 from app.migrations.versions.m002_reference_collections import CreateReferenceCollections
 from app.migrations.versions.m003_create_explorer_collection import CreateExplorerCollection
+from app.migrations.versions.m004_experience_listing_indexes import CreateExperienceListingIndexes
+from app.migrations.versions.m005_experience_geo_indexes import CreateExperienceGeoIndexes
+from app.migrations.versions.m006_experience_search_indexes import CreateExperienceSearchIndexes
+from app.migrations.versions.m007_experience_status_history import CreateExperienceStatusHistory
+from app.migrations.versions.m008_experience_moderation_index import CreateExperienceModerationIndex
+from app.migrations.versions.m009_linked_listing_indexes import CreateLinkedListingIndexes
+from app.migrations.versions.m010_experience_occurrence_indexes import CreateExperienceOccurrenceIndexes
+from app.migrations.versions.m011_instance_listing_indexes import CreateInstanceListingIndexes
+from app.migrations.versions.m012_search_prefixes_short_description import RebuildSearchPrefixesWithDescription
+from app.migrations.versions.m013_drop_occurrence_date_index import DropExperienceOccurrenceDateIndex
 
 # Add new migrations to this list in order
 MIGRATIONS: List[BaseMigration] = [
     CreateCollectionsAndIndexes(),
     CreateReferenceCollections(),
     CreateExplorerCollection(),
+    CreateExperienceListingIndexes(),
+    CreateExperienceGeoIndexes(),
+    CreateExperienceSearchIndexes(),
+    CreateExperienceStatusHistory(),
+    CreateExperienceModerationIndex(),
+    CreateLinkedListingIndexes(),
+    CreateExperienceOccurrenceIndexes(),
+    CreateInstanceListingIndexes(),
+    RebuildSearchPrefixesWithDescription(),
+    DropExperienceOccurrenceDateIndex(),
 ]
@@ -0,0 +1,43 @@
+"""Create compound indexes backing keyset pagination of experience listings."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+# Each listing sort is (field, _id) in one direction; the status and operator
+# prefixed variants serve the filtered public and operator listings.
+_INDEXES = [
+    ("experiences_created_at_id", [("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)]),
+    ("experiences_price_id", [("price_per_person", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)]),
+    (
+        "experiences_status_created_at_id",
+        [("status", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    ),
+    (
+        "experiences_status_price_id",
+        [("status", pymongo.ASCENDING), ("price_per_person", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)],
+    ),
+    (
+        "experiences_operator_created_at_id",
+        [("operator_id", pymongo.ASCENDING), ("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    ),
+]
+
+
+class CreateExperienceListingIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "004_experience_listing_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+        for index_name, keys in _INDEXES:
+            await experiences.create_index(keys, name=index_name)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+        for index_name, _ in _INDEXES:
+            await experiences.drop_index(index_name)
@@ -0,0 +1,31 @@
+"""Create 2dsphere indexes for geo search over experiences."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+_INDEXES = [
+    ("experiences_location_2dsphere", [("location", pymongo.GEOSPHERE)]),
+    ("experiences_meeting_point_2dsphere", [("meeting_point", pymongo.GEOSPHERE)]),
+    # Public searches always filter on status
+    ("experiences_status_location_2dsphere", [("status", pymongo.ASCENDING), ("location", pymongo.GEOSPHERE)]),
+]
+
+
+class CreateExperienceGeoIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "005_experience_geo_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+        for index_name, keys in _INDEXES:
+            await experiences.create_index(keys, name=index_name)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+        for index_name, _ in _INDEXES:
+            await experiences.drop_index(index_name)
@@ -0,0 +1,59 @@
+"""Create the experience text index and prefix side index, and backfill search fields."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+from app.util.functions.search import index_terms
+
+_TEXT_INDEX = "experiences_text"
+_PREFIX_INDEX = "experiences_search_prefixes"
+
+
+class CreateExperienceSearchIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "006_experience_search_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+
+        activity_names = {}
+        async for activity in db["activities_lookup"].find({}, {"name": 1}):
+            activity_names[str(activity["_id"])] = activity.get("name")
+
+        batch = []
+        async for doc in experiences.find({}, {"trip_title": 1, "tags": 1, "activity_id": 1}):
+            activity_name = activity_names.get(str(doc.get("activity_id")))
+            terms = index_terms([doc.get("trip_title") or "", *(doc.get("tags") or []), activity_name or ""])
+            batch.append(
+                pymongo.UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": {"search_activity_name": activity_name, "search_prefixes": terms}},
+                )
+            )
+            if len(batch) >= 500:
+                await experiences.bulk_write(batch, ordered=False)
+                batch = []
+        if batch:
+            await experiences.bulk_write(batch, ordered=False)
+
+        await experiences.create_index(
+            [
+                ("trip_title", pymongo.TEXT),
+                ("short_description", pymongo.TEXT),
+                ("tags", pymongo.TEXT),
+                ("search_activity_name", pymongo.TEXT),
+            ],
+            name=_TEXT_INDEX,
+            weights={"trip_title": 10, "tags": 5, "search_activity_name": 5, "short_description": 1},
+        )
+        await experiences.create_index("search_prefixes", name=_PREFIX_INDEX)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        experiences = db["experiences"]
+        await experiences.drop_index(_TEXT_INDEX)
+        await experiences.drop_index(_PREFIX_INDEX)
+        await experiences.update_many({}, {"$unset": {"search_activity_name": "", "search_prefixes": ""}})
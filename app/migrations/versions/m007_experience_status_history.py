@@ -0,0 +1,27 @@
+"""Create the experience status history collection index."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+_INDEX_NAME = "experience_status_history_experience_at"
+
+
+class CreateExperienceStatusHistory(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "007_experience_status_history"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        history = db["experience_status_history"]
+        # History is read per experience, newest first
+        await history.create_index(
+            [("experience_id", pymongo.ASCENDING), ("at", pymongo.DESCENDING)],
+            name=_INDEX_NAME,
+        )
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        await db["experience_status_history"].drop_index(_INDEX_NAME)
@@ -0,0 +1,26 @@
+"""Create the index backing the experience moderation queue."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+_INDEX_NAME = "experiences_status_updated_at_id"
+
+
+class CreateExperienceModerationIndex(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "008_experience_moderation_index"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        # The queue is status = submitted, ordered and paged by (updated_at, _id)
+        await db["experiences"].create_index(
+            [("status", pymongo.ASCENDING), ("updated_at", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)],
+            name=_INDEX_NAME,
+        )
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        await db["experiences"].drop_index(_INDEX_NAME)
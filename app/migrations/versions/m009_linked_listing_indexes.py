@@ -0,0 +1,43 @@
+"""Create indexes backing the review, settlement and booking listings."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+# (collection, index name, keys); links are stored as DBRefs, so reviews are
+# filtered on the referenced id.
+_INDEXES = [
+    (
+        "experience_reviews",
+        "experience_reviews_experience_visible_created_at",
+        [("experience.$id", pymongo.ASCENDING), ("is_hidden", pymongo.ASCENDING),
+         ("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    ),
+    (
+        "settlements",
+        "settlements_operator_due_date",
+        [("operator_id", pymongo.ASCENDING), ("due_date", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    ),
+    (
+        "bookings",
+        "bookings_explorer_booked_at",
+        [("explorer_id", pymongo.ASCENDING), ("booked_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+    ),
+]
+
+
+class CreateLinkedListingIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "009_linked_listing_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for collection, index_name, keys in _INDEXES:
+            await db[collection].create_index(keys, name=index_name)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for collection, index_name, _ in _INDEXES:
+            await db[collection].drop_index(index_name)
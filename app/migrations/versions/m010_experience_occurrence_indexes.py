@@ -0,0 +1,41 @@
+"""Create indexes on the materialized occurrence calendar."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+# (index name, keys, options); listings scan a date range per experience or operator.
+_INDEXES = [
+    (
+        "experience_occurrences_experience_date",
+        [("experience_id", pymongo.ASCENDING), ("date", pymongo.ASCENDING)],
+        {"unique": True},
+    ),
+    (
+        "experience_occurrences_operator_date",
+        [("operator_id", pymongo.ASCENDING), ("date", pymongo.ASCENDING)],
+        {},
+    ),
+    (
+        "experience_occurrences_date",
+        [("date", pymongo.ASCENDING)],
+        {},
+    ),
+]
+
+
+class CreateExperienceOccurrenceIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "010_experience_occurrence_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for index_name, keys, options in _INDEXES:
+            await db.experience_occurrences.create_index(keys, name=index_name, **options)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for index_name, _, _ in _INDEXES:
+            await db.experience_occurrences.drop_index(index_name)
@@ -0,0 +1,30 @@
+"""Create the (date, experience_id) indexes the merged instance listing streams in."""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+
+_KEYS = [("date", pymongo.ASCENDING), ("experience_id", pymongo.ASCENDING)]
+
+# (collection, index name)
+_INDEXES = [
+    ("experience_instances", "experience_instances_date_experience"),
+    ("experience_occurrences", "experience_occurrences_date_experience"),
+]
+
+
+class CreateInstanceListingIndexes(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "011_instance_listing_indexes"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for collection, index_name in _INDEXES:
+            await db[collection].create_index(_KEYS, name=index_name)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        for collection, index_name in _INDEXES:
+            await db[collection].drop_index(index_name)
@@ -0,0 +1,39 @@
+"""Rebuild experience search prefixes so they cover the short description.
+
+The text index from m006 already includes ``short_description``; adding it to
+the prefix terms makes search-as-you-type match the same experiences.
+"""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+
+from app.migrations import BaseMigration
+from app.util.functions.search import index_terms
+
+
+async def _rebuild(db, with_description: bool) -> None:
+    experiences = db["experiences"]
+    batch = []
+    projection = {"trip_title": 1, "short_description": 1, "tags": 1, "search_activity_name": 1}
+    async for doc in experiences.find({}, projection):
+        texts = [doc.get("trip_title") or "", *(doc.get("tags") or []), doc.get("search_activity_name") or ""]
+        if with_description:
+            texts.append(doc.get("short_description") or "")
+        batch.append(pymongo.UpdateOne({"_id": doc["_id"]}, {"$set": {"search_prefixes": index_terms(texts)}}))
+        if len(batch) >= 500:
+            await experiences.bulk_write(batch, ordered=False)
+            batch = []
+    if batch:
+        await experiences.bulk_write(batch, ordered=False)
+
+
+class RebuildSearchPrefixesWithDescription(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "012_search_prefixes_short_description"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        await _rebuild(client.get_default_database(), with_description=True)
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        await _rebuild(client.get_default_database(), with_description=False)
@@ -0,0 +1,31 @@
+"""Drop the single-field occurrence ``date`` index created by m010.
+
+m011's ``(date, experience_id)`` index has ``date`` as its prefix and serves
+the same queries, so the single-field index only added write cost.
+"""
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import pymongo
+from pymongo.errors import OperationFailure
+
+from app.migrations import BaseMigration
+
+_INDEX = "experience_occurrences_date"
+
+
+class DropExperienceOccurrenceDateIndex(BaseMigration):
+    @property
+    def name(self) -> str:
+        return "013_drop_occurrence_date_index"
+
+    async def up(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        try:
+            await db["experience_occurrences"].drop_index(_INDEX)
+        except OperationFailure:
+            # Already gone
+            pass
+
+    async def down(self, client: AsyncIOMotorClient) -> None:
+        db = client.get_default_database()
+        await db["experience_occurrences"].create_index([("date", pymongo.ASCENDING)], name=_INDEX)
@@ -23,6 +23,8 @@ from app.models.contact_channel_lookup import ContactChannelLookup
 
 # Newly added models
 from app.models.experience import Experience, TripStep, GeoJsonPoint, PickupInfo
+from app.models.experience_status_change import ExperienceStatusChange
+from app.models.experience_occurrence import ExperienceOccurrence
 from app.models.experience_instance import ExperienceInstance, ExperienceInstanceStatus
 from app.models.booking import Booking, BookingStatus
 from app.models.operator_payout_profile import OperatorPayoutProfile, PayoutType, PayoutStatus
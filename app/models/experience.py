@@ -27,6 +27,17 @@ class ExperienceStatus(str, Enum):
     REJECTED = "rejected" #by admin
     ARCHIVED = "archived" #by operator
 
+# Allowed source statuses per target status. Transitions are applied atomically by
+# matching the current status against these sources.
+EXPERIENCE_STATUS_SOURCES = {
+    ExperienceStatus.SUBMITTED: {ExperienceStatus.DRAFT, ExperienceStatus.REJECTED},
+    ExperienceStatus.PUBLISHED: {ExperienceStatus.SUBMITTED},
+    ExperienceStatus.REJECTED: {ExperienceStatus.SUBMITTED},
+    ExperienceStatus.ARCHIVED: {
+        ExperienceStatus.DRAFT, ExperienceStatus.SUBMITTED, ExperienceStatus.PUBLISHED, ExperienceStatus.REJECTED,
+    },
+}
+
 class DifficultyLevel(str, Enum):
     BEGINNER = "beginner"
     INTERMEDIATE = "intermediate"
@@ -80,6 +91,12 @@ class Experience(Document):
     rejection_reason: Optional[str] = None
     rejected_by: Optional[str] = None
     complete: bool = False
+    # Id of the bulk moderation batch that last set `status`, to read its outcome back
+    status_batch_id: Optional[str] = None
+
+    # Search side fields, maintained by ExperienceRepository on writes
+    search_activity_name: Optional[str] = None
+    search_prefixes: List[str] = []
     
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
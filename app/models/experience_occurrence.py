@@ -0,0 +1,17 @@
+from . import *
+from app.models.experience import ExperienceStatus, GeoJsonPoint
+
+class ExperienceOccurrence(Document):
+    # One upcoming occurrence of a recurring experience, materialized by the
+    # occurrence calendar task. Listing fields are copied from the experience.
+    experience_id: str
+    operator_id: str
+    date: datetime  # Occurrence start, UTC
+    experience_status: ExperienceStatus
+    trip_title: Optional[str] = None
+    available_count: Optional[int] = None
+    location: Optional[GeoJsonPoint] = None
+    image: Optional[str] = None
+
+    class Settings:
+        name = "experience_occurrences"
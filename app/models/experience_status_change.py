@@ -0,0 +1,14 @@
+from . import *
+from app.models.experience import ExperienceStatus
+
+class ExperienceStatusChange(Document):
+    # One row per applied status transition, written by ExperienceRepository.transition
+    experience_id: Indexed(str)
+    from_status: ExperienceStatus
+    to_status: ExperienceStatus
+    actor_id: Optional[str] = None  # Operator or admin user who made the change
+    reason: Optional[str] = None
+    at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "experience_status_history"
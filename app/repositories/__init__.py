@@ -5,45 +5,34 @@ from .user_repository import UserRepository
 from .operator_repository import OperatorRepository
 
 from typing import Optional
-from fastapi_cache.decorator import cache
-from app.models.operator import Operator
-from app.models.user import User
-from app.models.explorer import Explorer
+from app.repositories.auth_id_cache import operator_id_cache, user_id_cache, explorer_id_cache
 
 
-@cache(expire=300, namespace="auth:operator")
 async def get_operator_id(auth_id: str) -> Optional[str]:
-	op = await Operator.find_one({"authenticator_id": auth_id})
-	return str(op.id) if op else None
+	return await operator_id_cache.get(auth_id)
 
 
 async def get_operator_id_from_auth_id(auth_id: str) -> Optional[str]:
-	"""Resolve operator.id (string) from `authenticator_id` using fastapi-cache2.
+	"""Resolve operator.id (string) from `authenticator_id`.
 
-	Note: TTL is controlled by the decorator (`expire=300`); `cache_ttl` parameter is accepted for
-	API compatibility but currently ignored. FastAPI app must initialize FastAPICache (Redis backend)
-	at startup for caching to work.
+	Served from the per-worker LRU when possible, then Redis, then Mongo.
 	"""
 	return await get_operator_id(auth_id)
 
 
-@cache(expire=300, namespace="auth:user")
 async def get_user_id(auth_id: str) -> Optional[str]:
-	u = await User.find_one({"authenticator_id": auth_id})
-	return str(u.id) if u else None
+	return await user_id_cache.get(auth_id)
 
 
 async def get_user_id_from_auth_id(auth_id: str) -> Optional[str]:
-	"""Resolve user.id (string) from `authenticator_id` using fastapi-cache2."""
+	"""Resolve user.id (string) from `authenticator_id` through the two-tier cache."""
 	return await get_user_id(auth_id)
 
 
-@cache(expire=300, namespace="auth:explorer")
 async def get_explorer_id(auth_id: str) -> Optional[str]:
-	e = await Explorer.find_one({"authenticator_id": auth_id})
-	return str(e.id) if e else None
+	return await explorer_id_cache.get(auth_id)
 
 
 async def get_explorer_id_from_auth_id(auth_id: str) -> Optional[str]:
-	"""Resolve explorer.id (string) from `authenticator_id` using fastapi-cache2."""
+	"""Resolve explorer.id (string) from `authenticator_id` through the two-tier cache."""
 	return await get_explorer_id(auth_id)
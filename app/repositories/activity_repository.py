@@ -1,14 +1,13 @@
 from typing import List, Optional
 
-from beanie import PydanticObjectId
-
 from app.models.activity_lookup import Activity
 from app.repositories.base import BaseRepository
+from app.repositories.unit_of_work import forget, load
 
 
 class ActivityRepository(BaseRepository[Activity]):
     async def get(self, id: str) -> Optional[Activity]:
-        return await Activity.get(PydanticObjectId(id))
+        return await load(Activity, id)
 
     async def list(self) -> List[Activity]:
         return await Activity.find_all().to_list()
@@ -32,3 +31,4 @@ class ActivityRepository(BaseRepository[Activity]):
         activity = await self.get(id)
         if activity:
             await activity.delete()
+            forget(Activity, id)
@@ -0,0 +1,185 @@
+"""Two-tier cache for ``authenticator_id`` -> internal id resolution.
+
+Tier one is a small per-worker LRU, tier two is the fastapi-cache2 Redis
+backend. Unknown auth ids are cached negatively (for a shorter time) so a
+client retrying with an unregistered token does not hit Mongo on every call.
+Repositories call ``invalidate`` on writes; the invalidation is applied to
+Redis and broadcast to every worker's LRU. Each invalidation bumps a
+generation counter, and a load that was already running when it happened
+does not store its (possibly stale, e.g. negative) result.
+
+Concurrent misses for one auth id are coalesced into a single load, and hot
+entries are refreshed from Mongo shortly before their Redis entry expires
+(XFetch) so they do not all miss at once.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+from fastapi_cache import FastAPICache
+
+from app.models.explorer import Explorer
+from app.models.operator import Operator
+from app.models.user import User
+from app.util.cache import LRUCache, MISSING, invalidation_bus
+from app.util.singleflight import SingleFlight, should_refresh_early
+
+logger = logging.getLogger(__name__)
+
+# Stored in place of an id for auth ids that do not resolve to a document.
+_NEGATIVE = "-"
+
+
+class AuthIdCache:
+    def __init__(
+        self,
+        namespace: str,
+        loader: Callable[[str], Awaitable[Optional[str]]],
+        expire: int = 300,
+        local_ttl: float = 60.0,
+        negative_ttl: int = 30,
+        maxsize: int = 10000,
+    ) -> None:
+        self.namespace = namespace
+        self.loader = loader
+        self.expire = expire
+        self.negative_ttl = negative_ttl
+        self._local: LRUCache[tuple] = LRUCache(maxsize=maxsize, ttl=local_ttl, name=namespace)
+        self._flight = SingleFlight(namespace)
+        self._generation = 0
+        invalidation_bus.register(namespace, self._drop)
+
+    def _drop(self, auth_ids) -> None:
+        # Runs for local and remote invalidations alike.
+        self._generation += 1
+        for auth_id in auth_ids:
+            self._local.delete(auth_id)
+
+    @staticmethod
+    def _backend():
+        try:
+            return FastAPICache.get_backend()
+        except AssertionError:
+            # FastAPICache not initialized (e.g. scripts, tests): local tier only.
+            return None
+
+    def _redis_key(self, auth_id: str) -> str:
+        return f"{FastAPICache.get_prefix()}:{self.namespace}:{auth_id}"
+
+    async def _read_redis(self, auth_id: str):
+        """Return ``(value, ttl, delta)`` from Redis, or MISSING."""
+        backend = self._backend()
+        if backend is None:
+            return MISSING
+        try:
+            ttl, raw = await backend.get_with_ttl(self._redis_key(auth_id))
+        except Exception as exc:
+            logger.warning("Redis lookup failed for %s: %s", self.namespace, exc)
+            return MISSING
+        if raw is None:
+            return MISSING
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        # Values are stored as "<id>|<load seconds>" so other workers can
+        # schedule the early refresh too.
+        raw, _, delta = raw.partition("|")
+        try:
+            delta = float(delta) if delta else 0.0
+        except ValueError:
+            delta = 0.0
+        return (None if raw == _NEGATIVE else raw), ttl, delta
+
+    async def _write_redis(self, auth_id: str, value: Optional[str], delta: float) -> None:
+        backend = self._backend()
+        if backend is None:
+            return
+        try:
+            if value is None:
+                await backend.set(self._redis_key(auth_id), _NEGATIVE, self.negative_ttl)
+            else:
+                await backend.set(self._redis_key(auth_id), f"{value}|{delta:.6f}", self.expire)
+        except Exception as exc:
+            logger.warning("Redis write failed for %s: %s", self.namespace, exc)
+
+    def _store_local(self, auth_id: str, value: Optional[str], ttl: float, delta: float) -> None:
+        # Local entries remember when the entry whose expiry sends us to Mongo
+        # runs out, and how long the load took, which drives probabilistic
+        # early refresh. With Redis that is the shared entry, and the local
+        # copy never outlives it; without Redis it is the local entry itself.
+        local_ttl = self._local.ttl if value is not None else min(self.negative_ttl, self._local.ttl or self.negative_ttl)
+        if self._backend() is None:
+            ttl = min(ttl, local_ttl) if local_ttl else ttl
+        elif local_ttl is None or local_ttl > ttl:
+            local_ttl = ttl
+        self._local.set(auth_id, (value, time.time() + ttl, delta), ttl=local_ttl)
+
+    async def _load(self, auth_id: str) -> Optional[str]:
+        generation = self._generation
+        started = time.perf_counter()
+        value = await self.loader(auth_id)
+        delta = time.perf_counter() - started
+        if generation != self._generation:
+            # Invalidated while loading: the result may predate the write
+            # (e.g. a negative entry for an account created meanwhile).
+            return value
+        await self._write_redis(auth_id, value, delta)
+        self._store_local(auth_id, value, self.expire if value is not None else self.negative_ttl, delta)
+        return value
+
+    async def _fill(self, auth_id: str) -> Optional[str]:
+        generation = self._generation
+        cached = await self._read_redis(auth_id)
+        if cached is MISSING:
+            return await self._load(auth_id)
+        value, ttl, delta = cached
+        if generation == self._generation:
+            self._store_local(auth_id, value, ttl if ttl and ttl > 0 else self.expire, delta)
+        return value
+
+    async def get(self, auth_id: str) -> Optional[str]:
+        entry = self._local.get(auth_id)
+        if entry is not MISSING:
+            value, expires_at, delta = entry
+            if value is not None and should_refresh_early(expires_at, delta):
+                self._flight.spawn(("refresh", auth_id), lambda: self._load(auth_id))
+            return value
+
+        # Concurrent misses for the same auth id share one Redis/Mongo round trip.
+        return await self._flight.do(auth_id, lambda: self._fill(auth_id))
+
+    async def invalidate(self, *auth_ids: Optional[str]) -> None:
+        auth_ids = tuple(auth_id for auth_id in auth_ids if auth_id)
+        if not auth_ids:
+            return
+        self._generation += 1
+        backend = self._backend()
+        if backend is not None:
+            for auth_id in auth_ids:
+                try:
+                    await backend.clear(key=self._redis_key(auth_id))
+                except Exception as exc:
+                    logger.warning("Redis invalidation failed for %s: %s", self.namespace, exc)
+        await invalidation_bus.publish(self.namespace, auth_ids)
+
+
+async def _load_operator_id(auth_id: str) -> Optional[str]:
+    op = await Operator.find_one({"authenticator_id": auth_id})
+    return str(op.id) if op else None
+
+
+async def _load_user_id(auth_id: str) -> Optional[str]:
+    u = await User.find_one({"authenticator_id": auth_id})
+    return str(u.id) if u else None
+
+
+async def _load_explorer_id(auth_id: str) -> Optional[str]:
+    e = await Explorer.find_one({"authenticator_id": auth_id})
+    return str(e.id) if e else None
+
+
+operator_id_cache = AuthIdCache("auth:operator", _load_operator_id)
+user_id_cache = AuthIdCache("auth:user", _load_user_id)
+explorer_id_cache = AuthIdCache("auth:explorer", _load_explorer_id)
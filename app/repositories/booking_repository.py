@@ -0,0 +1,54 @@
+import asyncio
+
+import pymongo
+
+from app.models.booking import Booking
+from app.models.experience import Experience
+from app.models.experience_instance import ExperienceInstance
+from app.repositories.batch_loader import loader
+from app.repositories.listing import fetch_page
+from app.schemas.booking import BookingListingQuery, BookingListingResult
+
+
+class BookingRepository:
+    async def list_for_explorer(self, explorer_id: str, query: BookingListingQuery) -> BookingListingResult:
+        """An explorer's bookings, newest first, with the booked instance and experience resolved in batches."""
+        q: dict = {"explorer_id": explorer_id}
+        if query.status is not None:
+            q["status"] = query.status.value
+        result = await fetch_page(
+            Booking.get_pymongo_collection(),
+            q,
+            [("booked_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            skip=(query.page - 1) * query.page_size,
+            limit=query.page_size,
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+        )
+        items = await asyncio.gather(*(self._to_out(doc) for doc in result.items))
+        return BookingListingResult.model_construct(
+            items=items,
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=query.page,
+            page_size=query.page_size,
+        )
+
+    async def _to_out(self, doc: dict) -> dict:
+        # Two dependent hops, each one $in query for the page: bookings -> instances -> experiences
+        instance = await loader(ExperienceInstance).load(doc.get("experience_instance_id"))
+        experience = await loader(Experience).load(instance.experience_id) if instance else None
+        return {
+            "id": str(doc["_id"]),
+            "status": doc.get("status"),
+            "number_of_people": doc.get("number_of_people"),
+            "total_price": doc.get("total_price"),
+            "currency": doc.get("currency", "USD"),
+            "booked_at": doc.get("booked_at"),
+            "experience_instance_id": doc.get("experience_instance_id"),
+            "trip_date": instance.date if instance else None,
+            "instance_status": instance.status if instance else None,
+            "experience_id": instance.experience_id if instance else None,
+            "trip_title": experience.trip_title if experience else None,
+            "image": experience.images[0] if experience and experience.images else None,
+        }
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
-from beanie import PydanticObjectId
+import pymongo
 
 from app.models.experience import Experience
 from app.repositories.base import BaseRepository
+from app.repositories.listing import after_filter
+from app.repositories.unit_of_work import load
 from app.models.experience_instance import ExperienceInstance, ExperienceInstanceStatus
 
 from app.schemas.experience_instance import (
@@ -16,6 +18,19 @@ from datetime import datetime, date
 
 class ExperienceInstanceRepository(BaseRepository[ExperienceInstance]):
     collection_model = "ExperienceInstance"  # Replace with actual model
+
+    # fields required by the compact schema
+    _compact_projection = {
+        "_id": 0,
+        "experience_id": 1,
+        "trip_title": 1,
+        "date": 1,
+        "status": 1,
+        "booked_count": 1,
+        "available_count": 1,
+        "location": 1,
+        "images": 1,
+    }
     
     def _build_filters(self, query: ExperienceInstanceListingQuery) -> dict:
         q: dict = {}
@@ -39,33 +54,56 @@ class ExperienceInstanceRepository(BaseRepository[ExperienceInstance]):
             date_q["$lte"] = date_to
         q["date"] = date_q
 
-    async def _query_items(self, q: dict) -> list[ExperienceInstance]:
-        # use projection to return only fields required by compact schema
-        projection = {
-            "trip_title": 1,
-            "date": 1,
-            "status": 1,
-            "booked_count": 1,
-            "available_count": 1,
-            "location": 1,
-            "images": 1,
+    async def _query_items(self, q: dict) -> list[dict]:
+        # use projection to return only fields required by compact schema, and map the raw
+        # documents straight to that shape instead of hydrating ExperienceInstance documents
+        docs = await (
+            ExperienceInstance.get_pymongo_collection()
+            .find(q, self._compact_projection)
+            .sort("date", pymongo.ASCENDING)
+            .to_list(length=None)
+        )
+        return [self._to_compact(doc) for doc in docs]
+
+    @staticmethod
+    def _to_compact(doc: dict) -> dict:
+        return {
+            "experience_id": doc.get("experience_id"),
+            "trip_title": doc.get("trip_title"),
+            "date": doc.get("date"),
+            "status": doc.get("status"),
+            "booked_count": doc.get("booked_count", 0),
+            "available_count": doc.get("available_count"),
+            "location": doc.get("location"),
+            "images": doc.get("images") or [],
         }
 
-        return await (
-            ExperienceInstance.find(q)
-            .project(projection)
-            .sort("date")
-            .to_list()
+    async def stream(
+        self,
+        query: ExperienceInstanceListingQuery,
+        after: Optional[Tuple[datetime, str]] = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[dict]:
+        """Instances of every status in ``(date, experience_id)`` order, read lazily from one cursor."""
+        q = self._build_filters(query)
+        q.pop("status", None)
+        if after is not None:
+            q = after_filter(q, ("date", "experience_id"), after)
+        cursor = (
+            ExperienceInstance.get_pymongo_collection()
+            .find(q, self._compact_projection)
+            .sort([("date", pymongo.ASCENDING), ("experience_id", pymongo.ASCENDING)])
+            .batch_size(batch_size)
         )
+        try:
+            async for doc in cursor:
+                yield self._to_compact(doc)
+        finally:
+            await cursor.close()
 
     async def get(self, id: str) -> Optional[ExperienceInstance]:
         """Retrieve an ExperienceInstance by id. Raises HTTPException(404) if not found."""
-        try:
-            oid = PydanticObjectId(id)
-        except Exception:
-            return None
-
-        instance = await ExperienceInstance.get(oid)
+        instance = await load(ExperienceInstance, id)
         if not instance:
             return None
         
@@ -82,7 +120,7 @@ class ExperienceInstanceRepository(BaseRepository[ExperienceInstance]):
 
     # Note: compact payload mapping is done inline in `list` to avoid a tiny helper method.
 
-    async def list(self, query: ExperienceInstanceListingQuery) -> list[ExperienceInstanceCompactOutSchema]:
+    async def list(self, query: ExperienceInstanceListingQuery) -> list[dict]:
         q = self._build_filters(query)
         items = await self._query_items(q)
         return items
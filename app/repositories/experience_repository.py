@@ -1,21 +1,126 @@
-from typing import List, Optional
+import math
+from typing import Dict, List, Optional, Tuple
 
 from beanie import PydanticObjectId
+from bson import ObjectId, json_util
 
-from app.models.experience import Experience, ExperienceStatus
+from app.core.config import settings
+from app.models.activity_lookup import Activity
+from app.models.experience import EXPERIENCE_STATUS_SOURCES, Experience, ExperienceStatus
+from app.models.experience_status_change import ExperienceStatusChange
 from app.repositories.base import BaseRepository
-from app.schemas.experience import ExperienceListingQuery, ExperienceListOutSchema
+from app.repositories.listing import Page, aggregate, aggregate_page, fetch_page
+from app.repositories.unit_of_work import forget, load, remember
+from app.schemas.experience import ExperienceClusterQuery, ExperienceFacetsSchema, ExperienceListingQuery, ExperienceListOutSchema, ExperienceSortField
+from app.util.cache import LRUCache, MISSING
+from app.util.error_handling import BadRequestError
+from app.util.functions.cursor import decode_cursor, encode_cursor
+from app.util.functions.search import index_terms, query_terms
+from app.util.response_cache import LISTING_TAG, experience_response_cache, experience_tag, operator_tag
 from beanie import PydanticObjectId
 from datetime import datetime
 import pymongo
 from fastapi import HTTPException
 import pymongo
 from fastapi import HTTPException
+from beanie.odm.utils.encoder import Encoder
+from pymongo import ReturnDocument, UpdateOne
+
+# Mean equatorial radius used by MongoDB for $centerSphere
+_EARTH_RADIUS_M = 6378100.0
+# Widest longitude span of a single query polygon
+_MAX_POLYGON_SPAN_DEG = 90.0
+
+# Fields feeding the search side index; updating any of them re-indexes the experience.
+# Same fields as the $text index, so typeahead and full-text agree on matches.
+_SEARCHED_FIELDS = {"trip_title", "short_description", "tags", "activity_id"}
+
+# Fields that decide which experiences a listing holds, their order, totals or
+# facet counts. Updating only other fields purges just the cached responses
+# that contain the experience itself.
+_LISTING_FIELDS = _SEARCHED_FIELDS | {
+    "operator_id", "status", "price_per_person", "start_date", "end_date", "location", "meeting_point",
+    "created_at", "difficulty", "languages", "cancellation_policy", "short_description",
+}
+
+_encoder = Encoder()
+
+# Cursor tag of the moderation queue order, (updated_at, _id) ascending
+_MODERATION_SORT = "moderation"
+
+
+def _non_empty(path: str, empty):
+    return {"$gt": [{"$size" if isinstance(empty, list) else "$strLenCP": {"$ifNull": [path, empty]}}, 0]}
+
+
+def _present(path: str) -> dict:
+    return {"$ne": [{"$ifNull": [path, None]}, None]}
+
+
+# Completeness rules of ExperienceService._is_complete_experience, evaluated by
+# Mongo against the merged document inside an update pipeline.
+_COMPLETE_EXPR = {
+    "$and": [
+        _non_empty("$trip_title", ""),
+        {"$or": [_non_empty("$short_description", ""), _non_empty("$images", [])]},
+        _present("$price_per_person"),
+        _present("$location"),
+        _non_empty("$languages", []),
+    ]
+}
+
+# Browse-screen facets, computed as extra $facet branches of the listing aggregation.
+# Price buckets are [low, next low); the last one is open-ended.
+_PRICE_BUCKETS = [0, 25, 50, 100, 250, 500]
+_PRICE_OVERFLOW = "overflow"
+
+
+def _count_by(path: str, unwind: bool = False) -> list:
+    stages = [{"$unwind": path}] if unwind else []
+    return stages + [{"$group": {"_id": path, "count": {"$sum": 1}}}, {"$sort": {"count": -1, "_id": 1}}, {"$limit": 50}]
+
+
+_FACETS = {
+    "activity": _count_by("$activity_id"),
+    "difficulty": _count_by("$difficulty"),
+    "language": _count_by("$languages", unwind=True),
+    "cancellation_policy": _count_by("$cancellation_policy"),
+    "price": [
+        {"$match": {"price_per_person": {"$type": "number", "$gte": 0}}},
+        {
+            "$bucket": {
+                "groupBy": "$price_per_person",
+                "boundaries": _PRICE_BUCKETS,
+                "default": _PRICE_OVERFLOW,
+                "output": {"count": {"$sum": 1}},
+            }
+        },
+    ],
+}
+
+# normalized filter -> shaped facet counts
+_facet_cache: LRUCache = LRUCache(
+    maxsize=settings.listing_count_cache_size,
+    ttl=settings.listing_facet_cache_ttl_seconds,
+    name="experience:facets",
+)
+
+# Map clustering grid: cells per tile edge, Web Mercator latitude limit, and
+# the most cells a single viewport may cover.
+_CELLS_PER_TILE = 4
+_MAX_MAP_LAT = 85.0511
+_MAX_CLUSTER_CELLS = 4096
+
+# (filter signature, zoom, x, y) -> cell summary, or None for an empty cell
+_cluster_cells: LRUCache = LRUCache(
+    maxsize=settings.map_cluster_cache_size,
+    ttl=settings.map_cluster_cache_ttl_seconds,
+    name="experience:map-cells",
+)
 
 class ExperienceRepository(BaseRepository[Experience]):
     async def get(self, id:str) -> Optional[Experience]:
-        oid = PydanticObjectId(id)
-        experience = await Experience.get(oid)
+        experience = await load(Experience, id)
         return experience
     
     async def get(self, id: str, operator_id: Optional[str] = None) -> Optional[Experience]:
@@ -24,9 +129,7 @@ class ExperienceRepository(BaseRepository[Experience]):
         If `operator_id` is provided, verify that the experience's `operator_id` matches.
         Raises HTTPException(404) when not found and HTTPException(403) when ownership doesn't match.
         """
-        oid = PydanticObjectId(id)
-
-        experience = await Experience.get(oid)
+        experience = await load(Experience, id)
         if not experience:
             raise HTTPException(status_code=404, detail="Experience not found")
 
@@ -36,40 +139,372 @@ class ExperienceRepository(BaseRepository[Experience]):
 
         return experience
 
+    async def get_updated_at(self, id: str) -> Optional[datetime]:
+        """Return only `updated_at` for an experience, for cheap conditional-GET checks."""
+        if not ObjectId.is_valid(id):
+            return None
+        doc = await Experience.get_pymongo_collection().find_one({"_id": ObjectId(id)}, {"updated_at": 1})
+        return doc.get("updated_at") if doc else None
+
+    # Fields returned by listings, matching ExperienceCompactOutSchema
+    _compact_projection = {
+        "trip_title": 1,
+        "short_description": 1,
+        "images": 1,
+        "price_per_person": 1,
+        "location": 1,
+        "status": 1,
+    }
+
     async def list(self, query: ExperienceListingQuery) -> ExperienceListOutSchema:
-        # Build query and paginate
+        """Return one page of experiences.
+
+        Pages are addressed either by `page` (skip/limit, kept for backward
+        compatibility) or by the opaque `cursor` from the previous page. Cursor
+        pages seek directly to the last seen `(sort field, _id)` pair on a
+        compound index, so every page costs the same as the first one.
+        """
+        if query.sort == ExperienceSortField.DISTANCE:
+            return await self._list_by_distance(query)
+        if query.sort == ExperienceSortField.RELEVANCE:
+            return await self._list_by_relevance(query)
+
         q: dict = self._build_query(query)
         page = query.page
         page_size = query.page_size
+        field, direction = self._sort_spec(query.sort)
+        sort = [(field, direction), ("_id", direction)]
+
+        # The total always describes the whole filtered set, not what is left after the cursor
+        filter = q
+        if query.cursor:
+            filter = self._add_keyset_filter(q, query.cursor, query.sort.value, field, direction)
+            skip = 0
+        else:
+            skip = (page - 1) * page_size
+
+        facets, cached_facets = self._facets_to_fetch(query, q)
+        # Fetch one extra document to know whether a next page exists
+        result = await fetch_page(
+            Experience.get_pymongo_collection(),
+            filter,
+            sort,
+            skip=skip,
+            limit=page_size + 1,
+            projection={**self._compact_projection, field: 1},
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+            count_filter=q,
+            facets=facets,
+        )
+        return self._to_list_out(query, q, result, lambda last: last.get(field), cached_facets)
 
-        # Project compact fields to match ExperienceCompactOutSchema
-        projection = {
-            "trip_title": 1,
-            "short_description": 1,
-            "images": 1,
-            "price_per_person": 1,
-            "location": 1,
-            "status": 1,
-            "recurring_pattern": 1,
+    async def _list_by_distance(self, query: ExperienceListingQuery) -> ExperienceListOutSchema:
+        """Nearest-first listing with the distance to the search point returned per item."""
+        center = self._geo_center(query)
+        if center is None:
+            raise BadRequestError("Sorting by distance requires lat and lng")
+        if query.search and not query.search_as_you_type:
+            raise BadRequestError("Full-text search cannot be sorted by distance; use search_as_you_type")
+
+        q: dict = self._build_query(query)
+        near = {
+            "near": {"type": "Point", "coordinates": center},
+            "key": query.geo_field.value,
+            "distanceField": "distance_m",
+            "maxDistance": query.radius_km * 1000,
+            "spherical": True,
+            "query": q,
         }
+        stages: list = [{"$geoNear": near}]
+        skip = (query.page - 1) * query.page_size
+        if query.cursor:
+            payload = decode_cursor(query.cursor)
+            if payload.get("s") != query.sort.value or "id" not in payload:
+                raise BadRequestError("Cursor does not match the requested sort order")
+            distance, last_id = float(payload.get("v") or 0.0), payload["id"]
+            near["minDistance"] = distance
+            stages.append({"$match": {"$or": [{"distance_m": {"$gt": distance}}, {"_id": {"$gt": last_id}}]}})
+            skip = 0
+        # $geoNear orders by distance only; break ties by id so cursors are stable
+        stages.append({"$sort": {"distance_m": 1, "_id": 1}})
 
-        items = await (
-            Experience.find(q)
-            .project(projection)
-            .skip((page - 1) * page_size)
-            .limit(page_size)
-            .to_list()
+        facets, cached_facets = self._facets_to_fetch(query, q)
+        result = await aggregate_page(
+            Experience.get_pymongo_collection(),
+            stages,
+            skip=skip,
+            limit=query.page_size + 1,
+            projection={**self._compact_projection, "distance_m": 1},
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+            count_filter=q,
+            facets=facets,
+            keyset=bool(query.cursor),
         )
-        total = await Experience.find(q).count()
-        return ExperienceListOutSchema(items=items, total=total, page=page, page_size=page_size)
+        return self._to_list_out(query, q, result, lambda last: last["distance_m"], cached_facets)
+
+    async def _list_by_relevance(self, query: ExperienceListingQuery) -> ExperienceListOutSchema:
+        """Best matches first: text score for full-text search, exact before fuzzy prefixes as you type."""
+        if not query.search:
+            raise BadRequestError("Sorting by relevance requires search")
+        if query.cursor:
+            raise BadRequestError("Relevance-sorted results are paged with page, not cursor")
+
+        q: dict = self._build_query(query)
+        if "$text" in q:
+            score = {"$meta": "textScore"}
+        else:
+            exact = [group[0] for group in query_terms(query.search)]
+            score = {"$size": {"$setIntersection": ["$search_prefixes", exact]}}
+        stages = [{"$match": q}, {"$addFields": {"score": score}}, {"$sort": {"score": -1, "_id": 1}}]
+
+        facets, cached_facets = self._facets_to_fetch(query, q)
+        result = await aggregate_page(
+            Experience.get_pymongo_collection(),
+            stages,
+            skip=(query.page - 1) * query.page_size,
+            limit=query.page_size + 1,
+            projection=self._compact_projection,
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+            count_filter=q,
+            facets=facets,
+        )
+        return self._to_list_out(query, q, result, None, cached_facets)
+
+    @staticmethod
+    def _facets_to_fetch(query: ExperienceListingQuery, q: dict) -> Tuple[Optional[dict], object]:
+        """Facet sub-pipelines to run with the page, and the cached facets (or MISSING) for `q`."""
+        if not query.include_facets:
+            return None, None
+        cached = _facet_cache.get(json_util.dumps(q, sort_keys=True))
+        return (None, cached) if cached is not MISSING else (_FACETS, MISSING)
+
+    @staticmethod
+    def _shape_facets(raw: dict) -> dict:
+        def counts(rows: list) -> list:
+            return [{"value": str(row["_id"]), "count": row["count"]} for row in rows if row["_id"] is not None]
+
+        price = []
+        for row in raw.get("price", []):
+            low = _PRICE_BUCKETS[-1] if row["_id"] == _PRICE_OVERFLOW else row["_id"]
+            index = _PRICE_BUCKETS.index(low)
+            high = _PRICE_BUCKETS[index + 1] if row["_id"] != _PRICE_OVERFLOW else None
+            price.append({"min": low, "max": high, "count": row["count"]})
+        return {
+            "activity": counts(raw.get("activity", [])),
+            "difficulty": counts(raw.get("difficulty", [])),
+            "language": counts(raw.get("language", [])),
+            "cancellation_policy": counts(raw.get("cancellation_policy", [])),
+            "price": price,
+        }
+
+    def _to_list_out(
+        self, query: ExperienceListingQuery, q: dict, result: Page, cursor_value, cached_facets=None
+    ) -> ExperienceListOutSchema:
+        """Build the listing response; `cursor_value` extracts the keyset value, or is None for page-only sorts."""
+        facets = None
+        if query.include_facets:
+            if cached_facets is not MISSING:
+                facets = cached_facets
+            else:
+                facets = self._shape_facets(result.facets or {})
+                _facet_cache.set(json_util.dumps(q, sort_keys=True), facets)
+
+        docs = result.items
+        next_cursor = None
+        if len(docs) > query.page_size:
+            docs = docs[:query.page_size]
+            last = docs[-1]
+            if cursor_value is not None:
+                next_cursor = encode_cursor({"s": query.sort.value, "v": cursor_value(last), "id": last["_id"]})
+
+        # Items are already in response shape; constructing skips a validation pass over every row
+        items = [self._to_compact(doc) for doc in docs]
+        return ExperienceListOutSchema.model_construct(
+            items=items,
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=query.page,
+            page_size=query.page_size,
+            next_cursor=next_cursor,
+            facets=ExperienceFacetsSchema.model_validate(facets) if facets is not None else None,
+        )
+
+    async def clusters(self, query: ExperienceClusterQuery) -> Tuple[float, List[dict]]:
+        """Aggregate the experiences in a viewport into a global lng/lat grid.
+
+        The grid has `_CELLS_PER_TILE` cells per map tile edge at the requested
+        zoom, so a viewport yields a roughly constant number of cells. Cells are
+        cached per filter; only cells missing from the cache are aggregated.
+        Returns the cell size in degrees and the non-empty cells.
+        """
+        min_lng, min_lat, max_lng, max_lat = self._parse_bbox(query.bbox)
+        min_lat, max_lat = max(min_lat, -_MAX_MAP_LAT), min(max_lat, _MAX_MAP_LAT)
+        size = 360.0 / (2 ** query.zoom) / _CELLS_PER_TILE
+        columns = math.ceil(360.0 / size)
+        rows = math.ceil(180.0 / size)
+
+        def column(lng: float) -> int:
+            return min(int((lng + 180.0) // size), columns - 1)
+
+        def row(lat: float) -> int:
+            return min(int((lat + 90.0) // size), rows - 1)
+
+        if min_lng <= max_lng:
+            xs = list(range(column(min_lng), column(max_lng) + 1))
+        else:
+            xs = list(range(column(min_lng), columns)) + list(range(0, column(max_lng) + 1))
+        ys = list(range(row(min_lat), row(max_lat) + 1))
+        if len(xs) * len(ys) > _MAX_CLUSTER_CELLS:
+            raise BadRequestError("Viewport is too large for this zoom level")
+
+        filters: dict = {}
+        if query.status:
+            filters["status"] = query.status
+        if query.activity_ids:
+            filters["activity_id"] = {"$in": query.activity_ids}
+        self._add_price_filter(filters, query.price_min, query.price_max)
+        signature = json_util.dumps(filters, sort_keys=True)
+
+        cells = {}
+        missing = []
+        for x in xs:
+            for y in ys:
+                cached = _cluster_cells.get((signature, query.zoom, x, y))
+                if cached is MISSING:
+                    missing.append((x, y))
+                elif cached is not None:
+                    cells[(x, y)] = cached
+
+        if missing:
+            cells.update(await self._aggregate_cells(filters, signature, query.zoom, size, missing, columns, rows))
+
+        clusters = [
+            {"cell": f"{query.zoom}/{x}/{y}", **cell}
+            for (x, y), cell in sorted(cells.items())
+        ]
+        return size, clusters
+
+    async def _aggregate_cells(
+        self, filters: dict, signature: str, zoom: int, size: float, missing: List[Tuple[int, int]], columns: int, rows: int
+    ) -> dict:
+        # Cover the missing cells with as few rectangles as possible: one per run
+        # of adjacent columns that miss the same rows.
+        by_column: dict = {}
+        for x, y in missing:
+            by_column.setdefault(x, []).append(y)
+        rects: List[list] = []
+        for x in sorted(by_column):
+            y0, y1 = min(by_column[x]), max(by_column[x])
+            if rects and rects[-1][1] == x - 1 and rects[-1][2:] == [y0, y1]:
+                rects[-1][1] = x
+            else:
+                rects.append([x, x, y0, y1])
+
+        polygons: List[list] = []
+        requested = set()
+        for x0, x1, y0, y1 in rects:
+            polygons += self._rect_polygons(
+                x0 * size - 180.0,
+                max(y0 * size - 90.0, -_MAX_MAP_LAT),
+                min((x1 + 1) * size - 180.0, 180.0),
+                min((y1 + 1) * size - 90.0, _MAX_MAP_LAT),
+            )
+            requested.update((x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+
+        pipeline = [
+            {"$match": {**filters, "location": {"$geoWithin": {"$geometry": self._geometry(polygons)}}}},
+            {
+                "$project": {
+                    "lng": {"$arrayElemAt": ["$location.coordinates", 0]},
+                    "lat": {"$arrayElemAt": ["$location.coordinates", 1]},
+                    "price_per_person": 1,
+                    "image": {"$arrayElemAt": ["$images", 0]},
+                }
+            },
+            {
+                "$group": {
+                    "_id": {
+                        # Points on the east/north edge of the grid belong to the last cell
+                        "x": {"$min": [{"$floor": {"$divide": [{"$add": ["$lng", 180.0]}, size]}}, columns - 1]},
+                        "y": {"$min": [{"$floor": {"$divide": [{"$add": ["$lat", 90.0]}, size]}}, rows - 1]},
+                    },
+                    "count": {"$sum": 1},
+                    "lng": {"$avg": "$lng"},
+                    "lat": {"$avg": "$lat"},
+                    "min_price": {"$min": "$price_per_person"},
+                    "image": {"$first": "$image"},
+                }
+            },
+        ]
+        collection = Experience.get_pymongo_collection()
+        groups = await aggregate(collection, pipeline)
+
+        found = {
+            (int(group["_id"]["x"]), int(group["_id"]["y"])): {
+                "count": group["count"],
+                "centroid": {"type": "Point", "coordinates": [group["lng"], group["lat"]]},
+                "min_price": group["min_price"],
+                "image": group.get("image"),
+            }
+            for group in groups
+        }
+
+        # Cache every cell the query covered, including the empty ones.
+        for x, y in requested:
+            _cluster_cells.set((signature, zoom, x, y), found.get((x, y)))
+        return {key: cell for key, cell in found.items() if key in requested}
+
+    @staticmethod
+    def _to_compact(doc: dict) -> dict:
+        """Map a projected listing document to the ExperienceCompactOutSchema shape without validating it."""
+        return {
+            "id": str(doc["_id"]),
+            "trip_title": doc.get("trip_title"),
+            "short_description": doc.get("short_description"),
+            "images": doc.get("images") or [],
+            "price_per_person": doc.get("price_per_person"),
+            "location": doc.get("location"),
+            "status": doc.get("status"),
+            "distance_m": doc.get("distance_m"),
+        }
+
+    @staticmethod
+    def _sort_spec(sort: ExperienceSortField) -> tuple[str, int]:
+        value = sort.value
+        if value.startswith("-"):
+            return value[1:], pymongo.DESCENDING
+        return value, pymongo.ASCENDING
+
+    def _add_keyset_filter(self, q: dict, cursor: str, sort_key: str, field: str, direction: int) -> dict:
+        """Narrow `q` to documents after the cursor; `sort_key` is the order the cursor must have been issued for."""
+        payload = decode_cursor(cursor)
+        if payload.get("s") != sort_key or "id" not in payload:
+            raise BadRequestError("Cursor does not match the requested sort order")
+        value, last_id = payload.get("v"), payload["id"]
+
+        # MongoDB sorts nulls before any value, and range operators never match null,
+        # so missing sort values need their own branch of the predicate.
+        after = "$gt" if direction == pymongo.ASCENDING else "$lt"
+        tie = {field: value, "_id": {after: last_id}}
+        if value is None:
+            keyset = {"$or": [tie, {field: {"$ne": None}}]} if direction == pymongo.ASCENDING else tie
+        elif direction == pymongo.ASCENDING:
+            keyset = {"$or": [{field: {"$gt": value}}, tie]}
+        else:
+            keyset = {"$or": [{field: {"$lt": value}}, tie, {field: None}]}
+
+        return {"$and": [q, keyset]} if q else keyset
 
     def _build_query(self, query: ExperienceListingQuery) -> dict:
         q: dict = {}
         if query.operator_id:
             q["operator_id"] = query.operator_id
 
-        if query.__getattribute__("experience_id"):
-            q["_id"] = query.experience_id
+        if getattr(query, "experience_id", None):
+            q["_id"] = PydanticObjectId(query.experience_id)
 
         if query.status:
             q["status"] = query.status
@@ -80,8 +515,11 @@ class ExperienceRepository(BaseRepository[Experience]):
         # apply price filter
         self._add_price_filter(q, query.price_min, query.price_max)
 
-        # apply location filter
-        self._add_location_filter(q, query.location)
+        if isinstance(query, ExperienceListingQuery):
+            # apply location filter
+            self._add_location_filter(q, query)
+            # apply free-text search
+            self._add_search_filter(q, query)
 
         self._add_date_filter(q, query.date_from, query.date_to)
 
@@ -97,18 +535,108 @@ class ExperienceRepository(BaseRepository[Experience]):
             price_q["$lte"] = price_max
         q["price_per_person"] = price_q
 
-    def _add_location_filter(self, q: dict, location) -> None:
-        if not location or not getattr(location, "coordinates", None):
-            return
-        coords = location.coordinates
+    @staticmethod
+    def _geo_center(query: ExperienceListingQuery) -> Optional[List[float]]:
+        """Search point as [lng, lat], from `lat`/`lng` or the legacy `location` point."""
+        if query.lat is not None and query.lng is not None:
+            return [query.lng, query.lat]
+        coords = getattr(query.location, "coordinates", None)
         if isinstance(coords, (list, tuple)) and len(coords) == 2:
-            q["location"] = {
-                "$near": {
-                    "$geometry": {"type": "Point", "coordinates": coords},
-                    # default to 50km radius
-                    "$maxDistance": 50000,
-                }
-            }
+            return list(coords)
+        return None
+
+    @staticmethod
+    def _parse_bbox(bbox: str) -> List[float]:
+        try:
+            min_lng, min_lat, max_lng, max_lat = (float(part) for part in bbox.split(","))
+        except ValueError:
+            raise BadRequestError("bbox must be min_lng,min_lat,max_lng,max_lat")
+        if not (-180 <= min_lng <= 180 and -180 <= max_lng <= 180 and -90 <= min_lat < max_lat <= 90):
+            raise BadRequestError("bbox is out of range")
+        return [min_lng, min_lat, max_lng, max_lat]
+
+    @staticmethod
+    def _rect_polygons(west: float, south: float, east: float, north: float) -> List[list]:
+        """Polygon coordinates covering a lng/lat rectangle (west <= east).
+
+        2dsphere treats polygon edges as great-circle arcs, which bow away from
+        lines of latitude. The east-west edges are densified to 1 degree steps so
+        the polygon stays within meters of the rectangle, and wide rectangles are
+        split since a polygon must be smaller than a hemisphere.
+        """
+        polygons = []
+        start = west
+        while start < east or not polygons:
+            stop = min(start + _MAX_POLYGON_SPAN_DEG, east)
+            steps = max(1, math.ceil(stop - start))
+            bottom = [[start + (stop - start) * i / steps, south] for i in range(steps + 1)]
+            top = [[stop - (stop - start) * i / steps, north] for i in range(steps + 1)]
+            polygons.append([bottom + top + [[start, south]]])
+            start = stop
+        return polygons
+
+    @staticmethod
+    def _geometry(polygons: List[list]) -> dict:
+        if len(polygons) == 1:
+            return {"type": "Polygon", "coordinates": polygons[0]}
+        return {"type": "MultiPolygon", "coordinates": polygons}
+
+    def _bbox_geometry(self, min_lng: float, min_lat: float, max_lng: float, max_lat: float) -> dict:
+        if min_lng <= max_lng:
+            return self._geometry(self._rect_polygons(min_lng, min_lat, max_lng, max_lat))
+        # Viewport crosses the antimeridian: split it into two boxes
+        return self._geometry(
+            self._rect_polygons(min_lng, min_lat, 180.0, max_lat) + self._rect_polygons(-180.0, min_lat, max_lng, max_lat)
+        )
+
+    def _add_location_filter(self, q: dict, query: ExperienceListingQuery) -> None:
+        """Restrict to a radius around the search point and/or a bbox.
+
+        Uses `$geoWithin`, which unlike `$near` can be counted and sorted on
+        other fields; distance ordering is done with `$geoNear` in `list`.
+        """
+        field = query.geo_field.value
+        predicates = []
+        center = self._geo_center(query)
+        if center is not None:
+            radians = query.radius_km * 1000 / _EARTH_RADIUS_M
+            predicates.append({"$geoWithin": {"$centerSphere": [center, radians]}})
+        if query.bbox:
+            geometry = self._bbox_geometry(*self._parse_bbox(query.bbox))
+            predicates.append({"$geoWithin": {"$geometry": geometry}})
+
+        if len(predicates) == 1:
+            q[field] = predicates[0]
+        elif predicates:
+            q.setdefault("$and", []).extend({field: predicate} for predicate in predicates)
+
+    def _add_search_filter(self, q: dict, query: ExperienceListingQuery) -> None:
+        """Match `query.search` with the text index, or with the prefix index as you type.
+
+        In prefix mode every query word must match a prefix (or a one-edit
+        variant of one) of a word in the title, tags or activity name.
+        """
+        if not query.search:
+            return
+        if not query.search_as_you_type:
+            q["$text"] = {"$search": query.search}
+            return
+        groups = query_terms(query.search)
+        if groups:
+            q.setdefault("$and", []).extend({"search_prefixes": {"$in": group}} for group in groups)
+
+    async def _search_fields(self, experience: Experience) -> dict:
+        """Denormalized search fields for `experience`, stored alongside it on writes."""
+        activity_name = None
+        if experience.activity_id and ObjectId.is_valid(experience.activity_id):
+            activity = await load(Activity, experience.activity_id)
+            activity_name = activity.name if activity else None
+        return {
+            "search_activity_name": activity_name,
+            "search_prefixes": index_terms(
+                [experience.trip_title, experience.short_description or "", *experience.tags, activity_name or ""]
+            ),
+        }
 
     def _add_date_filter(self, q: dict, date_from: Optional[datetime], date_to: Optional[datetime]) -> None:
         if date_from is not None:
@@ -120,59 +648,242 @@ class ExperienceRepository(BaseRepository[Experience]):
         return q
 
     async def create(self, obj: Experience) -> Experience:
+        for key, value in (await self._search_fields(obj)).items():
+            setattr(obj, key, value)
         try:
             await obj.insert()
         except pymongo.errors.DuplicateKeyError:
             raise HTTPException(status_code=409, detail="Duplicate value for a unique field.")
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+        await self._purge_responses(obj)
         return obj
 
-    async def update(self, id: str, obj: dict) -> Experience:
-        experience = await self.get(id)
-        if not experience:
-            return None
+    async def _purge_responses(self, experience: Experience, listings: bool = True) -> None:
+        """Drop cached public responses that include `experience`, and every listing when `listings`."""
+        tags = [experience_tag(experience.id), operator_tag(experience.operator_id)]
+        if listings:
+            tags.append(LISTING_TAG)
+        await experience_response_cache.purge(tags)
+
+    async def update(self, id: str, obj: dict, operator_id: Optional[str] = None) -> Experience:
+        """Apply `obj` and recompute `complete` in one `find_one_and_update`, returning the post-image.
+
+        With `operator_id`, the update only matches an experience owned by that
+        operator, so ownership is checked atomically with the write. Raises
+        HTTPException(404) when the experience does not exist and
+        HTTPException(403) when it belongs to another operator.
+        """
+        if not ObjectId.is_valid(id):
+            raise HTTPException(status_code=404, detail="Experience not found")
+        filter = {"_id": ObjectId(id)}
+        if operator_id is not None:
+            filter["operator_id"] = str(operator_id)
 
-        # set updated_at
-        obj["updated_at"] = datetime.utcnow()
+        values = _encoder.encode({**obj, "updated_at": datetime.utcnow()})
+        pipeline = [
+            # $literal keeps user strings starting with "$" from being read as field paths
+            {"$set": {field: {"$literal": value} for field, value in values.items()}},
+            {"$set": {"complete": _COMPLETE_EXPR}},
+        ]
+        collection = Experience.get_pymongo_collection()
         try:
-            await experience.set(obj)
-            await experience.save()
+            doc = await collection.find_one_and_update(filter, pipeline, return_document=ReturnDocument.AFTER)
         except pymongo.errors.DuplicateKeyError:
             raise HTTPException(status_code=409, detail="Duplicate value for a unique field.")
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+        if doc is None:
+            # Only the failure path pays for telling "missing" from "not yours"
+            if operator_id is not None and await collection.find_one({"_id": filter["_id"]}, {"_id": 1}):
+                raise HTTPException(status_code=403, detail="Not owner of this experience")
+            raise HTTPException(status_code=404, detail="Experience not found")
+
+        experience = Experience.model_validate(doc)
+        remember(experience)
+        if _SEARCHED_FIELDS.intersection(obj):
+            # Search terms need the merged title, tags and activity name. Write them
+            # only while this update is still the latest, so a newer one wins.
+            search = await self._search_fields(experience)
+            await collection.update_one({"_id": doc["_id"], "updated_at": doc["updated_at"]}, {"$set": search})
+            for key, value in search.items():
+                setattr(experience, key, value)
+        await self._purge_responses(experience, listings=bool(_LISTING_FIELDS.intersection(obj)))
         return experience
 
-    async def change_status(self, id: str, new_status: ExperienceStatus = ExperienceStatus.SUBMITTED) -> Optional[Experience]:
-        """Set the experience status to `new_status` and save. Returns updated Experience or None."""
-        experience = await self.get(id)
-        if not experience:
+    async def transition(
+        self,
+        id: str,
+        new_status: ExperienceStatus,
+        operator_id: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        reason: Optional[str] = None,
+        require_complete: bool = False,
+        values: Optional[dict] = None,
+    ) -> Optional[Experience]:
+        """Move an experience to `new_status` if its current status allows it.
+
+        The status precondition (see EXPERIENCE_STATUS_SOURCES), ownership and
+        `require_complete` are part of the update filter, so concurrent callers
+        cannot both apply the transition. Returns the updated experience, or
+        None when nothing matched; the transition is then recorded in
+        `experience_status_history`.
+        """
+        if not ObjectId.is_valid(id):
             return None
+        filter = {"_id": ObjectId(id), "status": {"$in": [status.value for status in EXPERIENCE_STATUS_SOURCES[new_status]]}}
+        if operator_id is not None:
+            filter["operator_id"] = str(operator_id)
+        if require_complete:
+            filter["complete"] = True
+        changes = {**(values or {}), "status": new_status.value, "updated_at": datetime.utcnow()}
 
-        experience.status = new_status
-        experience.updated_at = datetime.utcnow()
         try:
-            await experience.save()
+            # The pre-image gives the source status for history; the post-image is the pre-image plus `changes`
+            before = await Experience.get_pymongo_collection().find_one_and_update(
+                filter, {"$set": changes}, return_document=ReturnDocument.BEFORE
+            )
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+        if before is None:
+            return None
+
+        await ExperienceStatusChange.get_pymongo_collection().insert_one({
+            "experience_id": id,
+            "from_status": before["status"],
+            "to_status": new_status.value,
+            "actor_id": actor_id,
+            "reason": reason,
+            "at": changes["updated_at"],
+        })
+        experience = Experience.model_validate({**before, **changes})
+        remember(experience)
+        await self._purge_responses(experience)
         return experience
 
-    async def reject(self, id: str, reason: str, admin_auth_id: Optional[str] = None) -> Optional[Experience]:
-        """Mark an experience as rejected, persist the rejection reason and record the admin auth id."""
-        experience = await self.get(id)
-        if not experience:
+    async def transition_many(
+        self,
+        ids: List[str],
+        new_status: ExperienceStatus,
+        actor_id: Optional[str] = None,
+        reasons: Optional[Dict[str, str]] = None,
+    ) -> List[dict]:
+        """Apply the same transition to many experiences in one unordered `bulk_write`.
+
+        Only transitions with a single allowed source status can be batched.
+        Each update carries the same status precondition as `transition`. The
+        outcome per id is read back in one query: a transition applied when the
+        experience now has `new_status` stamped with this batch's id, which a
+        concurrent write cannot share the way it can share a timestamp.
+        `reasons` (id -> rejection reason) is stored for rejections.
+        """
+        now = datetime.utcnow()
+        batch_id = str(ObjectId())
+        # The source status is then known for the history without reading pre-images
+        if len(EXPERIENCE_STATUS_SOURCES[new_status]) != 1:
+            raise ValueError(f"Cannot batch transitions to {new_status.value} from several statuses")
+        (source,) = EXPERIENCE_STATUS_SOURCES[new_status]
+        reasons = reasons or {}
+
+        valid = list(dict.fromkeys(id for id in ids if ObjectId.is_valid(id)))
+        requests = []
+        for id in valid:
+            values = {"status": new_status.value, "updated_at": now, "status_batch_id": batch_id}
+            if new_status == ExperienceStatus.REJECTED:
+                values.update(rejection_reason=reasons.get(id), rejected_by=actor_id)
+            requests.append(UpdateOne({"_id": ObjectId(id), "status": source.value}, {"$set": values}))
+
+        collection = Experience.get_pymongo_collection()
+        states = {}
+        if requests:
+            try:
+                await collection.bulk_write(requests, ordered=False)
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+            cursor = collection.find(
+                {"_id": {"$in": [ObjectId(id) for id in valid]}},
+                {"status": 1, "status_batch_id": 1, "operator_id": 1},
+            )
+            states = {str(doc["_id"]): doc for doc in await cursor.to_list(length=len(valid))}
+
+        for id in valid:
+            forget(Experience, id)
+        results, applied = [], []
+        for id in ids:
+            state = states.get(id)
+            done = state is not None and state["status"] == new_status.value and state.get("status_batch_id") == batch_id
+            if done and id not in applied:
+                applied.append(id)
+            results.append({
+                "experience_id": id,
+                "applied": done,
+                "status": state["status"] if state else None,
+                "error": None if done else ("not_found" if state is None else "invalid_status"),
+            })
+
+        if applied:
+            await ExperienceStatusChange.get_pymongo_collection().insert_many([
+                {
+                    "experience_id": id,
+                    "from_status": source.value,
+                    "to_status": new_status.value,
+                    "actor_id": actor_id,
+                    "reason": reasons.get(id),
+                    "at": now,
+                }
+                for id in applied
+            ])
+            tags = [LISTING_TAG]
+            for id in applied:
+                tags += [experience_tag(id), operator_tag(states[id].get("operator_id"))]
+            await experience_response_cache.purge(tags)
+        return results
+
+    async def moderation_queue(self, page_size: int, cursor: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+        """Submitted experiences, longest waiting first, with a cursor for the next page."""
+        q: dict = {"status": ExperienceStatus.SUBMITTED.value}
+        if cursor:
+            q = self._add_keyset_filter(q, cursor, _MODERATION_SORT, "updated_at", pymongo.ASCENDING)
+        docs = await (
+            Experience.get_pymongo_collection()
+            .find(q, {**self._compact_projection, "operator_id": 1, "updated_at": 1})
+            .sort([("updated_at", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)])
+            .limit(page_size + 1)
+            .to_list(length=page_size + 1)
+        )
+
+        next_cursor = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            last = docs[-1]
+            next_cursor = encode_cursor({"s": _MODERATION_SORT, "v": last["updated_at"], "id": last["_id"]})
+        items = [
+            {**self._to_compact(doc), "operator_id": doc.get("operator_id"), "updated_at": doc["updated_at"]}
+            for doc in docs
+        ]
+        return items, next_cursor
+
+    async def get_transition_state(self, id: str) -> Optional[dict]:
+        """Status, owner and completeness of an experience, to explain a transition that did not apply."""
+        if not ObjectId.is_valid(id):
             return None
+        return await Experience.get_pymongo_collection().find_one(
+            {"_id": ObjectId(id)}, {"status": 1, "operator_id": 1, "complete": 1}
+        )
 
-        experience.status = ExperienceStatus.REJECTED
-        experience.rejection_reason = reason
-        experience.rejected_by = admin_auth_id
-        experience.updated_at = datetime.utcnow()
-        try:
-            await experience.save()
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
-        return experience
+    async def change_status(self, id: str, new_status: ExperienceStatus = ExperienceStatus.SUBMITTED) -> Optional[Experience]:
+        """Set the experience status to `new_status` if allowed. Returns updated Experience or None."""
+        return await self.transition(id, new_status)
+
+    async def reject(self, id: str, reason: str, admin_auth_id: Optional[str] = None) -> Optional[Experience]:
+        """Mark a submitted experience as rejected, persisting the rejection reason and the admin id."""
+        return await self.transition(
+            id,
+            ExperienceStatus.REJECTED,
+            actor_id=admin_auth_id,
+            reason=reason,
+            values={"rejection_reason": reason, "rejected_by": admin_auth_id},
+        )
 
     async def delete(self, id: str) -> None:
         # Soft delete: mark as archived
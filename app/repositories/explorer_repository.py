@@ -5,6 +5,7 @@ from typing import Dict, List, Optional
 from beanie import PydanticObjectId
 
 from app.models.explorer import Explorer
+from app.repositories.auth_id_cache import explorer_id_cache
 from app.repositories.base import BaseRepository
 
 
@@ -58,6 +59,7 @@ class ExplorerRepository(BaseRepository[Explorer]):
 
     async def create(self, obj: Explorer) -> Explorer:
         await obj.insert()
+        await explorer_id_cache.invalidate(obj.authenticator_id)
         return obj
 
     async def update(self, id: str, data: dict) -> Optional[Explorer]:
@@ -65,11 +67,15 @@ class ExplorerRepository(BaseRepository[Explorer]):
         if not explorer:
             return None
         if data:
+            previous_auth_id = explorer.authenticator_id
             await explorer.update({"$set": data})
             await explorer.reload()
+            if "authenticator_id" in data:
+                await explorer_id_cache.invalidate(previous_auth_id, explorer.authenticator_id)
         return explorer
 
     async def delete(self, id: str) -> None:
         explorer = await self.get(id)
         if explorer:
             await explorer.delete()
+            await explorer_id_cache.invalidate(explorer.authenticator_id)
@@ -0,0 +1,173 @@
+"""Single-round-trip page fetching shared by the listing repositories.
+
+An exact total is computed in the same aggregation as the page with
+``$facet``. Callers that do not need a total skip the count entirely, and
+estimated totals are served from a per-worker cache keyed by the normalized
+filter (an unfiltered collection uses the collection metadata count).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import json_util
+
+from app.core.config import settings
+from app.util.cache import LRUCache, MISSING
+from app.util.singleflight import SingleFlight
+
+_counts: LRUCache[int] = LRUCache(
+    maxsize=settings.listing_count_cache_size,
+    ttl=settings.listing_count_cache_ttl_seconds,
+    name="listing:counts",
+)
+_count_flight = SingleFlight("listing:counts")
+
+
+@dataclass
+class Page:
+    items: List[dict]
+    total: Optional[int]
+    total_estimated: bool = False
+    facets: Optional[Dict[str, List[dict]]] = None
+
+
+def _count_key(collection, filter: dict) -> Tuple[str, str]:
+    return collection.name, json_util.dumps(filter, sort_keys=True)
+
+
+async def estimated_count(collection, filter: dict) -> int:
+    """Approximate number of documents matching ``filter``, reused for a short TTL."""
+    key = _count_key(collection, filter)
+    cached = _counts.get(key)
+    if cached is not MISSING:
+        return cached
+
+    async def _load() -> int:
+        if filter:
+            total = await collection.count_documents(filter)
+        else:
+            total = await collection.estimated_document_count()
+        _counts.set(key, total)
+        return total
+
+    return await _count_flight.do(key, _load)
+
+
+async def aggregate(collection, pipeline: List[dict], length: Optional[int] = None) -> List[dict]:
+    """Run ``pipeline`` and return up to ``length`` result documents.
+
+    pymongo's async client hands back the cursor from a coroutine while Motor
+    returns it directly; both are accepted.
+    """
+    cursor = collection.aggregate(pipeline)
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+    return await cursor.to_list(length=length)
+
+
+async def facet_counts(collection, filter: dict, facets: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+    """Run the ``facets`` sub-pipelines over ``filter`` in one aggregation."""
+    pipeline = [{"$match": filter}, {"$facet": facets}]
+    result = await aggregate(collection, pipeline, length=1)
+    return result[0] if result else {name: [] for name in facets}
+
+
+async def fetch_page(
+    collection,
+    filter: dict,
+    sort: Sequence[Tuple[str, int]],
+    skip: int,
+    limit: int,
+    projection: Optional[Dict[str, Any]] = None,
+    include_total: bool = True,
+    estimate_total: bool = False,
+    count_filter: Optional[dict] = None,
+    facets: Optional[Dict[str, List[dict]]] = None,
+) -> Page:
+    """Fetch ``limit`` documents after ``skip`` and, optionally, the total.
+
+    ``count_filter`` is the predicate the total (and ``facets``) are reported
+    for when it differs from ``filter`` (keyset pages narrow ``filter`` but
+    report the full total). ``facets`` are extra ``$facet`` sub-pipelines whose
+    raw output is returned in ``Page.facets``.
+    """
+    count_filter = filter if count_filter is None else count_filter
+
+    if include_total and not estimate_total and count_filter is filter:
+        stages: List[dict] = [{"$match": filter}]
+        # Sort before the facet so the index can serve it; facet sub-pipelines cannot.
+        if sort:
+            stages.append({"$sort": dict(sort)})
+        return await aggregate_page(collection, stages, skip, limit, projection, facets=facets)
+
+    cursor = collection.find(filter, projection)
+    if sort:
+        cursor = cursor.sort(list(sort))
+    find = cursor.skip(skip).limit(limit).to_list(length=limit)
+    return await _gather_page(collection, find, include_total, estimate_total, count_filter, facets)
+
+
+async def aggregate_page(
+    collection,
+    stages: List[dict],
+    skip: int,
+    limit: int,
+    projection: Optional[Dict[str, Any]] = None,
+    include_total: bool = True,
+    estimate_total: bool = False,
+    count_filter: Optional[dict] = None,
+    facets: Optional[Dict[str, List[dict]]] = None,
+    keyset: bool = False,
+) -> Page:
+    """Like ``fetch_page`` for pipelines that cannot be expressed as a find.
+
+    ``stages`` select and order the documents (e.g. a leading ``$geoNear``).
+    Estimated totals are counted with ``count_filter``, which must describe
+    the same documents as a plain query. Set ``keyset`` when ``stages`` skip
+    past a cursor, so the total is counted over ``count_filter`` instead.
+    """
+    items_stage: List[dict] = [{"$skip": skip}, {"$limit": limit}]
+    if projection:
+        items_stage.append({"$project": projection})
+
+    if include_total and not estimate_total and not keyset:
+        branches = {**(facets or {}), "items": items_stage, "total": [{"$count": "n"}]}
+        result = await aggregate(collection, [*stages, {"$facet": branches}], length=1)
+        facet = result[0] if result else {name: [] for name in branches}
+        total = facet["total"][0]["n"] if facet["total"] else 0
+        return Page(
+            items=facet["items"],
+            total=total,
+            facets={name: facet[name] for name in facets} if facets else None,
+        )
+
+    async def _items() -> List[dict]:
+        return await aggregate(collection, [*stages, *items_stage], length=limit)
+
+    return await _gather_page(collection, _items(), include_total, estimate_total, count_filter or {}, facets)
+
+
+async def _gather_page(collection, items, include_total: bool, estimate_total: bool, count_filter: dict, facets) -> Page:
+    """Await the page query together with whatever count and facets it needs."""
+    if include_total:
+        count = estimated_count(collection, count_filter) if estimate_total else collection.count_documents(count_filter)
+    else:
+        count = asyncio.sleep(0, None)
+    facet = facet_counts(collection, count_filter, facets) if facets else asyncio.sleep(0, None)
+    items, total, facet_result = await asyncio.gather(items, count, facet)
+    return Page(items=items, total=total, total_estimated=include_total and estimate_total, facets=facet_result)
+
+
+def after_filter(q: dict, fields: Sequence[str], values: Sequence[Any]) -> dict:
+    """Narrow `q` to documents strictly after `values` in ascending order of `fields`."""
+    branches = []
+    for i, field in enumerate(fields):
+        branch = {prefix: values[j] for j, prefix in enumerate(fields[:i])}
+        branch[field] = {"$gt": values[i]}
+        branches.append(branch)
+    keyset = {"$or": branches}
+    return {"$and": [q, keyset]} if q else keyset
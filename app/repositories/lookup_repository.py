@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Any, Generic, Optional, Type, TypeVar
 
-from beanie import Document, PydanticObjectId
+from beanie import Document
+
+from app.repositories.unit_of_work import forget, load
 
 TDocument = TypeVar("TDocument", bound=Document)
 
@@ -17,7 +19,7 @@ class LookupRepository(Generic[TDocument]):
         return await self.model.find_all().to_list()
 
     async def get(self, item_id: str) -> Optional[TDocument]:
-        return await self.model.get(PydanticObjectId(item_id))
+        return await load(self.model, item_id)
 
     async def find_by_field(self, field: str, value: Any) -> Optional[TDocument]:
         return await self.model.find_one({field: value})
@@ -36,3 +38,4 @@ class LookupRepository(Generic[TDocument]):
 
     async def delete(self, document: TDocument) -> None:
         await document.delete()
+        forget(self.model, document.id)
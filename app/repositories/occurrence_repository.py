@@ -0,0 +1,272 @@
+"""Materialized occurrence calendar of recurring experiences.
+
+``materialize`` keeps ``experience_occurrences`` filled for a rolling horizon.
+Per experience, ``experience_occurrence_state`` records the ``updated_at`` it
+was expanded from and how far ahead it is filled, so a run re-expands only
+experiences that changed, appends the days the horizon rolled forward for the
+others, and drops experiences that stopped recurring.
+"""
+
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+import numpy as np
+import pymongo
+from pymongo import DeleteMany, InsertOne, ReplaceOne
+
+from app.core.config import settings
+from app.models.experience import Experience, ExperienceStatus
+from app.models.experience_occurrence import ExperienceOccurrence
+from app.repositories.listing import after_filter
+from app.util.functions.recurrence import expand_many
+
+_STATE_COLLECTION = "experience_occurrence_state"
+
+# Experiences fetched and rewritten per batch
+_BATCH_SIZE = 500
+
+# Days expanded at a time when streaming past the calendar horizon
+_STREAM_CHUNK_DAYS = 14
+
+_RECURRING_FILTER = {
+    "is_recurring": True,
+    "recurring_pattern": {"$nin": [None, ""]},
+    "start_date": {"$ne": None},
+    "status": {"$ne": ExperienceStatus.ARCHIVED.value},
+}
+
+_SOURCE_PROJECTION = {
+    "operator_id": 1,
+    "status": 1,
+    "recurring_pattern": 1,
+    "start_date": 1,
+    "end_date": 1,
+    "timezone": 1,
+    "trip_title": 1,
+    "available_count": 1,
+    "location": 1,
+    "images": {"$slice": 1},
+    "updated_at": 1,
+}
+
+
+class OccurrenceRepository:
+    def _collection(self):
+        return ExperienceOccurrence.get_pymongo_collection()
+
+    def _state(self):
+        return self._collection().database[_STATE_COLLECTION]
+
+    def horizon_end(self) -> datetime:
+        """Last day the calendar is filled up to."""
+        return self._window(datetime.utcnow())[1]
+
+    @staticmethod
+    def _window(now: datetime) -> tuple:
+        start = datetime(now.year, now.month, now.day)
+        return start, start + timedelta(days=settings.occurrence_horizon_days)
+
+    async def list(self, q: dict, date_from: Optional[datetime], date_to: Optional[datetime]) -> List[dict]:
+        """Occurrences matching `q` (experience_id / operator_id) in a date range, in instance compact shape."""
+        q = dict(q)
+        date_q: dict = {}
+        if date_from is not None:
+            date_q["$gte"] = date_from
+        if date_to is not None:
+            date_q["$lte"] = date_to
+        if date_q:
+            q["date"] = date_q
+        docs = await self._collection().find(q, {"_id": 0}).sort("date", pymongo.ASCENDING).to_list(length=None)
+        return [self._to_compact(doc) for doc in docs]
+
+    async def stream(
+        self,
+        q: dict,
+        date_from: Optional[datetime],
+        date_to: Optional[datetime],
+        after: Optional[Tuple[datetime, str]] = None,
+        batch_size: int = 100,
+    ) -> AsyncIterator[dict]:
+        """Occurrences in ``(date, experience_id)`` order, lazily.
+
+        Up to the horizon they are read from the calendar; a window reaching
+        past it is expanded from the experiences a few days at a time, so a
+        year-long window never sits in memory.
+        """
+        horizon_end = self.horizon_end()
+        calendar_to = min(date_to, horizon_end) if date_to is not None else horizon_end
+        filter = dict(q)
+        date_q: dict = {"$lte": calendar_to}
+        if date_from is not None:
+            date_q["$gte"] = date_from
+        filter["date"] = date_q
+        if after is not None:
+            filter = after_filter(filter, ("date", "experience_id"), after)
+        cursor = (
+            self._collection()
+            .find(filter, {"_id": 0})
+            .sort([("date", pymongo.ASCENDING), ("experience_id", pymongo.ASCENDING)])
+            .batch_size(batch_size)
+        )
+        try:
+            async for doc in cursor:
+                yield self._to_compact(doc)
+        finally:
+            await cursor.close()
+
+        if date_to is not None and date_to > horizon_end:
+            start = max(horizon_end, date_from) if date_from is not None else horizon_end
+            async for item in self._expand_stream(q, start, date_to, after):
+                yield item
+
+    async def _expand_stream(
+        self, q: dict, start: datetime, end: datetime, after: Optional[Tuple[datetime, str]]
+    ) -> AsyncIterator[dict]:
+        """Occurrences in ``(start, end]`` expanded in order, ``_STREAM_CHUNK_DAYS`` at a time."""
+        filter = dict(_RECURRING_FILTER)
+        if q.get("experience_id"):
+            if not ObjectId.is_valid(q["experience_id"]):
+                return
+            filter["_id"] = ObjectId(q["experience_id"])
+        if q.get("operator_id"):
+            filter["operator_id"] = q["operator_id"]
+        experiences = await Experience.get_pymongo_collection().find(filter, _SOURCE_PROJECTION).to_list(length=None)
+        rules = [(e.get("recurring_pattern"), e.get("start_date"), e.get("timezone")) for e in experiences]
+        keys = [(e["_id"], e.get("updated_at")) for e in experiences]
+        if after is not None:
+            start = max(start, after[0] - timedelta(microseconds=1))
+
+        while experiences and start < end:
+            chunk_end = min(start + timedelta(days=_STREAM_CHUNK_DAYS), end)
+            chunk = []
+            for experience, dates in zip(experiences, expand_many(rules, start, chunk_end, keys)):
+                # Windows are inclusive; the chunk start belongs to the previous chunk
+                dates = dates[dates > np.datetime64(start, "us")]
+                if experience.get("end_date") is not None:
+                    dates = dates[dates <= np.datetime64(experience["end_date"], "us")]
+                experience_id = str(experience["_id"])
+                chunk.extend((date, experience_id, experience) for date in dates.tolist())
+            chunk.sort(key=lambda item: (item[0], item[1]))
+            for date, experience_id, experience in chunk:
+                if after is not None and (date, experience_id) <= after:
+                    continue
+                yield self._to_compact(self._occurrence(experience, date))
+            start = chunk_end
+
+    @staticmethod
+    def _to_compact(doc: dict) -> dict:
+        return {
+            "experience_id": doc.get("experience_id"),
+            "trip_title": doc.get("trip_title"),
+            "date": doc.get("date"),
+            "status": "scheduled",
+            "booked_count": 0,
+            "available_count": doc.get("available_count"),
+            "location": doc.get("location"),
+            "images": [doc["image"]] if doc.get("image") else [],
+        }
+
+    async def materialize(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Bring the calendar up to date for the horizon starting today; returns counters for logging."""
+        window_start, window_end = self._window(now or datetime.utcnow())
+        stats = {"expanded": 0, "extended": 0, "removed": 0, "occurrences": 0}
+
+        # Versions first: only experiences that changed are fetched in full
+        sources = {
+            doc["_id"]: doc.get("updated_at")
+            async for doc in Experience.get_pymongo_collection().find(_RECURRING_FILTER, {"updated_at": 1})
+        }
+        states = {doc["_id"]: doc async for doc in self._state().find({})}
+
+        stale = [id for id in states if id not in sources]
+        if stale:
+            await self._collection().delete_many({"experience_id": {"$in": [str(id) for id in stale]}})
+            await self._state().delete_many({"_id": {"$in": stale}})
+            stats["removed"] = len(stale)
+
+        # (experience id, expansion window start)
+        pending = []
+        for id, updated_at in sources.items():
+            state = states.get(id)
+            if state is None or state.get("version") != updated_at:
+                pending.append((id, window_start))
+            elif state.get("until") is None or state["until"] < window_end:
+                pending.append((id, max(state["until"] or window_start, window_start)))
+
+        for offset in range(0, len(pending), _BATCH_SIZE):
+            batch = dict(pending[offset:offset + _BATCH_SIZE])
+            stats["occurrences"] += await self._expand_batch(batch, window_start, window_end, states, stats)
+
+        # Occurrences before today are no longer listed from the calendar
+        await self._collection().delete_many({"date": {"$lt": window_start}})
+        return stats
+
+    async def _expand_batch(
+        self, batch: Dict[ObjectId, datetime], window_start: datetime, window_end: datetime, states: dict, stats: dict
+    ) -> int:
+        experiences = await Experience.get_pymongo_collection().find(
+            {"_id": {"$in": list(batch)}}, _SOURCE_PROJECTION
+        ).to_list(length=None)
+
+        # Experiences extended from the same day share one vectorized expansion
+        groups: Dict[datetime, List[dict]] = {}
+        rebuilds = set()
+        for experience in experiences:
+            id = experience["_id"]
+            state = states.get(id)
+            if state is None or state.get("version") != experience.get("updated_at"):
+                rebuilds.add(id)
+                groups.setdefault(window_start, []).append(experience)
+            else:
+                groups.setdefault(batch[id], []).append(experience)
+
+        writes, state_writes, inserted = [], [], 0
+        for expand_from, members in groups.items():
+            expanded = expand_many(
+                [(e.get("recurring_pattern"), e.get("start_date"), e.get("timezone")) for e in members],
+                expand_from,
+                window_end,
+                [(e["_id"], e.get("updated_at")) for e in members],
+            )
+            for experience, dates in zip(members, expanded):
+                id = experience["_id"]
+                rebuild = id in rebuilds
+                if rebuild:
+                    writes.append(DeleteMany({"experience_id": str(id)}))
+                    stats["expanded"] += 1
+                else:
+                    # The previous run already wrote its last day
+                    dates = dates[dates > np.datetime64(expand_from, "us")]
+                    stats["extended"] += 1
+                if experience.get("end_date") is not None:
+                    dates = dates[dates <= np.datetime64(experience["end_date"], "us")]
+                for date in dates.tolist():
+                    writes.append(InsertOne(self._occurrence(experience, date)))
+                inserted += len(dates)
+                state_writes.append(ReplaceOne(
+                    {"_id": id},
+                    {"_id": id, "version": experience.get("updated_at"), "until": window_end},
+                    upsert=True,
+                ))
+
+        if writes:
+            # Ordered, so each experience's delete runs before its inserts
+            await self._collection().bulk_write(writes, ordered=True)
+        if state_writes:
+            await self._state().bulk_write(state_writes, ordered=False)
+        return inserted
+
+    @staticmethod
+    def _occurrence(experience: dict, date: datetime) -> dict:
+        images = experience.get("images") or []
+        return {
+            "experience_id": str(experience["_id"]),
+            "operator_id": experience.get("operator_id"),
+            "date": date,
+            "experience_status": experience.get("status"),
+            "trip_title": experience.get("trip_title"),
+            "available_count": experience.get("available_count"),
+            "location": experience.get("location"),
+            "image": images[0] if images else None,
+        }
@@ -12,6 +12,8 @@ from app.models.activity_lookup import Activity
 from app.schemas.operator import OperatorListingResult
 from app.util.functions.phone import is_valid_phone
 from app.repositories.base import BaseRepository
+from app.repositories.auth_id_cache import operator_id_cache
+from app.repositories.listing import fetch_page
 from bson import ObjectId
 
 
@@ -52,6 +54,11 @@ class OperatorRepository(BaseRepository[Operator]):
 
 	async def get(self, auth_user_id: str) -> Optional[Operator]:
 		return await Operator.find_one({"authenticator_id": auth_user_id})
+
+	async def get_updated_at(self, auth_user_id: str) -> Optional[datetime]:
+		"""Return only `updated_at` for an operator, for cheap conditional-GET checks."""
+		doc = await Operator.get_pymongo_collection().find_one({"authenticator_id": auth_user_id}, {"updated_at": 1})
+		return doc.get("updated_at") if doc else None
 		
 
 	async def list(
@@ -62,6 +69,8 @@ class OperatorRepository(BaseRepository[Operator]):
 		blocked: Optional[bool] = None,
 		activities_ids: Optional[List[str]] = None,
 		preferred_language_ids: Optional[List[str]] = None,
+		include_total: bool = True,
+		estimate_total: bool = False,
 	) -> OperatorListingResult:
 		query = {}
 		if verified is not None:
@@ -72,8 +81,23 @@ class OperatorRepository(BaseRepository[Operator]):
 			query["preferred_language_ids"] = {"$in": preferred_language_ids}
 		if activities_ids:
 			query["activities_ids"] = {"$in": activities_ids}
-		items = await Operator.find(query).skip((page - 1) * page_size).limit(page_size).to_list()
-		return OperatorListingResult(items=items, total=await Operator.find(query).count(), page=page, page_size=page_size)
+		result = await fetch_page(
+			Operator.get_pymongo_collection(),
+			query,
+			[("_id", pymongo.ASCENDING)],
+			skip=(page - 1) * page_size,
+			limit=page_size,
+			include_total=include_total,
+			estimate_total=estimate_total,
+		)
+		items = [Operator.model_validate(doc) for doc in result.items]
+		return OperatorListingResult(
+			items=items,
+			total=result.total,
+			total_estimated=result.total_estimated,
+			page=page,
+			page_size=page_size,
+		)
 
 
 	async def create(self, obj: Operator) -> Operator:
@@ -84,6 +108,8 @@ class OperatorRepository(BaseRepository[Operator]):
 			raise HTTPException(status_code=409, detail="Duplicate value for a unique field (email or authenticator_id already exists).")
 		except Exception as e:
 			raise HTTPException(status_code=400, detail=f"Database error: {str(e)}")
+		# Drop any cached "unknown auth id" entry for the new operator
+		await operator_id_cache.invalidate(obj.authenticator_id)
 		return obj
 
 
@@ -137,3 +163,4 @@ class OperatorRepository(BaseRepository[Operator]):
 		operator = await self.get(id)
 		if operator:
 			await operator.delete()
+			await operator_id_cache.invalidate(operator.authenticator_id)
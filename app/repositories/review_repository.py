@@ -0,0 +1,59 @@
+import asyncio
+
+from bson import ObjectId
+import pymongo
+
+from app.models.booking import Booking
+from app.models.experience import Experience
+from app.models.experience_instance import ExperienceInstance
+from app.models.experience_review import ExperienceReview
+from app.repositories.batch_loader import link_id, loader
+from app.repositories.listing import fetch_page
+from app.schemas.review import ReviewListingQuery, ReviewListingResult
+
+
+class ExperienceReviewRepository:
+    async def list_for_experience(self, experience_id: str, query: ReviewListingQuery) -> ReviewListingResult:
+        """Visible reviews of an experience, newest first, with their links resolved in batches."""
+        # Links are stored as DBRefs
+        q: dict = {"experience.$id": ObjectId(experience_id) if ObjectId.is_valid(experience_id) else experience_id, "is_hidden": False}
+        if query.rating is not None:
+            q["rating"] = query.rating
+        result = await fetch_page(
+            ExperienceReview.get_pymongo_collection(),
+            q,
+            [("created_at", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            skip=(query.page - 1) * query.page_size,
+            limit=query.page_size,
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+        )
+        items = await asyncio.gather(*(self._to_out(doc) for doc in result.items))
+        return ReviewListingResult.model_construct(
+            items=items,
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=query.page,
+            page_size=query.page_size,
+        )
+
+    async def _to_out(self, doc: dict) -> dict:
+        # One $in query per linked model for the whole page
+        experience, instance, booking = await asyncio.gather(
+            loader(Experience).load(doc.get("experience")),
+            loader(ExperienceInstance).load(doc.get("experience_instance")),
+            loader(Booking).load(doc.get("booking")),
+        )
+        return {
+            "id": str(doc["_id"]),
+            "rating": doc.get("rating"),
+            "title": doc.get("title"),
+            "comment": doc.get("comment"),
+            "images": doc.get("images") or [],
+            "is_verified": doc.get("is_verified", True),
+            "created_at": doc.get("created_at"),
+            "experience_id": link_id(doc.get("experience")),
+            "trip_title": experience.trip_title if experience else None,
+            "trip_date": instance.date if instance else None,
+            "party_size": booking.number_of_people if booking else None,
+        }
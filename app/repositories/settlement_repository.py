@@ -0,0 +1,60 @@
+import asyncio
+
+import pymongo
+
+from app.models.payment import Payment
+from app.models.settlement import PayoutBatch, Settlement
+from app.repositories.batch_loader import loader
+from app.repositories.listing import fetch_page
+from app.schemas.settlement import SettlementListingQuery, SettlementListingResult
+
+
+class SettlementRepository:
+    async def list_for_operator(self, operator_id: str, query: SettlementListingQuery) -> SettlementListingResult:
+        """An operator's settlements by due date, with payments and payout batches resolved in batches."""
+        q: dict = {"operator_id": operator_id}
+        if query.status is not None:
+            q["status"] = query.status.value
+        result = await fetch_page(
+            Settlement.get_pymongo_collection(),
+            q,
+            [("due_date", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            skip=(query.page - 1) * query.page_size,
+            limit=query.page_size,
+            include_total=query.include_total,
+            estimate_total=query.estimate_total,
+        )
+        items = await asyncio.gather(*(self._to_out(doc) for doc in result.items))
+        return SettlementListingResult.model_construct(
+            items=items,
+            total=result.total,
+            total_estimated=result.total_estimated,
+            page=query.page,
+            page_size=query.page_size,
+        )
+
+    async def _to_out(self, doc: dict) -> dict:
+        payment, batch = await asyncio.gather(
+            loader(Payment).load(doc.get("payment_id")),
+            loader(PayoutBatch).load(doc.get("payout_batch_id")),
+        )
+        return {
+            "id": str(doc["_id"]),
+            "net_payout": doc.get("net_payout"),
+            "status": doc.get("status"),
+            "due_date": doc.get("due_date"),
+            "created_at": doc.get("created_at"),
+            "payment": {
+                "id": str(payment.id),
+                "amount": payment.amount,
+                "status": payment.status,
+                "gateway_name": payment.gateway_name,
+                "created_at": payment.created_at,
+            } if payment else None,
+            "payout_batch": {
+                "id": str(batch.id),
+                "status": batch.status,
+                "payout_provider": batch.payout_provider,
+                "executed_at": batch.executed_at,
+            } if batch else None,
+        }
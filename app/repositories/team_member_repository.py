@@ -1,14 +1,13 @@
 from typing import List, Optional
 
-from beanie import PydanticObjectId
-
 from app.models.team_member import TeamMember
 from app.repositories.base import BaseRepository
+from app.repositories.unit_of_work import forget, load
 
 
 class TeamMemberRepository(BaseRepository[TeamMember]):
     async def get(self, id: str) -> Optional[TeamMember]:
-        return await TeamMember.get(PydanticObjectId(id))
+        return await load(TeamMember, id)
 
     async def list(self) -> List[TeamMember]:
         return await TeamMember.find_all().to_list()
@@ -29,3 +28,4 @@ class TeamMemberRepository(BaseRepository[TeamMember]):
         member = await self.get(id)
         if member:
             await member.delete()
+            forget(TeamMember, id)
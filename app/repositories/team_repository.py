@@ -1,14 +1,13 @@
 from typing import List, Optional
 
-from beanie import PydanticObjectId
-
 from app.models.team import Team
 from app.repositories.base import BaseRepository
+from app.repositories.unit_of_work import forget, load
 
 
 class TeamRepository(BaseRepository[Team]):
     async def get(self, id: str) -> Optional[Team]:
-        return await Team.get(PydanticObjectId(id))
+        return await load(Team, id)
 
     async def list(self) -> List[Team]:
         return await Team.find_all().to_list()
@@ -32,6 +31,7 @@ class TeamRepository(BaseRepository[Team]):
         team = await self.get(id)
         if team:
             await team.delete()
+            forget(Team, id)
 
     async def get_by_owner(self, owner_user_id: str) -> Optional[Team]:
         """Retrieve a team by the owner's user ID."""
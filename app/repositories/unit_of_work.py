@@ -0,0 +1,150 @@
+"""Request-scoped identity map and Mongo round-trip accounting.
+
+Inside a ``unit_of_work()`` scope (one per HTTP request, opened by the app
+middleware) every ``(model, _id)`` is fetched at most once: ``load`` and
+``load_many`` return the instance already loaded in the scope, and
+``load_many`` fetches whatever is missing with one ``$in`` query. Writers keep
+the map current with ``remember`` and ``forget``. Outside a scope (Celery
+tasks, scripts) loads go straight to Mongo.
+
+``RoundTripListener`` is registered on the Mongo client and counts the
+commands each scope sends, so endpoints can be held to a round-trip budget.
+Streamed response bodies run after the handler has returned; ``stream_in``
+produces them inside the request's scope so their queries are counted too.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple, Type, TypeVar
+
+from beanie import Document, PydanticObjectId
+from bson import ObjectId
+from pymongo import monitoring
+
+TDocument = TypeVar("TDocument", bound=Document)
+
+
+class UnitOfWork:
+    def __init__(self) -> None:
+        self.identities: Dict[Tuple[type, str], Any] = {}
+        self.round_trips = 0
+        self.commands: Counter = Counter()
+        self.identity_hits = 0
+        # model -> BatchLoader shared by the request (see batch_loader.loader)
+        self.loaders: Dict[type, Any] = {}
+
+
+_scope: ContextVar[Optional[UnitOfWork]] = ContextVar("unit_of_work", default=None)
+
+
+@contextmanager
+def unit_of_work() -> Iterator[UnitOfWork]:
+    """Open a scope; tasks started inside it (e.g. by ``asyncio.gather``) share it."""
+    uow = UnitOfWork()
+    token = _scope.set(uow)
+    try:
+        yield uow
+    finally:
+        _scope.reset(token)
+
+
+def current() -> Optional[UnitOfWork]:
+    return _scope.get()
+
+
+async def stream_in(uow: UnitOfWork, body: AsyncIterable[Any]) -> AsyncIterator[Any]:
+    """Iterate ``body`` with ``uow`` as the scope while each chunk is produced."""
+    iterator = body.__aiter__()
+    while True:
+        # Set and reset around each step: the consumer may resume us in another context
+        token = _scope.set(uow)
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            _scope.reset(token)
+        yield chunk
+
+
+def _key(model: type, id: Any) -> Tuple[type, str]:
+    return model, str(id)
+
+
+async def load(model: Type[TDocument], id: Any) -> Optional[TDocument]:
+    """``model.get(id)`` through the identity map; invalid ids load as None."""
+    if not ObjectId.is_valid(str(id)):
+        return None
+    uow = _scope.get()
+    if uow is not None and _key(model, id) in uow.identities:
+        uow.identity_hits += 1
+        return uow.identities[_key(model, id)]
+    document = await model.get(PydanticObjectId(str(id)))
+    if uow is not None:
+        uow.identities[_key(model, id)] = document
+    return document
+
+
+async def load_many(model: Type[TDocument], ids: Iterable[Any]) -> Dict[str, Optional[TDocument]]:
+    """Load several documents of ``model`` with one query for those not yet in the map."""
+    ids = [str(id) for id in dict.fromkeys(ids) if ObjectId.is_valid(str(id))]
+    uow = _scope.get()
+    found: Dict[str, Optional[TDocument]] = {}
+    missing = []
+    for id in ids:
+        if uow is not None and _key(model, id) in uow.identities:
+            uow.identity_hits += 1
+            found[id] = uow.identities[_key(model, id)]
+        else:
+            missing.append(id)
+
+    if missing:
+        loaded = {
+            str(document.id): document
+            for document in await model.find({"_id": {"$in": [ObjectId(id) for id in missing]}}).to_list()
+        }
+        for id in missing:
+            found[id] = loaded.get(id)
+            if uow is not None:
+                uow.identities[_key(model, id)] = found[id]
+    return found
+
+
+def remember(document: Document) -> None:
+    """Record the current state of a document written in this scope."""
+    uow = _scope.get()
+    if uow is not None and document.id is not None:
+        uow.identities[_key(type(document), document.id)] = document
+
+
+def forget(model: type, id: Any) -> None:
+    """Drop a document from the map, e.g. after a delete or an update applied by filter."""
+    uow = _scope.get()
+    if uow is not None:
+        uow.identities.pop(_key(model, id), None)
+
+
+class RoundTripListener(monitoring.CommandListener):
+    """Counts the commands sent on behalf of the current scope.
+
+    The async driver runs command monitoring in the calling task, so the
+    scope's context variable is visible here.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        uow = _scope.get()
+        if uow is not None:
+            uow.round_trips += 1
+            uow.commands[event.command_name] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+round_trip_listener = RoundTripListener()
@@ -1,31 +1,37 @@
 from typing import List, Optional
 
-from beanie import PydanticObjectId
-
 from app.models.user import User
+from app.repositories.auth_id_cache import user_id_cache
 from app.repositories.base import BaseRepository
+from app.repositories.unit_of_work import forget, load
 
 
 class UserRepository(BaseRepository[User]):
     async def get(self, id: str) -> Optional[User]:
-        return await User.get(PydanticObjectId(id))
+        return await load(User, id)
 
     async def list(self) -> List[User]:
         return await User.find_all().to_list()
 
     async def create(self, obj: User) -> User:
         await obj.insert()
+        await user_id_cache.invalidate(obj.authenticator_id)
         return obj
 
     async def update(self, id: str, obj: dict) -> Optional[User]:
         user = await self.get(id)
         if not user:
             return None
+        previous_auth_id = user.authenticator_id
         await user.set(obj)
         await user.save()
+        if "authenticator_id" in obj:
+            await user_id_cache.invalidate(previous_auth_id, user.authenticator_id)
         return user
 
     async def delete(self, id: str) -> None:
         user = await self.get(id)
         if user:
             await user.delete()
+            forget(User, id)
+            await user_id_cache.invalidate(user.authenticator_id)
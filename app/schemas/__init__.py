@@ -15,6 +15,8 @@ class PB_BaseModel(_BaseModel):
 class ListingQuery(_BaseModel):
     page: int = Field(1, ge=1, description="Page number, starting from 1.")
     page_size: int = Field(20, ge=1, le=200, description="Number of items per page (max 200).")
+    include_total: bool = Field(True, description="Set to false to skip counting the total number of items.")
+    estimate_total: bool = Field(False, description="Return a cached, approximate total instead of an exact count.")
 
     @field_validator("page_size")
     def page_size_max_200(cls, v):
@@ -27,7 +29,8 @@ class ListingQuery(_BaseModel):
     }
     
 class ListingResult(PB_BaseModel):
-    total: int = Field(..., description="Total number of items available.")
+    total: Optional[int] = Field(None, description="Total number of items available, or null when not requested.")
+    total_estimated: bool = Field(False, description="Whether `total` is an approximate count.")
     items: List = Field(..., description="List of items for the current page.")
     page: int = Field(..., description="Current page number.")
     page_size: int = Field(..., description="Number of items per page.")
\ No newline at end of file
@@ -0,0 +1,23 @@
+from . import *
+from app.models.booking import BookingStatus
+from app.models.experience_instance import ExperienceInstanceStatus
+
+class BookingListingQuery(ListingQuery):
+    status: Optional[BookingStatus] = Field(None, description="Filter bookings by status.")
+
+class BookingOutSchema(PB_BaseModel):
+    id: str = Field(..., description="Unique identifier for the booking.")
+    status: BookingStatus = Field(..., description="Booking status.")
+    number_of_people: int = Field(..., description="Number of people booked.")
+    total_price: float = Field(..., description="Total price of the booking.")
+    currency: str = Field(..., description="Currency of the total price.")
+    booked_at: datetime = Field(..., description="When the booking was made.")
+    experience_instance_id: str = Field(..., description="Booked experience instance.")
+    trip_date: Optional[date] = Field(None, description="Date of the booked experience instance.")
+    instance_status: Optional[ExperienceInstanceStatus] = Field(None, description="Status of the booked experience instance.")
+    experience_id: Optional[str] = Field(None, description="Booked experience.")
+    trip_title: Optional[str] = Field(None, description="Title of the booked experience.")
+    image: Optional[str] = Field(None, description="Cover image of the booked experience.")
+
+class BookingListingResult(ListingResult):
+    items: List[BookingOutSchema]
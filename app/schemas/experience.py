@@ -1,4 +1,5 @@
 from . import *
+from enum import Enum
 
 from app.models.experience import (CancellationPolicy, GeoJsonPoint, DifficultyLevel, 
                                    TripStep, PickupInfo, Experience, ExperienceStatus)
@@ -46,7 +47,8 @@ class RejectExperienceSchema(PB_BaseModel):
     rejection_reason: str = Field(..., description="Reason for rejecting the experience.")
 
 class ExperienceOutSchema(PB_BaseModel, Experience):
-    pass
+    search_activity_name: Optional[str] = Field(None, exclude=True)
+    search_prefixes: List[str] = Field([], exclude=True)
 
 class ExperienceCompactOutSchema(PB_BaseModel):
     id: str = Field(..., description="Unique identifier for the experience.")
@@ -56,6 +58,19 @@ class ExperienceCompactOutSchema(PB_BaseModel):
     price_per_person: Optional[float] = Field(None, description="Price per person for the experience.")
     location: Optional[GeoJsonPoint] = Field(None, description="Main experience location as GeoJSON")
     status: ExperienceStatus = Field(..., description="Current status of the experience.")
+    distance_m: Optional[float] = Field(None, description="Distance in meters from the search point, when sorted by distance.")
+
+class ExperienceSortField(str, Enum):
+    NEWEST = "-created_at"
+    OLDEST = "created_at"
+    PRICE_ASC = "price_per_person"
+    PRICE_DESC = "-price_per_person"
+    DISTANCE = "distance"
+    RELEVANCE = "relevance"
+
+class ExperienceGeoField(str, Enum):
+    LOCATION = "location"
+    MEETING_POINT = "meeting_point"
 
 class ExperienceListingQuery(ListingQuery):
     operator_id: Optional[str] = Field(None, description="Filter experiences by operator ID.")
@@ -72,5 +87,94 @@ class ExperienceListingQuery(ListingQuery):
     activity_ids: Optional[List[str]] = Field(None, description="Filter by a list of activity IDs.")
     location: Optional[GeoJsonPoint] = Field(None, description="Filter experiences near a specific location.")
 
+    lat: Optional[float] = Field(None, ge=-90, le=90, description="Latitude of the search point.")
+    lng: Optional[float] = Field(None, ge=-180, le=180, description="Longitude of the search point.")
+    radius_km: float = Field(50, gt=0, le=500, description="Search radius around the search point, in kilometers.")
+    bbox: Optional[str] = Field(None, description="Map viewport as `min_lng,min_lat,max_lng,max_lat`.")
+    geo_field: ExperienceGeoField = Field(ExperienceGeoField.LOCATION, description="Point that geo filters and distance sort apply to.")
+
+    include_facets: bool = Field(False, description="Also return counts per activity, difficulty, price bucket, language and cancellation policy.")
+
+    search: Optional[str] = Field(None, max_length=100, description="Free-text search over title, description, tags and activity name.")
+    search_as_you_type: bool = Field(False, description="Treat `search` as typed so far: match word prefixes and tolerate typos.")
+
+    sort: ExperienceSortField = Field(ExperienceSortField.NEWEST, description="Sort order; ties are broken by id. `distance` requires a search point, `relevance` requires `search`.")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's `next_cursor`. When set, `page` is ignored.")
+
+class FacetCountSchema(PB_BaseModel):
+    value: str = Field(..., description="Facet value.")
+    count: int = Field(..., description="Number of matching experiences with this value.")
+
+class PriceBucketSchema(PB_BaseModel):
+    min: float = Field(..., description="Inclusive lower bound of the bucket.")
+    max: Optional[float] = Field(None, description="Exclusive upper bound of the bucket, or null for the last one.")
+    count: int = Field(..., description="Number of matching experiences priced in the bucket.")
+
+class ExperienceFacetsSchema(PB_BaseModel):
+    activity: List[FacetCountSchema] = Field([], description="Counts per activity ID.")
+    difficulty: List[FacetCountSchema] = Field([], description="Counts per difficulty level.")
+    language: List[FacetCountSchema] = Field([], description="Counts per language.")
+    cancellation_policy: List[FacetCountSchema] = Field([], description="Counts per cancellation policy.")
+    price: List[PriceBucketSchema] = Field([], description="Counts per price-per-person bucket.")
+
 class ExperienceListOutSchema(ListingResult):
-    items: List[ExperienceCompactOutSchema]
\ No newline at end of file
+    items: List[ExperienceCompactOutSchema]
+    facets: Optional[ExperienceFacetsSchema] = Field(None, description="Facet counts for the whole filtered set, when requested.")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page.")
+
+
+class ExperienceClusterQuery(PB_BaseModel):
+    bbox: str = Field(..., description="Map viewport as `min_lng,min_lat,max_lng,max_lat`.")
+    zoom: int = Field(..., ge=0, le=22, description="Map zoom level; the grid doubles in resolution per level.")
+
+    status: Optional[str] = Field(None, description="Filter experiences by status.")
+    activity_ids: Optional[List[str]] = Field(None, description="Filter by a list of activity IDs.")
+    price_min: Optional[float] = Field(None, description="Minimum price filter.")
+    price_max: Optional[float] = Field(None, description="Maximum price filter.")
+
+    items_threshold: int = Field(50, ge=0, le=200, description="Return full items instead of only clusters when the viewport holds at most this many experiences.")
+
+class ExperienceClusterSchema(PB_BaseModel):
+    cell: str = Field(..., description="Grid cell as `zoom/x/y`.")
+    count: int = Field(..., description="Number of experiences in the cell.")
+    centroid: GeoJsonPoint = Field(..., description="Mean position of the experiences in the cell.")
+    min_price: Optional[float] = Field(None, description="Cheapest price per person in the cell.")
+    image: Optional[str] = Field(None, description="Representative image URL.")
+
+class ExperienceClusterOutSchema(PB_BaseModel):
+    zoom: int = Field(..., description="Zoom level the clusters were computed for.")
+    cell_size: float = Field(..., description="Grid cell size in degrees.")
+    total: int = Field(..., description="Number of experiences in the viewport.")
+    clusters: List[ExperienceClusterSchema] = Field([], description="Non-empty grid cells in the viewport.")
+    items: Optional[List[ExperienceCompactOutSchema]] = Field(None, description="Experiences in the viewport, when there are at most `items_threshold`.")
+
+class ModerationQueueQuery(PB_BaseModel):
+    page_size: int = Field(50, ge=1, le=200, description="Number of experiences per page (max 200).")
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's `next_cursor`.")
+
+class ModerationQueueItemSchema(ExperienceCompactOutSchema):
+    operator_id: str = Field(..., description="Operator that submitted the experience.")
+    updated_at: datetime = Field(..., description="When the experience was last changed, i.e. submitted.")
+
+class ModerationQueueOutSchema(PB_BaseModel):
+    items: List[ModerationQueueItemSchema] = Field([], description="Submitted experiences, longest waiting first.")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page.")
+
+class BatchApproveSchema(PB_BaseModel):
+    experience_ids: List[str] = Field(..., min_length=1, max_length=500, description="Experiences to approve (max 500).")
+
+class RejectDecisionSchema(RejectExperienceSchema):
+    experience_id: str = Field(..., description="Experience to reject.")
+
+class BatchRejectSchema(PB_BaseModel):
+    decisions: List[RejectDecisionSchema] = Field(..., min_length=1, max_length=500, description="Experiences to reject with their reasons (max 500).")
+
+class ModerationResultSchema(PB_BaseModel):
+    experience_id: str = Field(..., description="Experience the decision was for.")
+    applied: bool = Field(..., description="Whether the status transition was applied.")
+    status: Optional[ExperienceStatus] = Field(None, description="Status of the experience after the batch, when it exists.")
+    error: Optional[str] = Field(None, description="`not_found` or `invalid_status` when the decision was not applied.")
+
+class BatchModerationOutSchema(PB_BaseModel):
+    applied: int = Field(..., description="Number of decisions applied.")
+    results: List[ModerationResultSchema] = Field([], description="Outcome per requested experience, in request order.")
@@ -14,7 +14,8 @@ class ExperienceInstanceOutSchema(PB_BaseModel, ExperienceInstance):
     pass
 
 class ExperienceInstanceCompactOutSchema(PB_BaseModel):
-    trip_title: str = Field(..., description="Title of the experience.")
+    experience_id: Optional[str] = Field(None, description="ID of the experience this instance belongs to.")
+    trip_title: Optional[str] = Field(None, description="Title of the experience.")
     date: datetime = Field(..., description="Date of the experience instance.")
     status: ExperienceInstanceStatus = Field(..., description="Current status of the experience instance.")
     booked_count: int = Field(..., description="Number of bookings for this instance.")
@@ -32,6 +33,16 @@ class ExperienceInstanceListingQuery(ListingQuery):
     date_from: Optional[datetime] = Field(None, description="Filter instances starting from this date.")
     date_to: Optional[datetime] = Field(None, description="Filter instances ending by this date.")
 
+    cursor: Optional[str] = Field(None, description="Opaque cursor from a previous page's `next_cursor`.")
+
 
 class ExperienceInstanceListingResult(ListingResult):
-    items: List[ExperienceInstanceCompactOutSchema]
\ No newline at end of file
+    items: List[ExperienceInstanceCompactOutSchema]
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page.")
+
+
+class ExperienceInstanceExportQuery(PB_BaseModel):
+    experience_id: Optional[str] = Field(None, description="Export only this experience's instances.")
+    status: Optional[ExperienceInstanceStatus] = Field(None, description="Export only instances with this status.")
+    date_from: Optional[datetime] = Field(None, description="Start of the window (UTC); defaults to today.")
+    date_to: Optional[datetime] = Field(None, description="End of the window (UTC); defaults to a year after `date_from`, the maximum.")
@@ -0,0 +1,20 @@
+from . import *
+
+class ReviewListingQuery(ListingQuery):
+    rating: Optional[int] = Field(None, ge=1, le=5, description="Only reviews with this star rating.")
+
+class ReviewOutSchema(PB_BaseModel):
+    id: str = Field(..., description="Unique identifier for the review.")
+    rating: int = Field(..., description="Star rating from 1 to 5.")
+    title: Optional[str] = Field(None, description="Review title.")
+    comment: str = Field(..., description="Review text.")
+    images: List[str] = Field([], description="Photo URLs attached to the review.")
+    is_verified: bool = Field(..., description="Whether the review comes from a completed booking.")
+    created_at: datetime = Field(..., description="When the review was written.")
+    experience_id: Optional[str] = Field(None, description="Reviewed experience.")
+    trip_title: Optional[str] = Field(None, description="Title of the reviewed experience.")
+    trip_date: Optional[date] = Field(None, description="Date of the experience instance the reviewer attended.")
+    party_size: Optional[int] = Field(None, description="Number of people on the reviewer's booking.")
+
+class ReviewListingResult(ListingResult):
+    items: List[ReviewOutSchema]
@@ -0,0 +1,30 @@
+from . import *
+from app.models.settlement import SettlementStatus
+
+class SettlementListingQuery(ListingQuery):
+    status: Optional[SettlementStatus] = Field(None, description="Filter settlements by status.")
+
+class SettlementPaymentSchema(PB_BaseModel):
+    id: str = Field(..., description="Payment the settlement pays out.")
+    amount: int = Field(..., description="Amount paid by the explorer, in cents.")
+    status: str = Field(..., description="Payment status (pending, captured, failed, refunded).")
+    gateway_name: str = Field(..., description="Payment gateway, e.g. paymob.")
+    created_at: datetime = Field(..., description="When the payment was made.")
+
+class SettlementPayoutBatchSchema(PB_BaseModel):
+    id: str = Field(..., description="Payout batch the settlement was assigned to.")
+    status: str = Field(..., description="Batch status (processing, success, failed).")
+    payout_provider: str = Field(..., description="Payout channel, e.g. bank_transfer.")
+    executed_at: datetime = Field(..., description="When the payout was executed.")
+
+class SettlementOutSchema(PB_BaseModel):
+    id: str = Field(..., description="Unique identifier for the settlement.")
+    net_payout: int = Field(..., description="Amount owed to the operator after commission, in cents.")
+    status: SettlementStatus = Field(..., description="Settlement status.")
+    due_date: datetime = Field(..., description="When the settlement becomes payable.")
+    created_at: datetime = Field(..., description="When the settlement was created.")
+    payment: Optional[SettlementPaymentSchema] = Field(None, description="The settled payment.")
+    payout_batch: Optional[SettlementPayoutBatchSchema] = Field(None, description="The payout batch, once batched.")
+
+class SettlementListingResult(ListingResult):
+    items: List[SettlementOutSchema]
@@ -0,0 +1,15 @@
+from app.repositories import get_explorer_id_from_auth_id
+from app.repositories.booking_repository import BookingRepository
+from app.schemas.booking import BookingListingQuery, BookingListingResult
+from app.services.base import BaseService
+
+
+class BookingService(BaseService):
+    def __init__(self, repository: BookingRepository | None = None) -> None:
+        self.repository = repository or BookingRepository()
+
+    async def list_explorer_bookings(self, auth_id: str, query: BookingListingQuery) -> BookingListingResult:
+        explorer_id = await get_explorer_id_from_auth_id(auth_id)
+        if not explorer_id:
+            self._unauthorized("Invalid explorer authentication")
+        return await self.repository.list_for_explorer(explorer_id, query)
@@ -1,11 +1,10 @@
 from typing import Optional
-from datetime import datetime, date
-import pendulum
-from dateutil.rrule import rrulestr
+from datetime import datetime, date, timedelta
 
 from app.repositories import get_user_id_from_auth_id, get_operator_id_from_auth_id
 from app.repositories.experience_instance_repository import ExperienceInstanceRepository
 from app.repositories.experience_repository import ExperienceRepository
+from app.repositories.occurrence_repository import OccurrenceRepository
 
 from app.schemas.experience_instance import (
 	ExperienceInstanceUpdateSchema,
@@ -13,10 +12,19 @@ from app.schemas.experience_instance import (
 	ExperienceInstanceOutSchema,
 	ExperienceInstanceCompactOutSchema,
 	ExperienceInstanceListingQuery,
+	ExperienceInstanceExportQuery,
 	ExperienceInstanceListingResult,
 )
 from app.models.experience_instance import ExperienceInstance, ExperienceInstanceStatus
 from app.services.base import BaseService
+from app.util.functions.cursor import decode_cursor, encode_cursor
+
+# Sort key recorded in instance listing cursors
+_INSTANCE_SORT = "date-experience"
+
+# Longest window a single export may cover, and documents read per round trip
+_EXPORT_MAX_DAYS = 366
+_EXPORT_BATCH_SIZE = 500
 
 
 # async def create_experience_instance(data: ExperienceInstanceUpdateSchema) -> ExperienceInstanceOutSchema:
@@ -30,6 +38,7 @@ class ExperienceInstanceService(BaseService):
     def __init__(self):
         self.experience_instance_repository = ExperienceInstanceRepository()
         self.experience_repository = ExperienceRepository()
+        self.occurrence_repository = OccurrenceRepository()
 
     def __validate_changes(self, instance: ExperienceInstance, data: ExperienceInstanceUpdateSchema) -> bool:
         """Validate if there are any changes between the instance and the update data.
@@ -117,132 +126,133 @@ class ExperienceInstanceService(BaseService):
         return instance
 
 
-    def __from_experince_to_instance(
-        self,
-        experiences,
-        window_start: Optional[datetime] = None,
-        window_end: Optional[datetime] = None,
-    ) -> list[ExperienceInstance]:
-        """Convert an Experience model to an ExperienceInstance model.
-
-        Implementation pending.
-        """
-        # NOTE: keep this method simple: expects an iterable of experience-like objects
-        # and returns a list of `ExperienceInstance` generated by their recurring patterns.
-        experience_instances: list[ExperienceInstance] = []
-
-        for experience in experiences:
-            recurring_pattern = getattr(experience, "recurring_pattern", None)
-            if not recurring_pattern:
-                continue
-
-            start_date = getattr(experience, "start_date", None)
-            if not start_date:
-                continue
-
-            tz = getattr(experience, "timezone", "UTC") or "UTC"
-            # build dtstart using pendulum to respect timezone
-            try:
-                start = pendulum.instance(start_date).in_timezone(tz)
-            except Exception:
-                # fallback to naive pendulum datetime
-                start = pendulum.instance(start_date)
-
-            rule = rrulestr(recurring_pattern, dtstart=start)
-
-            # Determine generation window. Prefer caller-provided window; otherwise
-            # default to starting at the experience start and extending 90 days.
-            if window_start is not None:
-                try:
-                    ws = pendulum.instance(window_start).in_timezone(tz)
-                except Exception:
-                    ws = pendulum.instance(window_start)
-            else:
-                ws = start
-
-            if window_end is not None:
-                try:
-                    we = pendulum.instance(window_end).in_timezone(tz)
-                except Exception:
-                    we = pendulum.instance(window_end)
-            else:
-                we = start.add(days=90)
-
-            try:
-                occurrences = list(rule.between(ws, we, inc=True))
-            except Exception:
-                occurrences = []
-
-            for occ in occurrences:
-                instance = ExperienceInstance(
-                    experience_id=getattr(experience, "id", None) or getattr(experience, "_id", None),
-                    trip_title=getattr(experience, "trip_title", None),
-                    date=occ,
-                    status=getattr(experience, "status", None),
-                    booked_count=0,
-                    available_count=getattr(experience, "available_count", None),
-                    location=getattr(experience, "location", None),
-                    images=getattr(experience, "images", None) or [],
-                )
-                experience_instances.append(instance)
-
-        return experience_instances
-
-
-
     async def list_experience_instances(self, query: ExperienceInstanceListingQuery) -> ExperienceInstanceListingResult:
-        """Return a paginated/filtered listing of compact experience instances.
+        """Return a page of compact experience instances ordered by day, then `experience_id`.
 
-        Implementation pending.
+        Physical instances and the occurrences of recurring experiences are
+        both read as sorted streams and merged; a physical instance replaces
+        the occurrences of its experience on the same UTC day. Only one page
+        (plus one look-ahead item and the rest of its day) is held in memory.
         """
-        #1- get physical experience instances
-        experience_instances = await self.experience_instance_repository.list(query)
+        after = None
+        if query.cursor:
+            payload = decode_cursor(query.cursor)
+            if payload.get("s") != _INSTANCE_SORT or "d" not in payload:
+                self._bad_request("Cursor does not match this listing")
+            after = self.__key({"date": payload["d"], "experience_id": payload.get("e")})
+
+        items = []
+        instances = self.__instances(query, after, batch_size=query.page_size + 1)
+        try:
+            async for item in instances:
+                items.append(item)
+                if len(items) > query.page_size:
+                    break
+        finally:
+            await instances.aclose()
+
+        next_cursor = None
+        if len(items) > query.page_size:
+            items = items[:query.page_size]
+            last = items[-1]
+            next_cursor = encode_cursor({"s": _INSTANCE_SORT, "d": last["date"], "e": last["experience_id"] or ""})
+        return ExperienceInstanceListingResult(
+            items=items, total=None, page=query.page, page_size=query.page_size, next_cursor=next_cursor
+        )
 
-        #2- get experience instances based on recurring patters
-        experiences = await self.experience_repository.list(query)
+    async def stream_operator_instances(self, operator_auth_id: str, query: ExperienceInstanceExportQuery):
+        """The operator's instances in `(date, experience_id)` order, as an async iterator for exports.
 
-        #3- process recurring experiences into instances (use query window if present)
-        # repository returns a ListingResult for experiences; extract items if needed
-        exp_items = getattr(experiences, "items", experiences)
-        recurring_instances = self.__from_experince_to_instance(
-            exp_items, window_start=query.date_from, window_end=query.date_to
+        The window is checked before anything is read, so errors surface before
+        a streaming response starts.
+        """
+        operator_id = await get_operator_id_from_auth_id(operator_auth_id)
+        if not operator_id:
+            self._unauthorized("Invalid operator authentication")
+        date_from = query.date_from or datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        date_to = query.date_to or date_from + timedelta(days=_EXPORT_MAX_DAYS)
+        if date_to < date_from or date_to - date_from > timedelta(days=_EXPORT_MAX_DAYS):
+            self._bad_request(f"Export window must be between 0 and {_EXPORT_MAX_DAYS} days")
+
+        listing = ExperienceInstanceListingQuery(
+            operator_id=operator_id,
+            experience_id=query.experience_id,
+            status=query.status,
+            date_from=date_from,
+            date_to=date_to,
         )
-
-        #4- subtract physical instances from recurring instances to avoid duplicates
-        # Build maps keyed by ISO timestamp to detect collisions
-        def key_for(dt: datetime) -> str:
-            # Recurring instances are day-based; use the UTC date as the key
-            if getattr(dt, "tzinfo", None) is not None:
-                return dt.astimezone(pendulum.UTC).date().isoformat()
-            return pendulum.instance(dt).in_timezone(pendulum.UTC).date().isoformat()
-
-        phys_map: dict[str, ExperienceInstanceCompactOutSchema] = {}
-        for inst in experience_instances:
-            # inst may already be a compact schema
-            dt = getattr(inst, "date", None)
-            if dt is None:
-                continue
-            phys_map[key_for(dt)] = inst
-
-        final_items: list[ExperienceInstanceCompactOutSchema] = []
-
-        # start with physical instances (they take precedence)
-        for inst in experience_instances:
-            final_items.append(inst)
-
-        # add recurring instances that don't collide with physical ones
-        for rec in recurring_instances:
-            rec_key = key_for(getattr(rec, "date"))
-            if rec_key in phys_map:
-                # skip because physical instance supersedes recurring
-                continue
-            # convert recurring model to compact schema
-            compact = await self.to_compact_schema(rec)
-            final_items.append(compact)
-
-        # return as listing result (no pagination available on query)
-        total = len(final_items)
-        return ExperienceInstanceListingResult(items=final_items, total=total, page=1, page_size=total)
+        return self.__instances(listing, None, batch_size=_EXPORT_BATCH_SIZE)
+
+    async def __instances(self, query: ExperienceInstanceListingQuery, after, batch_size: int):
+        if after is not None:
+            # Both streams restart at the cursor's day; the rest of it is skipped below
+            resume_from = after[0] if query.date_from is None else max(query.date_from, after[0])
+            query = query.model_copy(update={"date_from": resume_from})
+        physical = self.experience_instance_repository.stream(query, None, batch_size=batch_size)
+        virtual = self.__occurrence_stream(query, batch_size)
+        try:
+            async for item in self.__merge(self.__by_day(physical), self.__by_day(virtual)):
+                if after is not None and self.__key(item) <= after:
+                    continue
+                # Physical instances of another status still hide their occurrence
+                if query.status and item["status"] != query.status:
+                    continue
+                yield item
+        finally:
+            await physical.aclose()
+            await virtual.aclose()
+
+    async def __occurrence_stream(self, query: ExperienceInstanceListingQuery, batch_size: int):
+        if query.status not in (None, ExperienceInstanceStatus.scheduled):
+            return
+        occurrence_filter = {}
+        if query.experience_id:
+            occurrence_filter["experience_id"] = query.experience_id
+        if query.operator_id:
+            occurrence_filter["operator_id"] = query.operator_id
+        async for item in self.occurrence_repository.stream(
+            occurrence_filter, query.date_from, query.date_to, None, batch_size=batch_size
+        ):
+            yield item
+
+    @staticmethod
+    def __key(item):
+        """Listing order: UTC day, then `experience_id`, then the start time within the day."""
+        start = item["date"]
+        return datetime(start.year, start.month, start.day), item["experience_id"] or "", start
+
+    @classmethod
+    async def __by_day(cls, stream):
+        """Reorder a `(date, experience_id)`-sorted stream by `__key`, holding one day at a time."""
+        day = []
+        async for item in stream:
+            if day and cls.__key(item)[0] != cls.__key(day[0])[0]:
+                day.sort(key=cls.__key)
+                for held in day:
+                    yield held
+                day = []
+            day.append(item)
+        day.sort(key=cls.__key)
+        for held in day:
+            yield held
+
+    @classmethod
+    async def __merge(cls, physical, virtual):
+        """Merge two `__key`-sorted streams; a physical instance hides the occurrences of its day."""
+        def slot(item):
+            return cls.__key(item)[:2]
+
+        p = await anext(physical, None)
+        v = await anext(virtual, None)
+        while p is not None or v is not None:
+            if v is None or (p is not None and slot(p) <= slot(v)):
+                while v is not None and slot(v) == slot(p):
+                    v = await anext(virtual, None)
+                yield p
+                p = await anext(physical, None)
+            else:
+                yield v
+                v = await anext(virtual, None)
 
 
     async def to_compact_schema(self, instance: ExperienceInstance) -> ExperienceInstanceCompactOutSchema:
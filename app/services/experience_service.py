@@ -10,9 +10,20 @@ from app.schemas.experience import (
 	ExperienceOutSchema,
 	ExperienceListOutSchema,
 	ExperienceListingQuery,
+	ExperienceClusterQuery,
+	ExperienceClusterOutSchema,
 	RejectExperienceSchema,
+	ModerationQueueQuery,
+	ModerationQueueOutSchema,
+	BatchApproveSchema,
+	BatchRejectSchema,
+	BatchModerationOutSchema,
 )
 from app.services.base import BaseService
+from app.util.singleflight import SingleFlight
+
+# Concurrent detail reads of the same experience share one Mongo fetch.
+_detail_flight = SingleFlight("experience:detail")
 
 
 class ExperienceService(BaseService):
@@ -23,8 +34,39 @@ class ExperienceService(BaseService):
 		result = await self.repository.list(query)
 		return result
 
+	async def get_map_clusters(self, query: ExperienceClusterQuery) -> ExperienceClusterOutSchema:
+		cell_size, clusters = await self.repository.clusters(query)
+		total = sum(cluster["count"] for cluster in clusters)
+
+		# Sparse viewports get the experiences themselves instead of clusters
+		items = None
+		if total <= query.items_threshold:
+			listing = ExperienceListingQuery(
+				bbox=query.bbox,
+				status=query.status,
+				activity_ids=query.activity_ids,
+				price_min=query.price_min,
+				price_max=query.price_max,
+				page_size=max(query.items_threshold, 1),
+				include_total=False,
+			)
+			items = (await self.repository.list(listing)).items
+		return ExperienceClusterOutSchema(
+			zoom=query.zoom,
+			cell_size=cell_size,
+			total=total,
+			clusters=clusters,
+			items=items,
+		)
+
+	async def get_experience_updated_at(self, experience_id: str) -> datetime:
+		updated_at = await self.repository.get_updated_at(experience_id)
+		if updated_at is None:
+			self._not_found("Experience")
+		return updated_at
+
 	async def get_experience(self, experience_id: str) -> ExperienceOutSchema:
-		experience = await self.repository.get(experience_id)
+		experience = await _detail_flight.do(experience_id, lambda: self.repository.get(experience_id))
 		if not experience:
 			self._not_found("Experience")
 		return self._to_schema(experience)
@@ -48,82 +90,60 @@ class ExperienceService(BaseService):
 		return self._to_schema(created)
 
 	async def update_experience(self, experience_id: str, data: ExperienceUpdateSchema, auth_id: str) -> ExperienceOutSchema:
-		# Ensure caller owns the experience
 		operator_id = await get_operator_id_from_auth_id(auth_id)
 		if not operator_id:
 			self._unauthorized("Invalid operator authentication")
-		existing = await self.repository.get(experience_id, operator_id=operator_id)
-		if not existing:
-			self._not_found("Experience")
 
 		# prepare update dict from pydantic schema (exclude unset)
-		update_data = {}
 		if hasattr(data, "model_dump"):
 			update_data = data.model_dump(exclude_unset=True)
 		else:
 			update_data = data.dict(exclude_unset=True)
 
-		updated = await self.repository.update(experience_id, update_data)
-		if not updated:
-			self._not_found("Experience")
-
-		# Re-evaluate completeness and persist if changed
-		is_complete = self._is_complete_experience(updated)
-		if getattr(updated, "complete", False) != is_complete:
-			updated = await self.repository.update(experience_id, {"complete": is_complete})
-
+		# Ownership check, write and completeness re-evaluation happen in one atomic update
+		updated = await self.repository.update(experience_id, update_data, operator_id=operator_id)
 		return self._to_schema(updated)
 
 	async def delete_experience(self, experience_id: str, auth_id: str) -> None:
 		operator_id = await get_operator_id_from_auth_id(auth_id)
 		if not operator_id:
 			self._unauthorized("Invalid operator authentication")
-		experience = await self.repository.get(experience_id, operator_id=operator_id)
-		if not experience:
-			self._not_found("Experience")
-		# Soft delete via repository
-		await self.repository.delete(experience_id)
+		# Soft delete: archive, owned by the caller
+		archived = await self.repository.transition(
+			experience_id, ExperienceStatus.ARCHIVED, operator_id=operator_id, actor_id=operator_id
+		)
+		if not archived:
+			# Every other status can be archived, so the experience already is; deleting is idempotent
+			await self._transition_failed(experience_id, operator_id)
 
 	async def submit_experience(self, experience_id: str, auth_id: str) -> ExperienceOutSchema:
 		operator_id = await get_operator_id_from_auth_id(auth_id)
 		if not operator_id:
 			self._unauthorized("Invalid operator authentication")
-		experience = await self.repository.get(experience_id, operator_id=operator_id)
-		if not experience:
-			self._not_found("Experience")
 
-		# Ensure experience is marked complete before submission
-		if not experience.complete:
-			self._bad_request("Experience is not complete")
-
-		# perform status transition via repository submit method
-		updated = await self.repository.change_status(experience_id, ExperienceStatus.SUBMITTED)
+		# Ownership, completeness and the source status are checked by the update itself
+		updated = await self.repository.transition(
+			experience_id, ExperienceStatus.SUBMITTED, operator_id=operator_id, actor_id=operator_id, require_complete=True
+		)
 		if not updated:
-			self._not_found("Experience")
+			state = await self._transition_failed(experience_id, operator_id)
+			if not state.get("complete"):
+				self._bad_request("Experience is not complete")
+			self._bad_request("Only draft or rejected experiences can be submitted")
 		return self._to_schema(updated)
 
 	async def approve_experience(self, experience_id: str, auth_id: str) -> ExperienceOutSchema:
 		admin_id = await get_user_id_from_auth_id(auth_id)
 		if not admin_id:
 			self._unauthorized("Invalid admin authentication")
-		experience = await self.repository.get(experience_id)
-		if not experience:
-			self._not_found("Experience")
 
-		# Only submitted experiences can be approved
-		if experience.status != ExperienceStatus.SUBMITTED:
-			self._bad_request("Only submitted experiences can be approved")
-
-		updated = await self.repository.change_status(experience_id, ExperienceStatus.PUBLISHED)
+		# Only submitted experiences can be approved; concurrent approvals publish once
+		updated = await self.repository.transition(experience_id, ExperienceStatus.PUBLISHED, actor_id=admin_id)
 		if not updated:
-			self._not_found("Experience")
+			await self._transition_failed(experience_id, None, "Only submitted experiences can be approved")
 		return self._to_schema(updated)
 
 	async def reject_experience(self, experience_id: str, data: RejectExperienceSchema, admin_auth_id: str | None = None) -> ExperienceOutSchema:
-		existing = await self.repository.get(experience_id)
-		if not existing:
-			self._not_found("Experience")
-
 		# extract reason from schema
 		if hasattr(data, "model_dump"):
 			reason = data.model_dump().get("rejection_reason")
@@ -140,9 +160,48 @@ class ExperienceService(BaseService):
 		# update status and rejection reason via repository.reject, recording admin user id
 		updated = await self.repository.reject(experience_id, reason, admin_user_id)
 		if not updated:
-			self._not_found("Experience")
+			await self._transition_failed(experience_id, None, "Only submitted experiences can be rejected")
 		return self._to_schema(updated)
 
+	async def get_moderation_queue(self, query: ModerationQueueQuery) -> ModerationQueueOutSchema:
+		items, next_cursor = await self.repository.moderation_queue(query.page_size, query.cursor)
+		return ModerationQueueOutSchema(items=items, next_cursor=next_cursor)
+
+	async def approve_experiences(self, data: BatchApproveSchema, auth_id: str) -> BatchModerationOutSchema:
+		admin_id = await get_user_id_from_auth_id(auth_id)
+		if not admin_id:
+			self._unauthorized("Invalid admin authentication")
+		results = await self.repository.transition_many(data.experience_ids, ExperienceStatus.PUBLISHED, actor_id=admin_id)
+		return self._batch_out(results)
+
+	async def reject_experiences(self, data: BatchRejectSchema, auth_id: str) -> BatchModerationOutSchema:
+		admin_id = await get_user_id_from_auth_id(auth_id)
+		if not admin_id:
+			self._unauthorized("Invalid admin authentication")
+		reasons = {decision.experience_id: decision.rejection_reason for decision in data.decisions}
+		results = await self.repository.transition_many(
+			[decision.experience_id for decision in data.decisions], ExperienceStatus.REJECTED, actor_id=admin_id, reasons=reasons
+		)
+		return self._batch_out(results)
+
+	def _batch_out(self, results: List[dict]) -> BatchModerationOutSchema:
+		return BatchModerationOutSchema(applied=sum(result["applied"] for result in results), results=results)
+
+	async def _transition_failed(self, experience_id: str, operator_id: str | None, message: str | None = None) -> dict:
+		"""Raise the error explaining why a status transition matched nothing.
+
+		Returns the experience's transition state when the caller owns it and no
+		`message` is given, so the caller can pick a more specific error.
+		"""
+		state = await self.repository.get_transition_state(experience_id)
+		if not state:
+			self._not_found("Experience")
+		if operator_id is not None and str(state.get("operator_id")) != str(operator_id):
+			self._forbidden("Not owner of this experience")
+		if message:
+			self._bad_request(message, {"status": state.get("status")})
+		return state
+
 	def _to_schema(self, experience: Experience) -> ExperienceOutSchema:
 		data = experience.model_dump() if hasattr(experience, "model_dump") else experience.dict()
 		# Prefer pydantic v2 model_validate if available
@@ -151,7 +210,8 @@ class ExperienceService(BaseService):
 		return ExperienceOutSchema(**data)
 
 	def _is_complete_experience(self, experience: Experience) -> bool:
-		# Basic completeness rules: required public-facing fields present
+		# Basic completeness rules: required public-facing fields present.
+		# Keep in sync with _COMPLETE_EXPR in the repository, which applies them on updates.
 		if not experience.trip_title:
 			return False
 		# Must have either short description or at least one image
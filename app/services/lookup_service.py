@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Dict, Iterable, Mapping, Tuple
 
 from beanie import Document
 
 from app.lookups import LOOKUP_DEFINITIONS, LookupDefinition
 from app.repositories.lookup_repository import LookupRepository
 from app.services.base import BaseService
+from app.util.cache import LRUCache, MISSING, invalidation_bus
+from app.util.functions.conditional import etag_for_content
+from app.util.functions.fast_json import dumps
+
+# lookup type -> (serialized items, ETag). Lookups change rarely; writes through this
+# service invalidate every worker, the TTL bounds staleness from out-of-band edits.
+_versioned_items: LRUCache[tuple] = LRUCache(maxsize=64, ttl=300, name="lookups:items")
+invalidation_bus.register_cache("lookups:items", _versioned_items)
 
 
 class LookupService(BaseService):
@@ -38,6 +46,22 @@ class LookupService(BaseService):
         documents = await repository.list()
         return [self._serialize(doc) for doc in documents]
 
+    async def list_items_versioned(self, lookup_type: str) -> Tuple[list[dict[str, Any]], str]:
+        """Serialized lookup items with a content-hash ETag, served from memory when possible."""
+        cached = _versioned_items.get(lookup_type)
+        if cached is MISSING:
+            items = await self.list_items(lookup_type)
+            cached = (items, etag_for_content(dumps(items)))
+            _versioned_items.set(lookup_type, cached)
+        return cached
+
+    async def get_item_versioned(self, lookup_type: str, item_id: str) -> Tuple[dict[str, Any], str]:
+        items, _ = await self.list_items_versioned(lookup_type)
+        item = next((item for item in items if item["id"] == item_id), None)
+        if item is None:
+            item = await self.get_item(lookup_type, item_id)
+        return item, etag_for_content(dumps(item))
+
     async def get_item(self, lookup_type: str, item_id: str) -> dict[str, Any]:
         repository = self._get_repository(lookup_type)
         document = await repository.get(item_id)
@@ -52,6 +76,7 @@ class LookupService(BaseService):
         payload = dict(data)
         await self._ensure_uniques(definition, repository, payload)
         document = await repository.create(payload)
+        await invalidation_bus.publish("lookups:items", [lookup_type])
         return self._serialize(document)
 
     async def update_item(self, lookup_type: str, item_id: str, data: Mapping[str, Any]) -> dict[str, Any]:
@@ -65,6 +90,7 @@ class LookupService(BaseService):
         payload = dict(data)
         await self._ensure_uniques(definition, repository, payload, current=document)
         updated = await repository.update(document, payload)
+        await invalidation_bus.publish("lookups:items", [lookup_type])
         return self._serialize(updated)
 
     async def _ensure_uniques(
@@ -1,5 +1,6 @@
 """Operator-related business logic for operator profiles (no auth)."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from app.models.operator import Operator
@@ -22,6 +23,8 @@ class OperatorService(BaseService):
 		blocked: Optional[bool] = None,
 		activities_ids: Optional[List[str]] = None,
 		preferred_language_ids: Optional[List[str]] = None,
+		include_total: bool = True,
+		estimate_total: bool = False,
 	) -> List[OperatorOut]:
 		operators = await self.repository.list(
 			page=page,
@@ -29,10 +32,18 @@ class OperatorService(BaseService):
 			verified=verified,
 			blocked=blocked,
 			activities_ids=activities_ids,
-			preferred_language_ids=preferred_language_ids
+			preferred_language_ids=preferred_language_ids,
+			include_total=include_total,
+			estimate_total=estimate_total,
 		)
 		return operators
 
+	async def get_operator_updated_at(self, auth_user_id: str) -> datetime:
+		updated_at = await self.repository.get_updated_at(auth_user_id)
+		if updated_at is None:
+			self._not_found("Operator")
+		return updated_at
+
 	async def get_operator(self, auth_user_id: str) -> OperatorOut:
 		operator = await self.repository.get(auth_user_id)
 		if not operator:
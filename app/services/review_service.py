@@ -0,0 +1,11 @@
+from app.repositories.review_repository import ExperienceReviewRepository
+from app.schemas.review import ReviewListingQuery, ReviewListingResult
+from app.services.base import BaseService
+
+
+class ReviewService(BaseService):
+    def __init__(self, repository: ExperienceReviewRepository | None = None) -> None:
+        self.repository = repository or ExperienceReviewRepository()
+
+    async def list_experience_reviews(self, experience_id: str, query: ReviewListingQuery) -> ReviewListingResult:
+        return await self.repository.list_for_experience(experience_id, query)
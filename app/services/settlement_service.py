@@ -0,0 +1,15 @@
+from app.repositories import get_operator_id_from_auth_id
+from app.repositories.settlement_repository import SettlementRepository
+from app.schemas.settlement import SettlementListingQuery, SettlementListingResult
+from app.services.base import BaseService
+
+
+class SettlementService(BaseService):
+    def __init__(self, repository: SettlementRepository | None = None) -> None:
+        self.repository = repository or SettlementRepository()
+
+    async def list_operator_settlements(self, auth_id: str, query: SettlementListingQuery) -> SettlementListingResult:
+        operator_id = await get_operator_id_from_auth_id(auth_id)
+        if not operator_id:
+            self._unauthorized("Invalid operator authentication")
+        return await self.repository.list_for_operator(operator_id, query)
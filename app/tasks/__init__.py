@@ -1,2 +1,3 @@
 # Import tasks for Celery autodiscovery
 from .base import *
+from .occurrences import *
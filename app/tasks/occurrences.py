@@ -0,0 +1,23 @@
+# Rolling refresh of the materialized occurrence calendar
+import asyncio
+import logging
+
+from app.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+async def _materialize():
+	# Imported here: importing db_init connects, which only the worker should do
+	from app.core.db_init import init_db
+	from app.repositories.occurrence_repository import OccurrenceRepository
+
+	await init_db()
+	return await OccurrenceRepository().materialize()
+
+
+@celery_app.task(name="experiences.materialize_occurrences")
+def materialize_occurrences():
+	stats = asyncio.run(_materialize())
+	logger.info("Occurrence calendar refreshed: %s", stats)
+	return stats
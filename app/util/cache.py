@@ -0,0 +1,172 @@
+"""In-process caching primitives shared by the auth and repository layers.
+
+- ``LRUCache``: bounded, per-worker LRU with optional per-entry TTL and
+  hit/miss counters.
+- ``CacheInvalidationBus``: fans invalidations out to every worker through a
+  Redis pub/sub channel so per-worker copies never outlive a write.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, TypeVar
+import uuid
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# Returned by ``LRUCache.get`` on a miss so that ``None`` can be cached as a value.
+MISSING: Any = object()
+
+_registry: Dict[str, "LRUCache"] = {}
+
+
+class LRUCache(Generic[V]):
+    """Bounded LRU cache with optional expiry, for use from a single event loop."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, name: Optional[str] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[V, Optional[float]]]" = OrderedDict()
+        if name:
+            _registry[name] = self
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            self._data.pop(key, None)
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss counters for every named cache in this worker."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
+
+
+class CacheInvalidationBus:
+    """Broadcasts cache invalidations to every worker over Redis pub/sub.
+
+    Handlers are registered by name. ``publish`` applies the invalidation in
+    this worker immediately, then notifies the others; without Redis it only
+    acts locally.
+    """
+
+    channel = "cache-invalidation"
+
+    def __init__(self) -> None:
+        self._handlers: Dict[str, Callable[[List[str]], None]] = {}
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self._origin = uuid.uuid4().hex
+
+    def register(self, name: str, handler: Callable[[List[str]], None]) -> None:
+        self._handlers[name] = handler
+
+    def register_cache(self, name: str, cache: LRUCache) -> None:
+        """Register an ``LRUCache`` whose entries are dropped by key."""
+
+        def _drop(keys: List[str]) -> None:
+            for key in keys:
+                cache.delete(key)
+
+        self.register(name, _drop)
+
+    def _apply(self, name: str, keys: List[str]) -> None:
+        handler = self._handlers.get(name)
+        if handler is not None:
+            handler(keys)
+
+    async def publish(self, name: str, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        if not keys:
+            return
+        self._apply(name, keys)
+        if self._redis is None:
+            return
+        message = json.dumps({"origin": self._origin, "name": name, "keys": keys})
+        try:
+            await self._redis.publish(self.channel, message)
+        except Exception as exc:
+            logger.warning("Failed to publish cache invalidation for %s: %s", name, exc)
+
+    async def _listen(self) -> None:
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self.channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    payload = json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+                if payload.get("origin") == self._origin:
+                    continue
+                self._apply(payload.get("name", ""), list(payload.get("keys") or []))
+        finally:
+            await pubsub.unsubscribe(self.channel)
+            await pubsub.close()
+
+    async def start(self, redis_client) -> None:
+        self._redis = redis_client
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None and not self._listener.done():
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        self._listener = None
+        self._redis = None
+
+
+invalidation_bus = CacheInvalidationBus()
@@ -5,11 +5,13 @@ import logging
 from typing import Any, Dict, List, Optional, Sequence
 
 import jwt
-from fastapi import Depends, Security
+from fastapi import Depends, Request, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.core.config import settings
 from app.util.error_handling import UnauthorizedError, ForbiddenError
+from app.util.functions.jwks import jwks_store
+from app.util.functions.token_cache import token_cache
 
 logger = logging.getLogger(__name__)
 
@@ -27,26 +29,7 @@ class AuthContext:
     claims: Dict[str, Any]
     name: str
     email: str
-
-
-class _JWKSClientCache:
-    """Simple cache of PyJWKClient instances per JWKS URL.
-
-    PyJWT's PyJWKClient already caches keys in memory; this class just
-    ensures we reuse the client per URL so JWKS is fetched periodically
-    instead of on every request.
-    """
-
-    def __init__(self) -> None:
-        self._clients: Dict[str, jwt.PyJWKClient] = {}
-
-    def get_client(self, jwks_url: str) -> jwt.PyJWKClient:
-        if jwks_url not in self._clients:
-            self._clients[jwks_url] = jwt.PyJWKClient(jwks_url)
-        return self._clients[jwks_url]
-
-
-_jwks_cache = _JWKSClientCache()
+    provider: Optional[str] = None
 
 
 # Bearer auth scheme for OpenAPI/Swagger UI.
@@ -63,10 +46,111 @@ def _extract_bearer_token(credentials: HTTPAuthorizationCredentials | None) -> s
     return credentials.credentials
 
 
-def _decode_with_provider(token: str, provider: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def bearer_token(credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme)) -> str:
+    """FastAPI dependency returning the raw bearer token of the request."""
+    return _extract_bearer_token(credentials)
+
+
+Candidate = tuple[str, Dict[str, Any]]
+
+
+class ProviderRouter:
+    """Routes a token to the providers that can verify it, without trial decodes.
+
+    The issuer table is built once, from the settings object it was built for,
+    and rebuilt only when that object is replaced (or on ``rebuild``).
+    Lookups are memoized per ``(iss, kid)``: several providers may share an
+    issuer in Zitadel, and the ``kid`` narrows them to those whose JWKS holds
+    the key. Providers still sharing the key are ordered by the unverified
+    ``client_id`` and ``aud`` claims, and the caller tries each in turn.
+    """
+
+    def __init__(self) -> None:
+        self._settings: Any = None
+        self._by_issuer: Dict[str, List[Candidate]] = {}
+        self._by_kid: Dict[tuple[str, str], List[Candidate]] = {}
+
+    def rebuild(self, providers: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Build the table from ``providers`` (default: the current settings)."""
+        if providers is None:
+            self._settings = settings
+            providers = settings.zitadel_providers
+        by_issuer: Dict[str, List[Candidate]] = {}
+        for key, provider in providers.items():
+            if provider.get("issuer") and provider.get("jwks_url"):
+                by_issuer.setdefault(provider["issuer"], []).append((key, provider))
+        self._by_issuer = by_issuer
+        self._by_kid = {}
+
+    def _issuer_candidates(self, issuer: str, kid: Optional[str]) -> List[Candidate]:
+        if self._settings is None or self._settings is not settings:
+            self.rebuild()
+        candidates = self._by_issuer.get(issuer, [])
+        if len(candidates) < 2 or not kid:
+            return candidates
+        cached = self._by_kid.get((issuer, kid))
+        if cached is not None:
+            return cached
+        holding = [c for c in candidates if jwks_store.has_key(c[1]["jwks_url"], kid)]
+        if not holding:
+            # Keys not loaded yet, or a rotation: let verification refetch
+            return candidates
+        self._by_kid[(issuer, kid)] = holding
+        return holding
+
+    def route(
+        self,
+        token: str,
+        provider_keys: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Candidate], Optional[str]]:
+        """Return ``([(provider_key, provider), ...], kid)`` for a token without verifying it.
+
+        Candidates are in the order they should be tried. Raises
+        UnauthorizedError for malformed tokens and unknown issuers, so those
+        never reach signature verification.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+            unverified = jwt.decode(token, options={"verify_signature": False})
+        except jwt.InvalidTokenError:
+            raise UnauthorizedError("Malformed JWT")
+
+        kid = header.get("kid")
+        candidates = self._issuer_candidates(unverified.get("iss") or "", kid)
+        if not candidates:
+            raise UnauthorizedError("JWT issuer is not a configured provider")
+        if provider_keys:
+            candidates = [candidate for candidate in candidates if candidate[0] in provider_keys]
+            if not candidates:
+                raise UnauthorizedError("JWT issuer is not accepted for this resource")
+
+        if len(candidates) > 1:
+            client_id = unverified.get("client_id")
+            audiences = unverified.get("aud") or []
+            if isinstance(audiences, str):
+                audiences = [audiences]
+
+            def rank(candidate: Candidate) -> int:
+                provider = candidate[1]
+                if provider.get("client_id") and provider["client_id"] == client_id:
+                    return 0
+                if provider.get("audience") and provider["audience"] in audiences:
+                    return 1
+                return 2
+
+            candidates = sorted(candidates, key=rank)
+        return candidates, kid
+
+
+provider_router = ProviderRouter()
+
+
+async def _decode_with_provider(token: str, provider: Dict[str, Any], kid: Optional[str]) -> Optional[Dict[str, Any]]:
     """Try to decode and verify a JWT for a single provider.
 
-    Returns the decoded claims if successful, otherwise None.
+    The signing key comes from the per-worker JWKS store, so no network I/O
+    happens on the event loop here. Returns the decoded claims if successful,
+    otherwise None.
     """
 
     issuer = provider.get("issuer")
@@ -76,12 +160,9 @@ def _decode_with_provider(token: str, provider: Dict[str, Any]) -> Optional[Dict
     if not issuer or not jwks_url:
         return None
 
-    jwks_client = _jwks_cache.get_client(jwks_url)
-
-    try:
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
-    except Exception as e:
-        logger.debug(f"Failed to get signing key from JWKS: {e}")
+    signing_key = await jwks_store.get_signing_key(jwks_url, kid)
+    if signing_key is None:
+        logger.debug(f"No signing key for kid {kid!r} in JWKS {jwks_url}")
         return None
 
     algorithms: List[str] = []
@@ -107,35 +188,22 @@ def _decode_with_provider(token: str, provider: Dict[str, Any]) -> Optional[Dict
         return None
 
 
-def _decode_and_verify_token(
-    token: str,
-    provider_keys: Optional[Sequence[str]] = None,
-    allowed_client_ids: Optional[Sequence[str]] = None,
-) -> AuthContext:
-    """Decode and verify a JWT against one or more configured providers.
+async def _verify_token(token: str, provider_keys: Optional[Sequence[str]] = None) -> AuthContext:
+    """Verify a JWT's signature and required claims.
 
-    If ``provider_keys`` is given, only those providers are tried. Otherwise all
-    providers in ``settings.zitadel_providers`` are considered.
+    The token is routed by its unverified issuer, ``kid`` and claims to its
+    candidate providers (restricted to ``provider_keys`` when given). Usually
+    that is one provider; when an issuer is shared and the claims do not
+    decide, each candidate is tried in order.
     """
 
-    providers_map = settings.zitadel_providers
-    if provider_keys:
-        providers = [providers_map[key] for key in provider_keys if key in providers_map]
-    else:
-        providers = list(providers_map.values())
-
-    claims: Optional[Dict[str, Any]] = None
-    matched_provider: Optional[Dict[str, Any]] = None
-
-    # Try the selected providers until one successfully validates the token.
-    for provider in providers:
-        claims = _decode_with_provider(token, provider)
+    candidates, kid = provider_router.route(token, provider_keys)
+    for matched_key, matched_provider in candidates:
+        claims = await _decode_with_provider(token, matched_provider, kid)
         if claims is not None:
-            matched_provider = provider
             break
-
-    if claims is None or matched_provider is None:
-        raise UnauthorizedError("Failed to validate JWT for any configured provider")
+    else:
+        raise UnauthorizedError("Failed to validate JWT for the configured provider")
 
     issuer = claims.get("iss")
     user_id = claims.get("sub")
@@ -151,10 +219,67 @@ def _decode_and_verify_token(
     if configured_client_id and configured_client_id != client_id:
         raise UnauthorizedError("Token client_id does not match configured application")
 
-    if allowed_client_ids is not None and client_id not in allowed_client_ids:
+    return AuthContext(
+        user_id=user_id,
+        client_id=client_id,
+        issuer=issuer,
+        claims=claims,
+        name=name,
+        email=email,
+        provider=matched_key,
+    )
+
+
+async def _decode_and_verify_token(
+    token: str,
+    provider_keys: Optional[Sequence[str]] = None,
+    allowed_client_ids: Optional[Sequence[str]] = None,
+) -> AuthContext:
+    """Return the verified ``AuthContext`` for a token, reusing cached verifications.
+
+    A cached context is only reused when it was verified by one of the
+    requested providers; otherwise the token goes through full verification.
+    Revoked tokens are rejected by the cache lookup.
+    """
+
+    context = await token_cache.get(token)
+    if context is None or (provider_keys and context.provider not in provider_keys):
+        context = await _verify_token(token, provider_keys)
+        await token_cache.set(token, context)
+
+    _check_client(context, allowed_client_ids)
+    return context
+
+
+def _check_client(context: AuthContext, allowed_client_ids: Optional[Sequence[str]]) -> None:
+    if allowed_client_ids is not None and context.client_id not in allowed_client_ids:
         raise ForbiddenError("Client is not allowed to access this resource")
 
-    return AuthContext(user_id=user_id, client_id=client_id, issuer=issuer, claims=claims, name=name, email=email)
+
+def get_request_auth(request: Request) -> Optional[AuthContext]:
+    """Return the AuthContext already verified for this request, if any."""
+    return getattr(request.state, "auth_context", None)
+
+
+async def authenticate_request(
+    request: Request,
+    token: str,
+    provider_keys: Optional[Sequence[str]] = None,
+    allowed_client_ids: Optional[Sequence[str]] = None,
+) -> AuthContext:
+    """Verify the request's token once and memoize the result on ``request.state``.
+
+    Every auth dependency and role check stacked on the same request reuses the
+    stored context; only the cheap provider/client checks run again.
+    """
+
+    context = get_request_auth(request)
+    if context is None or (provider_keys and context.provider not in provider_keys):
+        context = await _decode_and_verify_token(token, provider_keys=provider_keys)
+        request.state.auth_context = context
+
+    _check_client(context, allowed_client_ids)
+    return context
 
 
 def require_zitadel_client(
@@ -167,6 +292,7 @@ def require_zitadel_client(
     - Verifies signature against the configured JWKS URL.
     - Enforces issuer and (optional) audience from settings.zitadel_providers.
     - Optionally restricts access to a set of allowed client_ids.
+    - Verifies the token at most once per request (see ``authenticate_request``).
 
     Usage in a router::
 
@@ -185,11 +311,13 @@ def require_zitadel_client(
             ...
     """
 
-    def _dependency(
+    async def _dependency(
+        request: Request,
         credentials: HTTPAuthorizationCredentials | None = Security(_bearer_scheme),
     ) -> AuthContext:
         token = _extract_bearer_token(credentials)
-        return _decode_and_verify_token(
+        return await authenticate_request(
+            request,
             token,
             provider_keys=provider_keys,
             allowed_client_ids=allowed_client_ids,
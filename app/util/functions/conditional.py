@@ -0,0 +1,80 @@
+"""HTTP conditional GET helpers (ETag / Last-Modified / 304).
+
+Routes compute a validator cheaply (a projected ``updated_at`` or a content
+hash), answer ``304 Not Modified`` when the client's copy is current, and
+otherwise attach the validators and ``Cache-Control`` to the full response.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Cache-Control policies used by the routes
+PUBLIC_REVALIDATE = "public, max-age=30, must-revalidate"
+PRIVATE_REVALIDATE = "private, no-cache"
+# Reference data that changes rarely (lookups)
+PUBLIC_REFERENCE = "public, max-age=300"
+
+
+def _to_millis(value: datetime) -> datetime:
+    # Mongo stores milliseconds; trim so in-memory and stored timestamps agree.
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def etag_for_version(*parts: object) -> str:
+    """Strong ETag from identifying parts such as ``(id, updated_at)``."""
+    normalized = [_to_millis(part).isoformat() if isinstance(part, datetime) else str(part) for part in parts]
+    return '"' + hashlib.sha1(":".join(normalized).encode("utf-8")).hexdigest() + '"'
+
+
+def etag_for_content(body: bytes) -> str:
+    """Strong ETag from the serialized representation itself."""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Stored timestamps are naive UTC (datetime.utcnow()).
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match, falling back to If-Modified-Since (RFC 9110 13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: a W/ prefix on the client's tag does not prevent a match.
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have one-second resolution
+        return _as_utc(last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime], cache_control: str) -> dict:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(etag: str, last_modified: Optional[datetime], cache_control: str) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified, cache_control))
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime], cache_control: str) -> None:
+    response.headers.update(_validator_headers(etag, last_modified, cache_control))
@@ -0,0 +1,32 @@
+"""Opaque pagination cursors.
+
+A cursor is URL-safe base64 of Extended JSON, so datetimes and ObjectIds
+survive the round trip with their BSON types and can be used directly in
+keyset predicates.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from typing import Any, Dict
+
+from bson import json_util
+
+from app.util.error_handling import BadRequestError
+
+
+def encode_cursor(payload: Dict[str, Any]) -> str:
+    raw = json_util.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json_util.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise BadRequestError("Invalid pagination cursor")
+    if not isinstance(payload, dict):
+        raise BadRequestError("Invalid pagination cursor")
+    return payload
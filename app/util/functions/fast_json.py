@@ -0,0 +1,54 @@
+"""JSON responses for hot read paths that skip response-model validation.
+
+Listing repositories build their output from raw BSON dicts that already have
+the response shape. ``FastJSONResponse`` serializes them directly (with orjson
+when it is installed), so FastAPI does not validate and re-encode every item a
+second time. Pydantic models inside the content are dumped field by field,
+which also covers models created with ``model_construct``.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from enum import Enum
+import json
+from typing import Any
+
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        fields = type(obj).model_fields
+        return {
+            name: value
+            for name, value in vars(obj).items()
+            if not (name in fields and fields[name].exclude)
+        }
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,117 @@
+"""Streaming serializers for experience instance exports.
+
+Both take an async iterator of compact instance dicts and yield encoded
+chunks as items arrive, so a ``StreamingResponse`` sends the first item as
+soon as it is read and never holds the whole export. Items after the first
+are buffered up to ``FLUSH_BYTES`` per chunk to keep the number of ASGI
+sends low.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional
+
+from app.util.functions.fast_json import dumps
+
+FLUSH_BYTES = 64 * 1024
+
+# Product identifier written in exported calendars
+ICS_PRODID = "-//Pica-Bo//Experience calendar//EN"
+ICS_UID_DOMAIN = "pica-bo"
+
+
+async def _chunked(parts: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buffer, size, first = [], 0, True
+    async for part in parts:
+        if first:
+            first = False
+            yield part
+            continue
+        buffer.append(part)
+        size += len(part)
+        if size >= FLUSH_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+async def ndjson(items: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """One JSON object per line."""
+    async def lines():
+        async for item in items:
+            yield dumps(item) + b"\n"
+
+    async for chunk in _chunked(lines()):
+        yield chunk
+
+
+def _ics_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_time(value: datetime) -> str:
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _fold(line: str) -> bytes:
+    """Fold a content line at 75 octets (RFC 5545 3.1) without splitting UTF-8 sequences."""
+    raw = line.encode("utf-8")
+    if len(raw) <= 75:
+        return raw + b"\r\n"
+    out, start, limit = [], 0, 75
+    while start < len(raw):
+        end = min(start + limit, len(raw))
+        while end < len(raw) and (raw[end] & 0xC0) == 0x80:
+            end -= 1
+        out.append(raw[start:end])
+        start, limit = end, 74
+    return b"\r\n ".join(out) + b"\r\n"
+
+
+def _lines(lines: Iterable[str]) -> bytes:
+    return b"".join(_fold(line) for line in lines)
+
+
+def _event(item: dict, stamp: str) -> bytes:
+    date: datetime = item["date"]
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{item.get('experience_id') or 'instance'}-{_ics_time(date)}@{ICS_UID_DOMAIN}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{_ics_time(date)}",
+        f"SUMMARY:{_ics_text(item.get('trip_title') or '')}",
+        f"STATUS:{'CANCELLED' if item.get('status') == 'cancelled' else 'CONFIRMED'}",
+        f"DESCRIPTION:Booked: {item.get('booked_count') or 0}\\, available: {_count(item.get('available_count'))}",
+    ]
+    coordinates = (item.get("location") or {}).get("coordinates")
+    if coordinates and len(coordinates) == 2:
+        # GeoJSON is [lng, lat]; GEO is lat;lng
+        lines.append(f"GEO:{coordinates[1]};{coordinates[0]}")
+    lines.append("END:VEVENT")
+    return _lines(lines)
+
+
+def _count(value: Optional[int]) -> str:
+    return "unlimited" if value is None else str(value)
+
+
+async def ics(items: AsyncIterator[dict], name: str) -> AsyncIterator[bytes]:
+    """An iCalendar document with one VEVENT per instance, times in UTC."""
+    stamp = _ics_time(datetime.utcnow())
+
+    async def parts():
+        yield _lines([
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{ICS_PRODID}",
+            "CALSCALE:GREGORIAN",
+            f"X-WR-CALNAME:{_ics_text(name)}",
+        ])
+        async for item in items:
+            yield _event(item, stamp)
+        yield _lines(["END:VCALENDAR"])
+
+    async for chunk in _chunked(parts()):
+        yield chunk
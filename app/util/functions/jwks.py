@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import random
+import time
+from typing import Dict, Iterable, Optional
+
+import jwt
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _KeySet:
+    """Signing keys currently known for a single JWKS URL."""
+
+    jwks_url: str
+    keys: Dict[str, jwt.PyJWK] = field(default_factory=dict)
+    fetched_at: float = 0.0
+    last_forced_refresh: float = 0.0
+    inflight: Optional[asyncio.Task] = None
+    refresher: Optional[asyncio.Task] = None
+
+
+class JWKSKeyStore:
+    """Asyncio-native, per-worker store of JWKS signing keys.
+
+    Keys are prefetched at startup and refreshed by a background task before
+    they go stale, so resolving a key on the request path is a dictionary
+    lookup. The HTTP fetch itself runs in a worker thread and never blocks the
+    event loop. While a refresh is running the previous keys keep being served.
+
+    An unknown ``kid`` (key rotation) triggers an out-of-band refresh, at most
+    once per ``min_refetch_interval`` seconds per URL, so a flood of tokens with
+    bogus ``kid`` values cannot turn into a flood of JWKS requests.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 300.0,
+        min_refetch_interval: float = 30.0,
+        fetch_timeout: float = 5.0,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.min_refetch_interval = min_refetch_interval
+        self.fetch_timeout = fetch_timeout
+        self._sets: Dict[str, _KeySet] = {}
+
+    def _key_set(self, jwks_url: str) -> _KeySet:
+        key_set = self._sets.get(jwks_url)
+        if key_set is None:
+            key_set = self._sets[jwks_url] = _KeySet(jwks_url=jwks_url)
+        return key_set
+
+    def _fetch_sync(self, jwks_url: str) -> Dict[str, jwt.PyJWK]:
+        client = jwt.PyJWKClient(jwks_url, cache_jwk_set=False, cache_keys=False, timeout=self.fetch_timeout)
+        jwk_set = jwt.PyJWKSet.from_dict(client.fetch_data())
+        return {key.key_id: key for key in jwk_set.keys if key.key_id}
+
+    async def _refresh(self, key_set: _KeySet) -> None:
+        keys = await asyncio.to_thread(self._fetch_sync, key_set.jwks_url)
+        key_set.keys = keys
+        key_set.fetched_at = time.monotonic()
+        logger.info("Loaded %d signing keys from %s", len(keys), key_set.jwks_url)
+
+    def _schedule_refresh(self, key_set: _KeySet) -> asyncio.Task:
+        """Return the in-flight refresh for ``key_set``, starting one if needed."""
+        if key_set.inflight is None or key_set.inflight.done():
+            key_set.inflight = asyncio.get_running_loop().create_task(self._refresh(key_set))
+        return key_set.inflight
+
+    async def _refresh_loop(self, key_set: _KeySet) -> None:
+        delay = self.refresh_interval
+        while True:
+            # Jitter so workers started together do not refetch in lockstep.
+            await asyncio.sleep(delay * random.uniform(0.8, 0.95))
+            try:
+                await self._schedule_refresh(key_set)
+                delay = self.refresh_interval
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("JWKS refresh failed for %s, serving stale keys: %s", key_set.jwks_url, exc)
+                delay = min(self.refresh_interval, self.min_refetch_interval)
+
+    async def start(self, jwks_urls: Iterable[str]) -> None:
+        """Prefetch every JWKS URL and start the background refresh tasks."""
+        key_sets = [self._key_set(url) for url in dict.fromkeys(url for url in jwks_urls if url)]
+        results = await asyncio.gather(
+            *(self._schedule_refresh(key_set) for key_set in key_sets),
+            return_exceptions=True,
+        )
+        for key_set, result in zip(key_sets, results):
+            if isinstance(result, Exception):
+                logger.warning("Initial JWKS fetch failed for %s: %s", key_set.jwks_url, result)
+            if key_set.refresher is None or key_set.refresher.done():
+                key_set.refresher = asyncio.get_running_loop().create_task(self._refresh_loop(key_set))
+
+    async def stop(self) -> None:
+        tasks = []
+        for key_set in self._sets.values():
+            for task in (key_set.refresher, key_set.inflight):
+                if task is not None and not task.done():
+                    task.cancel()
+                    tasks.append(task)
+            key_set.refresher = None
+            key_set.inflight = None
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def has_key(self, jwks_url: str, kid: str) -> bool:
+        """Whether ``kid`` is among the keys currently loaded for ``jwks_url``."""
+        key_set = self._sets.get(jwks_url)
+        return key_set is not None and kid in key_set.keys
+
+    async def get_signing_key(self, jwks_url: str, kid: Optional[str]) -> Optional[jwt.PyJWK]:
+        """Resolve the signing key for ``kid`` without blocking the event loop.
+
+        Returns None when the key is unknown and a refetch is not allowed yet.
+        """
+        if not kid:
+            return None
+
+        key_set = self._key_set(jwks_url)
+        key = key_set.keys.get(kid)
+        if key is not None:
+            return key
+
+        inflight = key_set.inflight
+        if inflight is None or inflight.done():
+            now = time.monotonic()
+            if key_set.last_forced_refresh and now - key_set.last_forced_refresh < self.min_refetch_interval:
+                return None
+            key_set.last_forced_refresh = now
+            inflight = self._schedule_refresh(key_set)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(inflight), timeout=self.fetch_timeout)
+        except Exception as exc:
+            logger.debug("On-demand JWKS refresh for %s failed: %s", jwks_url, exc)
+        return key_set.keys.get(kid)
+
+
+# Per-worker store shared by all auth dependencies; started from the app lifespan.
+jwks_store = JWKSKeyStore(
+    refresh_interval=settings.jwks_refresh_interval_seconds,
+    min_refetch_interval=settings.jwks_min_refetch_interval_seconds,
+    fetch_timeout=settings.jwks_fetch_timeout_seconds,
+)
@@ -0,0 +1,325 @@
+"""Expansion of an experience's ``recurring_pattern`` into occurrence datetimes.
+
+Patterns are RFC 5545 RRULE strings evaluated in the experience's timezone
+from its ``start_date``. Occurrences are returned as naive UTC datetimes, the
+form Mongo stores and the occurrence calendar is keyed by.
+
+Callers that know the experience pass ``key=(experience id, updated_at)``:
+the parsed rule and resolved timezone are then kept per worker under
+``(id, updated_at, timezone)``, along with the occurrences of the windows
+asked for, so an unchanged experience is parsed once and a repeated window
+is not re-expanded. An edit bumps ``updated_at``, so stale entries are never
+read and simply age out.
+
+Plain ``DAILY``, ``WEEKLY`` (``BYDAY``) and ``MONTHLY`` (``BYMONTHDAY``)
+rules with an ``INTERVAL`` are expanded with NumPy instead of dateutil's
+per-occurrence iterator; ``expand_many`` does so for a whole batch of
+experiences at once. Anything else (``COUNT``, ``UNTIL``, ``BYSETPOS``, ...)
+goes through ``rrulestr``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from dateutil.rrule import rrulestr
+import numpy as np
+import pendulum
+
+from app.core.config import settings
+from app.util.cache import MISSING, LRUCache
+
+# Default window when the caller gives no end
+DEFAULT_WINDOW_DAYS = 90
+
+_DAILY, _WEEKLY, _MONTHLY = 0, 1, 2
+_FREQUENCIES = {"DAILY": _DAILY, "WEEKLY": _WEEKLY, "MONTHLY": _MONTHLY}
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_US_PER_DAY = 86_400_000_000
+
+
+class SimpleRule(NamedTuple):
+    """The RRULE subset expanded with NumPy; empty ``weekdays``/``monthdays`` default to the start's."""
+
+    freq: int
+    interval: int
+    weekdays: Tuple[int, ...]
+    monthdays: Tuple[int, ...]
+
+
+def parse_simple(pattern: str) -> Optional[SimpleRule]:
+    """``pattern`` as a ``SimpleRule``, or None when it needs the generic parser."""
+    body = pattern.strip().upper()
+    if body.startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+    if not body or any(c in body for c in "\n\r:"):
+        return None
+    parts: Dict[str, str] = {}
+    for part in body.strip(";").split(";"):
+        name, sep, value = part.partition("=")
+        if not sep or name in parts:
+            return None
+        parts[name] = value
+
+    freq = _FREQUENCIES.get(parts.pop("FREQ", ""))
+    if freq is None:
+        return None
+    try:
+        interval = int(parts.pop("INTERVAL", "1"))
+    except ValueError:
+        return None
+    # WKST only changes which days share a week when weeks are skipped
+    if parts.pop("WKST", "MO") != "MO" or interval < 1:
+        return None
+
+    weekdays: Tuple[int, ...] = ()
+    monthdays: Tuple[int, ...] = ()
+    if "BYDAY" in parts and freq == _WEEKLY:
+        codes = parts.pop("BYDAY").split(",")
+        if not all(code in _WEEKDAYS for code in codes):
+            return None
+        weekdays = tuple(sorted({_WEEKDAYS[code] for code in codes}))
+    if "BYMONTHDAY" in parts and freq == _MONTHLY:
+        try:
+            monthdays = tuple(sorted({int(day) for day in parts.pop("BYMONTHDAY").split(",")}))
+        except ValueError:
+            return None
+        if not all(1 <= day <= 31 for day in monthdays):
+            return None
+    if parts:
+        return None
+    return SimpleRule(freq, interval, weekdays, monthdays)
+
+
+class CompiledRecurrence:
+    """A parsed rule with its start resolved in the experience's timezone.
+
+    ``simple`` is set for rules the vectorized engine handles, ``rule`` for
+    the rest; both are None when the pattern cannot be parsed.
+    """
+
+    __slots__ = ("rule", "simple", "start", "tz")
+
+    def __init__(self, pattern: str, start_date: datetime, tz: str) -> None:
+        self.tz = tz
+        self.start = _in_timezone(start_date, tz)
+        self.rule = None
+        self.simple = parse_simple(pattern)
+        if self.simple is None:
+            try:
+                self.rule = rrulestr(pattern, dtstart=self.start)
+            except Exception:
+                self.rule = None
+
+    def bounds(self, window_start: Optional[datetime], window_end: Optional[datetime]) -> Tuple[datetime, datetime]:
+        """The window as naive UTC, defaulted from the start like ``expand`` documents."""
+        ws = _to_utc_naive(window_start) if window_start is not None else _to_utc_naive(self.start)
+        we = _to_utc_naive(window_end) if window_end is not None else _to_utc_naive(self.start + timedelta(days=DEFAULT_WINDOW_DAYS))
+        return ws, we
+
+    def between(self, window_start: Optional[datetime], window_end: Optional[datetime]) -> Tuple[datetime, ...]:
+        if self.simple is not None:
+            ws, we = self.bounds(window_start, window_end)
+            return tuple(_expand_simple([self], [ws], [we])[0].tolist())
+        if self.rule is None:
+            return ()
+        ws = _in_timezone(window_start, self.tz) if window_start is not None else self.start
+        we = _in_timezone(window_end, self.tz) if window_end is not None else self.start + timedelta(days=DEFAULT_WINDOW_DAYS)
+        try:
+            return tuple(_to_utc_naive(occurrence) for occurrence in self.rule.between(ws, we, inc=True))
+        except Exception:
+            return ()
+
+
+# (id, updated_at, timezone) -> CompiledRecurrence
+_compiled: LRUCache[CompiledRecurrence] = LRUCache(maxsize=settings.recurrence_cache_size, name="recurrence:rules")
+
+# (id, updated_at, timezone, window start, window end) -> occurrences
+_windows: LRUCache[Tuple[datetime, ...]] = LRUCache(maxsize=settings.recurrence_window_cache_size, name="recurrence:windows")
+
+
+def _in_timezone(value: datetime, tz: str):
+    try:
+        return pendulum.instance(value).in_timezone(tz)
+    except Exception:
+        # Unknown timezone names fall back to the naive value read as UTC
+        return pendulum.instance(value)
+
+
+def _to_utc_naive(value: datetime) -> datetime:
+    # The wall time's own offset: a time skipped by a DST gap keeps the offset
+    # from before the gap (RFC 5545 3.3.5) instead of being normalized first.
+    offset = value.utcoffset()
+    value = datetime(value.year, value.month, value.day, value.hour, value.minute, value.second, value.microsecond)
+    return value - offset if offset is not None else value
+
+
+def compiled_rule(pattern: str, start_date: datetime, tz: str, key: Optional[Tuple[Hashable, Any]] = None) -> CompiledRecurrence:
+    """The compiled rule, from the worker cache when ``key`` identifies the experience version."""
+    if key is None or key[0] is None:
+        return CompiledRecurrence(pattern, start_date, tz)
+    cache_key = (str(key[0]), key[1], tz)
+    compiled = _compiled.get(cache_key)
+    if compiled is MISSING:
+        compiled = CompiledRecurrence(pattern, start_date, tz)
+        _compiled.set(cache_key, compiled)
+    return compiled
+
+
+def expand(
+    pattern: Optional[str],
+    start_date: Any,
+    tz: Optional[str] = "UTC",
+    window_start: Optional[datetime] = None,
+    window_end: Optional[datetime] = None,
+    key: Optional[Tuple[Hashable, Any]] = None,
+) -> List[datetime]:
+    """Occurrences of ``pattern`` within ``[window_start, window_end]``, inclusive.
+
+    The window defaults to ``DEFAULT_WINDOW_DAYS`` from the first occurrence.
+    Patterns that cannot be parsed expand to nothing. ``key`` is
+    ``(experience id, updated_at)`` and enables the worker cache.
+    """
+    if not pattern or not start_date:
+        return []
+    if not isinstance(start_date, datetime):
+        start_date = datetime(start_date.year, start_date.month, start_date.day)
+    tz = tz or "UTC"
+    if key is None or key[0] is None:
+        return list(CompiledRecurrence(pattern, start_date, tz).between(window_start, window_end))
+
+    window_key = (str(key[0]), key[1], tz, window_start, window_end)
+    occurrences = _windows.get(window_key)
+    if occurrences is MISSING:
+        occurrences = compiled_rule(pattern, start_date, tz, key).between(window_start, window_end)
+        _windows.set(window_key, occurrences)
+    return list(occurrences)
+
+
+def _utc_offsets(zone: tzinfo, days: np.ndarray, tod_us: int) -> np.ndarray:
+    """UTC offset (us) of the wall time ``tod_us`` on each local day, as dateutil resolves it."""
+    if zone.utcoffset(None) == timedelta(0) and getattr(zone, "name", "UTC") == "UTC":
+        return np.zeros(len(days), dtype=np.int64)
+    seconds, us = divmod(tod_us, 1_000_000)
+    hour, rest = divmod(seconds, 3600)
+    minute, second = divmod(rest, 60)
+    return np.fromiter(
+        (
+            datetime(day.year, day.month, day.day, hour, minute, second, us, tzinfo=zone).utcoffset() // timedelta(microseconds=1)
+            for day in days.astype(object)
+        ),
+        dtype=np.int64,
+        count=len(days),
+    )
+
+
+def _expand_simple(
+    compiled: Sequence[CompiledRecurrence], window_starts: Sequence[datetime], window_ends: Sequence[datetime]
+) -> List[np.ndarray]:
+    """Occurrences (``datetime64[us]``, naive UTC) of simple rules, one array per rule.
+
+    Every rule is evaluated against the same grid of local days covering all
+    windows, so the batch costs a handful of array operations rather than a
+    Python loop per occurrence.
+    """
+    n = len(compiled)
+    if n == 0:
+        return []
+    ws = np.array(window_starts, dtype="datetime64[us]").astype(np.int64)
+    we = np.array(window_ends, dtype="datetime64[us]").astype(np.int64)
+
+    # Local days can differ from UTC days by at most a day either way
+    first_day = int(ws.min() // _US_PER_DAY) - 1
+    last_day = int(we.max() // _US_PER_DAY) + 1
+    if last_day < first_day:
+        return [np.array([], dtype="datetime64[us]") for _ in compiled]
+    day_numbers = np.arange(first_day, last_day + 1, dtype=np.int64)
+    days = day_numbers.astype("datetime64[D]")
+    weekday = (day_numbers + 3) % 7  # 1970-01-01 was a Thursday
+    week = (day_numbers + 3) // 7
+    months = days.astype("datetime64[M]")
+    month = months.astype(np.int64)
+    monthday = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+
+    start_day = np.empty(n, dtype=np.int64)
+    tod = np.empty(n, dtype=np.int64)
+    interval = np.empty(n, dtype=np.int64)
+    freq = np.empty(n, dtype=np.int64)
+    weekday_mask = np.zeros((n, 7), dtype=bool)
+    monthday_mask = np.zeros((n, 32), dtype=bool)
+    zones: Dict[Tuple[str, int], int] = {}
+    zone_of = np.empty(n, dtype=np.int64)
+    zone_objects: List[Tuple[tzinfo, int]] = []
+    for i, item in enumerate(compiled):
+        start, rule = item.start, item.simple
+        local_day = np.datetime64(start.date(), "D").astype(np.int64)
+        start_day[i] = local_day
+        tod[i] = ((start.hour * 60 + start.minute) * 60 + start.second) * 1_000_000 + start.microsecond
+        interval[i] = rule.interval
+        freq[i] = rule.freq
+        weekday_mask[i, list(rule.weekdays or (start.weekday(),))] = True
+        monthday_mask[i, list(rule.monthdays or (start.day,))] = True
+        zone_key = (getattr(start.tzinfo, "name", None) or str(start.tzinfo), int(tod[i]))
+        if zone_key not in zones:
+            zones[zone_key] = len(zone_objects)
+            zone_objects.append((start.tzinfo, int(tod[i])))
+        zone_of[i] = zones[zone_key]
+
+    since_start = day_numbers[None, :] - start_day[:, None]
+    mask = since_start >= 0
+    is_daily = (freq == _DAILY)[:, None]
+    is_weekly = (freq == _WEEKLY)[:, None]
+    is_monthly = (freq == _MONTHLY)[:, None]
+    step = interval[:, None]
+    daily = since_start % step == 0
+    weekly = weekday_mask[:, weekday] & ((week[None, :] - ((start_day + 3) // 7)[:, None]) % step == 0)
+    start_month = start_day.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    monthly = monthday_mask[:, monthday] & ((month[None, :] - start_month[:, None]) % step == 0)
+    mask &= (is_daily & daily) | (is_weekly & weekly) | (is_monthly & monthly)
+
+    rows, cols = np.nonzero(mask)
+    offsets = np.stack([_utc_offsets(zone, days, zone_tod) for zone, zone_tod in zone_objects])
+    utc = day_numbers[cols] * _US_PER_DAY + tod[rows] - offsets[zone_of[rows], cols]
+    keep = (utc >= ws[rows]) & (utc <= we[rows])
+    rows, utc = rows[keep], utc[keep].astype("datetime64[us]")
+    return np.split(utc, np.searchsorted(rows, np.arange(1, n)))
+
+
+def expand_many(
+    rules: Sequence[Tuple[Optional[str], Any, Optional[str]]],
+    window_start: datetime,
+    window_end: datetime,
+    keys: Optional[Sequence[Optional[Tuple[Hashable, Any]]]] = None,
+) -> List[np.ndarray]:
+    """``expand`` for a batch of ``(pattern, start_date, tz)``, as ``datetime64[us]`` arrays of naive UTC.
+
+    ``keys`` holds each rule's ``(experience id, updated_at)``, as for
+    ``expand``, so compiled rules come from the worker cache. Simple rules are
+    expanded together in one vectorized pass; the others go through ``expand``
+    one by one, which also caches their windows.
+    """
+    results: List[Optional[np.ndarray]] = [None] * len(rules)
+    simple: List[int] = []
+    compiled: List[CompiledRecurrence] = []
+    for i, (pattern, start_date, tz) in enumerate(rules):
+        if not pattern or not start_date:
+            results[i] = np.array([], dtype="datetime64[us]")
+            continue
+        if not isinstance(start_date, datetime):
+            start_date = datetime(start_date.year, start_date.month, start_date.day)
+        key = keys[i] if keys is not None else None
+        item = compiled_rule(pattern, start_date, tz or "UTC", key)
+        if item.simple is None:
+            occurrences = expand(pattern, start_date, tz, window_start, window_end, key)
+            results[i] = np.array(occurrences, dtype="datetime64[us]")
+        else:
+            simple.append(i)
+            compiled.append(item)
+
+    if compiled:
+        ws, we = _to_utc_naive(window_start), _to_utc_naive(window_end)
+        expanded = _expand_simple(compiled, [ws] * len(compiled), [we] * len(compiled))
+        for i, occurrences in zip(simple, expanded):
+            results[i] = occurrences
+    return results
@@ -1,5 +1,5 @@
 from fastapi import Depends, HTTPException, status
-from app.util.functions.auth import AuthContext, operator_auth
+from app.util.functions.auth import AuthContext, operator_auth, explorer_auth, internal_service_auth
 from app.core.config import settings
 
 operator_auth_application_id = settings.zitadel_operator_client_id
@@ -7,9 +7,12 @@ explorer_auth_application_id = settings.zitadel_explorer_client_id
 user_auth_application_id = settings.internal_service_client_id
 
 
-# Utility to check client_id for role
+# Utility to check client_id for role.
+# Each check builds on the request-scoped AuthContext, so stacking several of
+# them (or repeating one in `dependencies=[...]` and as a parameter) still
+# verifies the token only once per request.
 
-def require_operator(current_auth: AuthContext = Depends(operator_auth)):
+async def require_operator(current_auth: AuthContext = Depends(operator_auth)):
     if current_auth.client_id != operator_auth_application_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -17,7 +20,7 @@ def require_operator(current_auth: AuthContext = Depends(operator_auth)):
         )
     return current_auth
 
-def require_explorer(current_auth: AuthContext = Depends(operator_auth)):
+async def require_explorer(current_auth: AuthContext = Depends(explorer_auth)):
     if current_auth.client_id != explorer_auth_application_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -25,7 +28,7 @@ def require_explorer(current_auth: AuthContext = Depends(operator_auth)):
         )
     return current_auth
 
-def require_user(current_auth: AuthContext = Depends(operator_auth)):
+async def require_user(current_auth: AuthContext = Depends(internal_service_auth)):
     if current_auth.client_id != user_auth_application_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
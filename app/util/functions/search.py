@@ -0,0 +1,66 @@
+"""Search-as-you-type terms for the experience prefix index.
+
+Each indexed word contributes its edge n-grams (``"kay"``, ``"kaya"``, ...)
+so a prefix is an exact multikey lookup, plus single-deletion variants of its
+short prefixes, marked with ``~``, for typo tolerance: a query prefix and an
+indexed prefix that share a deletion variant are within one edit of each other.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Iterable, List, Set
+
+MIN_PREFIX = 2
+MAX_PREFIX = 15
+# Prefix lengths that also get typo-tolerant variants
+MIN_FUZZY = 4
+MAX_FUZZY = 8
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, accent-folded words of ``text``."""
+    folded = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode("ascii")
+    return _WORD.findall(folded.lower())
+
+
+def _deletions(word: str) -> Set[str]:
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def _fuzzy_keys(prefix: str) -> Set[str]:
+    return {"~" + variant for variant in _deletions(prefix) | {prefix}}
+
+
+def index_terms(texts: Iterable[str]) -> List[str]:
+    """Terms stored on a document for the given searchable texts."""
+    terms: Set[str] = set()
+    for text in texts:
+        for word in tokenize(text):
+            word = word[:MAX_PREFIX]
+            for length in range(MIN_PREFIX, len(word) + 1):
+                terms.add(word[:length])
+            for length in range(MIN_FUZZY, min(len(word), MAX_FUZZY) + 1):
+                terms.update(_fuzzy_keys(word[:length]))
+    return sorted(terms)
+
+
+def query_terms(search: str) -> List[List[str]]:
+    """Alternatives per query word; a document must match one term of every word.
+
+    Words shorter than ``MIN_PREFIX`` are ignored. The first alternative is
+    always the exact prefix, which ranking uses to prefer exact over fuzzy hits.
+    """
+    groups = []
+    for word in tokenize(search):
+        if len(word) < MIN_PREFIX:
+            continue
+        word = word[:MAX_PREFIX]
+        alternatives = [word]
+        if len(word) >= MIN_FUZZY:
+            alternatives += sorted(_fuzzy_keys(word[:MAX_FUZZY]))
+        groups.append(alternatives)
+    return groups
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+import hashlib
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from app.core.config import settings
+from app.util.cache import LRUCache, MISSING, invalidation_bus
+from app.util.error_handling import UnauthorizedError
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle with auth.py
+    from app.util.functions.auth import AuthContext
+
+logger = logging.getLogger(__name__)
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class VerifiedTokenCache:
+    """Cache of verified ``AuthContext`` objects keyed by a hash of the token.
+
+    Entries live until the token's ``exp`` claim. The first tier is a bounded
+    per-worker LRU; an optional Redis tier shares verified tokens across
+    workers. Revoked tokens are remembered (until they would have expired) in
+    both tiers and broadcast to the other workers; looking one up raises
+    ``UnauthorizedError`` instead of falling through to a fresh verification.
+    Tokens are revoked by ``POST /auth/logout``.
+    """
+
+    namespace = "auth:token"
+    revoked_namespace = "auth:revoked"
+
+    def __init__(self, maxsize: int = 10000, use_redis: bool = False) -> None:
+        self.use_redis = use_redis
+        self._local: LRUCache["AuthContext"] = LRUCache(maxsize=maxsize, name="auth:tokens")
+        self._revoked: LRUCache[bool] = LRUCache(maxsize=maxsize)
+        self._redis = None
+        self.redis_hits = 0
+        invalidation_bus.register(self.revoked_namespace, self._mark_revoked)
+
+    def attach_redis(self, redis_client) -> None:
+        self._redis = redis_client if self.use_redis else None
+
+    def _mark_revoked(self, entries) -> None:
+        # Entries are "<hash>:<exp>" so remote workers can bound the marker's lifetime.
+        for entry in entries:
+            digest, _, exp = entry.partition(":")
+            self._local.delete(digest)
+            self._revoked.set(digest, True, ttl=max(float(exp or 0) - time.time(), 1.0))
+
+    @staticmethod
+    def _ttl(exp: Any) -> float:
+        try:
+            return float(exp) - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _revoked_ttl(self, raw: Optional[str]) -> float:
+        # Remember a Redis revocation locally until the token would have expired
+        try:
+            return max(self._ttl(json.loads(raw)["claims"].get("exp")), 1.0)
+        except (TypeError, ValueError, KeyError):
+            return 60.0
+
+    def is_revoked(self, token: str) -> bool:
+        return self._revoked.get(_token_hash(token), False)
+
+    async def get(self, token: str) -> Optional["AuthContext"]:
+        """The cached context, or None on a miss; raises ``UnauthorizedError`` for a revoked token."""
+        digest = _token_hash(token)
+        if self._revoked.get(digest, False):
+            raise UnauthorizedError("JWT has been revoked")
+
+        context = self._local.get(digest)
+        if context is not MISSING:
+            if self._ttl(context.claims.get("exp")) > 0:
+                return context
+            self._local.delete(digest)
+            return None
+
+        if self._redis is None:
+            return None
+        try:
+            revoked, raw = await self._redis.mget(f"{self.revoked_namespace}:{digest}", f"{self.namespace}:{digest}")
+        except Exception as exc:
+            logger.warning("Token cache Redis lookup failed: %s", exc)
+            return None
+        if revoked:
+            self._revoked.set(digest, True, ttl=self._revoked_ttl(raw))
+            raise UnauthorizedError("JWT has been revoked")
+        if not raw:
+            return None
+
+        from app.util.functions.auth import AuthContext
+
+        context = AuthContext(**json.loads(raw))
+        ttl = self._ttl(context.claims.get("exp"))
+        if ttl <= 0:
+            return None
+        self.redis_hits += 1
+        self._local.set(digest, context, ttl=ttl)
+        return context
+
+    async def set(self, token: str, context: "AuthContext") -> None:
+        ttl = self._ttl(context.claims.get("exp"))
+        digest = _token_hash(token)
+        if ttl <= 0 or self._revoked.get(digest, False):
+            return
+        self._local.set(digest, context, ttl=ttl)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(f"{self.namespace}:{digest}", json.dumps(asdict(context)), ex=max(int(ttl), 1))
+        except Exception as exc:
+            logger.warning("Token cache Redis write failed: %s", exc)
+
+    async def revoke(self, token: str, exp: Optional[float] = None) -> None:
+        """Drop ``token`` from every tier and refuse to cache it again until ``exp``."""
+        digest = _token_hash(token)
+        context = self._local.get(digest)
+        if exp is None and context is not MISSING:
+            exp = context.claims.get("exp")
+        exp = float(exp) if exp is not None else time.time() + 24 * 3600
+        if self._redis is not None:
+            ttl = max(int(exp - time.time()), 1)
+            try:
+                await self._redis.set(f"{self.revoked_namespace}:{digest}", "1", ex=ttl)
+                await self._redis.delete(f"{self.namespace}:{digest}")
+            except Exception as exc:
+                logger.warning("Token cache Redis revoke failed: %s", exc)
+        entries = [f"{digest}:{exp}"]
+        self._mark_revoked(entries)
+        await invalidation_bus.publish(self.revoked_namespace, entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._local.stats(), "redis_hits": self.redis_hits}
+
+
+token_cache = VerifiedTokenCache(
+    maxsize=settings.auth_token_cache_size,
+    use_redis=settings.auth_token_cache_redis,
+)
@@ -0,0 +1,176 @@
+"""Tag-invalidated cache of serialized responses for public read routes.
+
+Entries are JSON bodies plus the headers to replay (ETag, Cache-Control, ...),
+kept in a per-worker LRU and, once Redis is attached, in Redis. Every entry is
+stored under a set of tags; ``purge`` drops all entries carrying any of the
+given tags from Redis and from every worker's LRU (through the invalidation
+bus), so writers invalidate exactly what they touched.
+
+A response read before a write may only be ready after that write's purge.
+Readers take a ``generation()`` before reading and pass it to ``set``, which
+drops the response if any of its tags has been purged since.
+
+Redis layout, per namespace ``ns``::
+
+    response-cache:ns:<key>      JSON {"b": body, "h": headers, "t": tags}, with a TTL
+    response-cache:ns:tag:<tag>  set of keys tagged with <tag>
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+from app.util.cache import LRUCache, MISSING, invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str]
+    tags: frozenset
+
+
+class ResponseCache:
+    def __init__(self, namespace: str, ttl: int = 60, local_ttl: float = 10.0, maxsize: int = 2048) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self._prefix = f"response-cache:{namespace}"
+        self._local: LRUCache[CachedResponse] = LRUCache(maxsize=maxsize, ttl=local_ttl, name=self._prefix)
+        self._local_tags: Dict[str, Set[str]] = {}
+        # Generation of the latest purge of each recently purged tag, oldest
+        # first. Trimmed to ``maxsize``; reads older than anything trimmed
+        # (``_floor``) are not stored.
+        self._generation = 0
+        self._purged: Dict[str, int] = {}
+        self._floor = 0
+        self._redis = None
+        self.redis_hits = 0
+        invalidation_bus.register(self._prefix, self._drop_local)
+
+    def attach_redis(self, redis_client) -> None:
+        self._redis = redis_client
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Stable key for JSON-serializable parts, e.g. a normalized query dump."""
+        raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _store_local(self, key: str, entry: CachedResponse) -> None:
+        self._local.set(key, entry)
+        for tag in entry.tags:
+            self._local_tags.setdefault(tag, set()).add(key)
+
+    def _mark_purged(self, tags: Iterable[str]) -> None:
+        self._generation += 1
+        for tag in tags:
+            self._purged.pop(tag, None)
+            self._purged[tag] = self._generation
+        while len(self._purged) > self._local.maxsize:
+            oldest = next(iter(self._purged))
+            self._floor = self._purged.pop(oldest)
+
+    def _is_stale(self, generation: int, tags: Iterable[str]) -> bool:
+        return generation < self._floor or any(self._purged.get(tag, 0) > generation for tag in tags)
+
+    def generation(self) -> int:
+        """Token to take before reading the data of a response passed to ``set``."""
+        return self._generation
+
+    def _drop_local(self, tags: List[str]) -> None:
+        self._mark_purged(tags)
+        for tag in tags:
+            for key in self._local_tags.pop(tag, ()):
+                self._local.delete(key)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._local.get(key)
+        if entry is not MISSING:
+            return entry
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.get(f"{self._prefix}:{key}")
+        except Exception as exc:
+            logger.warning("Response cache lookup failed for %s: %s", self.namespace, exc)
+            return None
+        if raw is None:
+            return None
+        payload = json.loads(raw)
+        entry = CachedResponse(body=payload["b"].encode("utf-8"), headers=payload["h"], tags=frozenset(payload["t"]))
+        self.redis_hits += 1
+        self._store_local(key, entry)
+        return entry
+
+    async def set(
+        self,
+        key: str,
+        body: bytes,
+        tags: Iterable[str],
+        headers: Optional[Dict[str, str]] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a response; skipped when ``generation`` predates a purge of one of ``tags``."""
+        entry = CachedResponse(body=body, headers=dict(headers or {}), tags=frozenset(tags))
+        if generation is not None and self._is_stale(generation, entry.tags):
+            return
+        self._store_local(key, entry)
+        if self._redis is None:
+            return
+        payload = json.dumps({"b": body.decode("utf-8"), "h": entry.headers, "t": sorted(entry.tags)})
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.set(f"{self._prefix}:{key}", payload, ex=self.ttl)
+            for tag in entry.tags:
+                # Tag sets outlive their entries slightly; purging a dead key is harmless.
+                pipe.sadd(f"{self._prefix}:tag:{tag}", key)
+                pipe.expire(f"{self._prefix}:tag:{tag}", self.ttl * 2)
+            await pipe.execute()
+        except Exception as exc:
+            logger.warning("Response cache write failed for %s: %s", self.namespace, exc)
+
+    async def purge(self, tags: Iterable[str]) -> None:
+        """Drop every entry tagged with any of ``tags``, in Redis and in every worker."""
+        tags = sorted({tag for tag in tags if tag})
+        if not tags:
+            return
+        # Mark first so reads finishing while Redis is purged are not stored.
+        self._mark_purged(tags)
+        if self._redis is not None:
+            try:
+                tag_keys = [f"{self._prefix}:tag:{tag}" for tag in tags]
+                members = await self._redis.sunion(tag_keys)
+                await self._redis.delete(*tag_keys, *(f"{self._prefix}:{key}" for key in members))
+            except Exception as exc:
+                logger.warning("Response cache purge failed for %s: %s", self.namespace, exc)
+        await invalidation_bus.publish(self._prefix, tags)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._local.stats(), "redis_hits": self.redis_hits, "tags": len(self._local_tags)}
+
+
+# Tags of cached experience responses. Every listing carries LISTING_TAG, so
+# writes that can change which experiences a listing holds purge all of them.
+LISTING_TAG = "listing"
+
+
+def experience_tag(experience_id: Any) -> str:
+    return f"experience:{experience_id}"
+
+
+def operator_tag(operator_id: Any) -> str:
+    return f"operator:{operator_id}"
+
+
+experience_response_cache = ResponseCache(
+    "experiences",
+    ttl=settings.experience_response_cache_ttl_seconds,
+    local_ttl=settings.experience_response_cache_local_ttl_seconds,
+)
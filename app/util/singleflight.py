@@ -0,0 +1,82 @@
+"""Request coalescing ("singleflight") for async loaders.
+
+Concurrent calls for the same key share a single in-flight load instead of
+each hitting the database, which protects hot keys from cache stampedes when
+their entry expires. ``should_refresh_early`` implements probabilistic early
+expiration (XFetch) so hot entries are usually refreshed before they expire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+_registry: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.loads = 0
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        _registry[name] = self
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Run ``loader`` once for all concurrent callers asking for ``key``."""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.loads += 1
+            task = asyncio.get_running_loop().create_task(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _task, key=key: self._forget(key, _task))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller does not cancel the load for the others.
+        return await asyncio.shield(task)
+
+    def spawn(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        """Start a background load for ``key`` unless one is already running."""
+        if key in self._inflight:
+            return
+        self.loads += 1
+        task = asyncio.get_running_loop().create_task(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _task, key=key: self._forget(key, _task))
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark background failures as retrieved; callers of ``do`` still see them.
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+
+def should_refresh_early(expires_at: float, delta: float, beta: float = 1.0) -> bool:
+    """XFetch: return True with rising probability as ``expires_at`` approaches.
+
+    ``expires_at`` is a ``time.time()`` timestamp and ``delta`` the time the
+    last load took, so slower loads are refreshed earlier.
+    """
+    if delta <= 0:
+        return False
+    return time.time() - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: flight.stats() for name, flight in sorted(_registry.items())}
@@ -0,0 +1,35 @@
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.api.routers import experience as routes
+from app.models.experience import Experience
+from app.schemas.experience import ExperienceListingQuery
+from app.util.response_cache import LISTING_TAG, experience_tag
+from fakes import FakeCollection
+
+
+class PageCollection(FakeCollection):
+    def aggregate_result(self, pipeline):
+        return [{"items": self.docs, "total": [{"n": len(self.docs)}]}]
+
+
+def test_listing_cache_miss_tags_each_experience(monkeypatch):
+    doc = {"_id": ObjectId(), "trip_title": "Kayak", "created_at": datetime(2026, 1, 1), "operator_id": "op-1"}
+    monkeypatch.setattr(Experience, "get_pymongo_collection", classmethod(lambda cls: PageCollection([doc])))
+    stored = []
+
+    async def get(key):
+        return None
+
+    async def set(key, body, tags, headers=None, generation=None):
+        stored.append(tags)
+
+    monkeypatch.setattr(routes.experience_response_cache, "get", get)
+    monkeypatch.setattr(routes.experience_response_cache, "set", set)
+
+    response = asyncio.run(routes.list_experiences(ExperienceListingQuery(status="published")))
+
+    assert response.status_code == 200
+    assert stored == [[LISTING_TAG, experience_tag(str(doc["_id"]))]]
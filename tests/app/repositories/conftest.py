@@ -0,0 +1,22 @@
+"""Fixtures shared by the repository tests; the fakes themselves live in ``tests/fakes.py``."""
+
+import pytest
+
+from fakes import FakeModel
+
+
+@pytest.fixture
+def use_collection(monkeypatch):
+    """Return ``use(model, collection)``, routing the model's collection to the fake."""
+
+    def use(model, collection):
+        monkeypatch.setattr(model, "get_pymongo_collection", classmethod(lambda cls: collection))
+        return collection
+
+    return use
+
+
+@pytest.fixture
+def fake_model():
+    FakeModel.queries = []
+    return FakeModel
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.repositories import auth_id_cache as module, get_operator_id_from_auth_id
+from app.repositories.auth_id_cache import AuthIdCache
+from app.repositories.explorer_repository import ExplorerRepository
+from app.repositories.operator_repository import OperatorRepository
+from app.repositories.user_repository import UserRepository
+from app.util import singleflight
+from app.util.cache import invalidation_bus
+
+
+class FakeBackend:
+    def __init__(self):
+        self.store = {}
+
+    async def get_with_ttl(self, key):
+        if key not in self.store:
+            return 0, None
+        value, ttl = self.store[key]
+        return ttl, value
+
+    async def set(self, key, value, expire=None):
+        self.store[key] = (value.encode("utf-8"), expire)
+
+    async def clear(self, namespace=None, key=None):
+        return 1 if self.store.pop(key, None) is not None else 0
+
+
+class FakeLoader:
+    def __init__(self, ids):
+        self.ids = ids
+        self.calls = []
+
+    async def __call__(self, auth_id):
+        self.calls.append(auth_id)
+        await asyncio.sleep(0)
+        return self.ids.get(auth_id)
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = FakeBackend()
+    monkeypatch.setattr(AuthIdCache, "_backend", staticmethod(lambda: backend))
+    monkeypatch.setattr(module.FastAPICache, "get_prefix", classmethod(lambda cls: "test"))
+    return backend
+
+
+def test_local_tier_then_redis_then_loader(backend):
+    loader = FakeLoader({"auth-1": "id-1"})
+    cache = AuthIdCache("test:auth:tiers", loader)
+
+    async def run():
+        first = await cache.get("auth-1")
+        second = await cache.get("auth-1")
+        # A second worker only has the Redis tier to go on.
+        other = AuthIdCache("test:auth:tiers", loader)
+        third = await other.get("auth-1")
+        return first, second, third
+
+    assert asyncio.run(run()) == ("id-1", "id-1", "id-1")
+    assert loader.calls == ["auth-1"]
+    assert backend.store["test:test:auth:tiers:auth-1"][1] == cache.expire
+
+
+def test_unknown_auth_id_is_cached_negatively(backend):
+    loader = FakeLoader({})
+    cache = AuthIdCache("test:auth:negative", loader, negative_ttl=7)
+
+    async def run():
+        return await cache.get("ghost"), await cache.get("ghost")
+
+    assert asyncio.run(run()) == (None, None)
+    assert loader.calls == ["ghost"]
+    assert backend.store["test:test:auth:negative:ghost"] == (b"-", 7)
+
+
+def test_resolver_coalesces_misses_and_refreshes_early(backend, monkeypatch):
+    loader = FakeLoader({"auth-1": "id-1"})
+    monkeypatch.setattr(module.operator_id_cache, "loader", loader)
+    monkeypatch.setattr(singleflight, "random", SimpleNamespace(random=lambda: 0.5))
+    module.operator_id_cache._local.clear()
+
+    async def run():
+        results = await asyncio.gather(*(get_operator_id_from_auth_id("auth-1") for _ in range(10)))
+        assert loader.calls == ["auth-1"]
+
+        # Another worker loaded the id slowly and the shared entry is about to
+        # expire: the next lookup still answers from cache but refreshes it.
+        key = "test:auth:operator:auth-1"
+        backend.store[key] = (b"id-1|5.000000", 2)
+        module.operator_id_cache._local.clear()
+        results.append(await get_operator_id_from_auth_id("auth-1"))
+        results.append(await get_operator_id_from_auth_id("auth-1"))
+        await asyncio.sleep(0.01)
+        return results
+
+    assert asyncio.run(run()) == ["id-1"] * 12
+    assert loader.calls == ["auth-1", "auth-1"]
+    assert backend.store["test:auth:operator:auth-1"][1] == module.operator_id_cache.expire
+
+
+def test_entry_without_redis_refreshes_before_local_expiry(monkeypatch):
+    monkeypatch.setattr(AuthIdCache, "_backend", staticmethod(lambda: None))
+    cache = AuthIdCache("test:auth:local-only", FakeLoader({"auth-1": "id-1"}), expire=300, local_ttl=60)
+
+    asyncio.run(cache.get("auth-1"))
+    _, expires_at, _ = cache._local.get("auth-1")
+
+    assert expires_at - time.time() <= 60
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+def test_invalidate_drops_both_tiers_and_fans_out(backend, monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(invalidation_bus, "_redis", redis)
+    loader = FakeLoader({})
+    cache = AuthIdCache("test:auth:fanout", loader)
+
+    async def run():
+        await cache.get("auth-1")
+        loader.ids["auth-1"] = "id-1"
+        await cache.invalidate("auth-1", None)
+        return await cache.get("auth-1")
+
+    assert asyncio.run(run()) == "id-1"
+    assert loader.calls == ["auth-1", "auth-1"]
+    assert redis.published == [
+        (invalidation_bus.channel, {"origin": invalidation_bus._origin, "name": "test:auth:fanout", "keys": ["auth-1"]})
+    ]
+
+    # Another worker's invalidation arrives over pub/sub.
+    invalidation_bus._apply("test:auth:fanout", ["auth-1"])
+    assert "auth-1" not in cache._local
+
+
+def test_load_started_before_invalidate_is_not_stored(backend):
+    cache = None
+
+    async def run():
+        nonlocal cache
+        started, gate = asyncio.Event(), asyncio.Event()
+
+        async def slow_loader(auth_id):
+            started.set()
+            await gate.wait()
+            return None
+
+        cache = AuthIdCache("test:auth:race", slow_loader)
+        pending = asyncio.create_task(cache.get("auth-1"))
+        await started.wait()
+        # The account is created while the miss is still loading.
+        await cache.invalidate("auth-1")
+        gate.set()
+        return await pending
+
+    assert asyncio.run(run()) is None
+    assert "auth-1" not in cache._local
+    assert backend.store == {}
+
+
+@pytest.mark.parametrize(
+    "repository, cache_name",
+    [
+        (OperatorRepository, "operator_id_cache"),
+        (ExplorerRepository, "explorer_id_cache"),
+        (UserRepository, "user_id_cache"),
+    ],
+)
+def test_create_invalidates_cached_auth_id(monkeypatch, repository, cache_name):
+    invalidated = []
+
+    async def invalidate(*auth_ids):
+        invalidated.extend(auth_ids)
+
+    target = getattr(module, cache_name)
+    monkeypatch.setattr(target, "invalidate", invalidate)
+
+    async def insert():
+        return None
+
+    obj = SimpleNamespace(authenticator_id="auth-new", insert=insert)
+    asyncio.run(repository().create(obj))
+
+    assert invalidated == ["auth-new"]
@@ -0,0 +1,44 @@
+import asyncio
+
+from bson import DBRef, ObjectId
+
+from app.repositories.batch_loader import BatchLoader, link_id, loader
+from app.repositories.unit_of_work import unit_of_work
+
+
+def test_loads_queued_in_one_tick_share_one_query(fake_model):
+    ids = [ObjectId() for _ in range(3)]
+    refs = [DBRef("fakes", ids[i % 3]) for i in range(50)]
+
+    async def run():
+        batch = BatchLoader(fake_model)
+        return batch, await asyncio.gather(*(batch.load(ref) for ref in refs))
+
+    batch, docs = asyncio.run(run())
+
+    assert len(fake_model.queries) == 1
+    assert sorted(fake_model.queries[0]) == sorted(ids)
+    assert [doc.id for doc in docs] == [ref.id for ref in refs]
+    assert batch.batches == 1
+
+
+def test_request_loader_is_shared_and_skips_loaded_ids(fake_model):
+    id = ObjectId()
+
+    async def run():
+        with unit_of_work():
+            first = await loader(fake_model).load(id)
+            second = await loader(fake_model).load(str(id))
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert len(fake_model.queries) == 1
+
+
+def test_link_id_accepts_stored_reference_shapes():
+    id = ObjectId()
+
+    assert link_id(DBRef("x", id)) == link_id({"$ref": "x", "$id": id}) == link_id(id) == str(id)
+    assert link_id(None) is None
@@ -0,0 +1,51 @@
+import asyncio
+
+from app.models.experience import Experience
+from app.repositories import experience_repository
+from app.repositories.experience_repository import ExperienceRepository
+from app.schemas.experience import ExperienceClusterQuery
+from fakes import FakeCollection
+
+
+class ClusterCollection(FakeCollection):
+    def __init__(self, groups):
+        super().__init__()
+        self.groups = groups
+
+    def aggregate_result(self, pipeline):
+        return self.groups
+
+
+def _group(x, y, count):
+    return {"_id": {"x": float(x), "y": float(y)}, "count": count, "lng": 1.0, "lat": 2.0, "min_price": 10.0, "image": "a.jpg"}
+
+
+def test_clusters_are_cached_per_cell(use_collection):
+    experience_repository._cluster_cells.clear()
+    # zoom 2 -> 22.5 degree cells; bbox covers columns 8-9 and rows 4-5
+    collection = use_collection(Experience, ClusterCollection([_group(8, 4, 3), _group(9, 5, 2)]))
+    repo = ExperienceRepository()
+    query = ExperienceClusterQuery(bbox="1,1,40,40", zoom=2, status="published")
+
+    size, first = asyncio.run(repo.clusters(query))
+    _, second = asyncio.run(repo.clusters(query))
+
+    assert size == 22.5
+    assert [(c["cell"], c["count"]) for c in first] == [("2/8/4", 3), ("2/9/5", 2)]
+    assert second == first
+    assert len(collection.pipelines) == 1
+    assert collection.pipelines[0][0]["$match"]["status"] == "published"
+
+
+def test_clusters_reuse_cells_when_panning(use_collection):
+    experience_repository._cluster_cells.clear()
+    collection = use_collection(Experience, ClusterCollection([]))
+    repo = ExperienceRepository()
+
+    asyncio.run(repo.clusters(ExperienceClusterQuery(bbox="1,1,40,40", zoom=2)))
+    asyncio.run(repo.clusters(ExperienceClusterQuery(bbox="30,1,60,40", zoom=2)))
+
+    # The second viewport only aggregates the newly exposed column
+    polygon = collection.pipelines[1][0]["$match"]["location"]["$geoWithin"]["$geometry"]
+    lngs = [point[0] for point in polygon["coordinates"][0]]
+    assert (min(lngs), max(lngs)) == (45.0, 67.5)
@@ -0,0 +1,35 @@
+import asyncio
+
+from app.models.experience import Experience
+from app.repositories import experience_repository
+from app.repositories.experience_repository import ExperienceRepository
+from app.schemas.experience import ExperienceListingQuery
+from fakes import FakeCollection
+
+
+class FacetCollection(FakeCollection):
+    def aggregate_result(self, pipeline):
+        branches = pipeline[-1]["$facet"]
+        result = {name: [] for name in branches}
+        result["total"] = [{"n": 3}]
+        if "activity" in branches:
+            result["activity"] = [{"_id": "hiking", "count": 2}, {"_id": None, "count": 1}]
+            result["price"] = [{"_id": 25, "count": 2}, {"_id": "overflow", "count": 1}]
+        return [result]
+
+
+def test_facets_come_from_the_listing_aggregation_and_are_cached(use_collection):
+    experience_repository._facet_cache.clear()
+    collection = use_collection(Experience, FacetCollection())
+    repo = ExperienceRepository()
+    query = ExperienceListingQuery(status="published", include_facets=True)
+
+    first = asyncio.run(repo.list(query))
+    second = asyncio.run(repo.list(query))
+
+    assert len(collection.pipelines) == 2
+    assert "activity" in collection.pipelines[0][-1]["$facet"]
+    assert "activity" not in collection.pipelines[1][-1]["$facet"]
+    assert [(f.value, f.count) for f in first.facets.activity] == [("hiking", 2)]
+    assert [(b.min, b.max, b.count) for b in first.facets.price] == [(25, 50, 2), (500, None, 1)]
+    assert second.facets == first.facets and first.total == 3
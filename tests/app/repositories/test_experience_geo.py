@@ -0,0 +1,37 @@
+import pytest
+
+from app.repositories.experience_repository import ExperienceRepository
+from app.schemas.experience import ExperienceGeoField, ExperienceListingQuery
+from app.util.error_handling import BadRequestError
+
+
+def test_radius_filter_uses_countable_geo_within():
+    query = ExperienceListingQuery(lat=41.9, lng=12.5, radius_km=10)
+
+    q = ExperienceRepository()._build_query(query)
+
+    center, radians = q["location"]["$geoWithin"]["$centerSphere"]
+    assert center == [12.5, 41.9]
+    assert radians == pytest.approx(10000 / 6378100)
+
+
+def test_bbox_and_radius_are_combined_on_the_chosen_field():
+    query = ExperienceListingQuery(lat=0, lng=0, bbox="-1,-1,1,1", geo_field=ExperienceGeoField.MEETING_POINT)
+
+    q = ExperienceRepository()._build_query(query)
+
+    assert [list(clause) for clause in q["$and"]] == [["meeting_point"], ["meeting_point"]]
+    assert q["$and"][1]["meeting_point"]["$geoWithin"]["$geometry"]["type"] == "Polygon"
+
+
+def test_bbox_across_the_antimeridian_is_split():
+    geometry = ExperienceRepository()._bbox_geometry(170, -10, -170, 10)
+
+    assert geometry["type"] == "MultiPolygon"
+    assert [ring[0][0][0] for ring in geometry["coordinates"]] == [170, -180.0]
+
+
+@pytest.mark.parametrize("bbox", ["1,2,3", "a,b,c,d", "0,10,1,5"])
+def test_invalid_bbox_is_a_bad_request(bbox):
+    with pytest.raises(BadRequestError):
+        ExperienceRepository._parse_bbox(bbox)
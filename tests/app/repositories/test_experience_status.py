@@ -0,0 +1,85 @@
+import asyncio
+
+from bson import ObjectId
+import pytest
+
+from app.models.experience import Experience, ExperienceStatus
+from app.models.experience_status_change import ExperienceStatusChange
+from app.repositories.experience_repository import ExperienceRepository
+from fakes import FakeCollection
+
+
+class StatusCollection(FakeCollection):
+    async def bulk_write(self, requests, ordered=True):
+        # Applies to the documents whose status matches the precondition
+        for request in requests:
+            filter, update = request._filter, request._doc
+            for doc in self.docs:
+                if doc["_id"] == filter["_id"] and doc["status"] == filter["status"]:
+                    doc.update(update["$set"])
+
+
+@pytest.fixture
+def collection(use_collection):
+    fake = use_collection(Experience, StatusCollection())
+    return use_collection(ExperienceStatusChange, fake)
+
+
+def test_transition_matches_allowed_sources_only(collection):
+    experience_id = str(ObjectId())
+
+    result = asyncio.run(ExperienceRepository().transition(experience_id, ExperienceStatus.PUBLISHED, actor_id="admin"))
+
+    assert result is None
+    (filter, update), = collection.updates
+    assert filter == {"_id": ObjectId(experience_id), "status": {"$in": ["submitted"]}}
+    assert update["$set"]["status"] == "published"
+    # Nothing matched, so nothing is recorded
+    assert collection.inserted == []
+
+
+def test_submit_requires_ownership_and_completeness_in_the_filter(collection):
+    asyncio.run(ExperienceRepository().transition(
+        str(ObjectId()), ExperienceStatus.SUBMITTED, operator_id="op-1", require_complete=True
+    ))
+
+    (filter, _), = collection.updates
+    assert filter["operator_id"] == "op-1"
+    assert filter["complete"] is True
+    assert sorted(filter["status"]["$in"]) == ["draft", "rejected"]
+
+
+def test_batch_approve_reports_outcome_per_item(collection):
+    submitted, published = ObjectId(), ObjectId()
+    collection.docs = [
+        {"_id": submitted, "status": "submitted", "operator_id": "op-1"},
+        {"_id": published, "status": "published", "operator_id": "op-1"},
+    ]
+    ids = [str(submitted), str(published), str(ObjectId()), "not-an-id"]
+
+    results = asyncio.run(ExperienceRepository().transition_many(ids, ExperienceStatus.PUBLISHED, actor_id="admin"))
+
+    assert [(r["applied"], r["error"]) for r in results] == [
+        (True, None), (False, "invalid_status"), (False, "not_found"), (False, "not_found"),
+    ]
+    assert [(doc["experience_id"], doc["from_status"]) for doc in collection.inserted] == [(str(submitted), "submitted")]
+
+
+def test_batch_does_not_claim_a_concurrent_write_in_the_same_millisecond(use_collection):
+    class RacingCollection(StatusCollection):
+        async def bulk_write(self, requests, ordered=True):
+            # Another moderator's batch lands first with the same timestamp
+            for request in requests:
+                for doc in self.docs:
+                    if doc["_id"] == request._filter["_id"]:
+                        doc.update(request._doc["$set"], status_batch_id="other-batch")
+
+    collection = use_collection(Experience, RacingCollection())
+    use_collection(ExperienceStatusChange, collection)
+    id = ObjectId()
+    collection.docs = [{"_id": id, "status": "submitted", "operator_id": "op-1"}]
+
+    results = asyncio.run(ExperienceRepository().transition_many([str(id)], ExperienceStatus.PUBLISHED, actor_id="admin"))
+
+    assert [(r["applied"], r["error"]) for r in results] == [(False, "invalid_status")]
+    assert collection.inserted == []
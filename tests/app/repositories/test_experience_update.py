@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+
+from bson import ObjectId
+from fastapi import HTTPException
+import pytest
+
+from app.models.experience import Experience
+from app.repositories import experience_repository
+from app.repositories.experience_repository import ExperienceRepository
+from app.util.response_cache import LISTING_TAG
+from fakes import FakeCollection
+
+
+@pytest.fixture
+def collection(use_collection):
+    return use_collection(Experience, FakeCollection())
+
+
+def test_update_is_one_pipeline_filtered_on_owner(collection):
+    experience_id = str(ObjectId())
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(ExperienceRepository().update(experience_id, {"trip_title": "$where"}, operator_id="op-1"))
+
+    assert exc.value.status_code == 404
+    (filter, pipeline), = collection.updates
+    assert filter == {"_id": ObjectId(experience_id), "operator_id": "op-1"}
+    assert pipeline[0]["$set"]["trip_title"] == {"$literal": "$where"}
+    assert "complete" in pipeline[1]["$set"]
+
+
+def test_update_of_someone_elses_experience_is_forbidden(collection):
+    collection.existing = {"_id": ObjectId()}
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(ExperienceRepository().update(str(ObjectId()), {"price_per_person": 10}, operator_id="op-2"))
+
+    assert exc.value.status_code == 403
+
+
+def test_short_description_update_reindexes_and_purges_listings(collection, monkeypatch):
+    purged = []
+
+    async def purge(tags):
+        purged.extend(tags)
+
+    experience_id = ObjectId()
+    collection.updated = {
+        "_id": experience_id, "operator_id": "op-1", "updated_at": None,
+        "trip_title": "Kayak", "short_description": "Sunrise paddle", "tags": [],
+    }
+    monkeypatch.setattr(
+        Experience, "model_validate", classmethod(lambda cls, doc: SimpleNamespace(id=doc["_id"], activity_id=None, **doc))
+    )
+    monkeypatch.setattr(experience_repository.experience_response_cache, "purge", purge)
+
+    asyncio.run(ExperienceRepository().update(str(experience_id), {"short_description": "Sunrise paddle"}))
+
+    (_, search), = collection.updates[1:]
+    assert "sunr" in search["$set"]["search_prefixes"]
+    assert LISTING_TAG in purged
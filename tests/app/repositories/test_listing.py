@@ -0,0 +1,60 @@
+import asyncio
+
+from app.repositories.listing import fetch_page
+from fakes import FakeCollection, FakeCursor
+
+
+class PageCollection(FakeCollection):
+    def aggregate_result(self, pipeline):
+        facet = pipeline[-1]["$facet"]
+        skip, limit = facet["items"][0]["$skip"], facet["items"][1]["$limit"]
+        return [{"items": self.docs[skip:skip + limit], "total": [{"n": len(self.docs)}]}]
+
+
+def test_exact_total_uses_a_single_aggregation():
+    collection = PageCollection([{"_id": i} for i in range(5)])
+
+    page = asyncio.run(fetch_page(collection, {"a": 1}, [("_id", 1)], skip=2, limit=2))
+
+    assert collection.calls == ["aggregate"]
+    assert page.items == [{"_id": 2}, {"_id": 3}]
+    assert page.total == 5 and not page.total_estimated
+
+
+def test_total_can_be_skipped():
+    collection = PageCollection([{"_id": i} for i in range(5)])
+
+    page = asyncio.run(fetch_page(collection, {}, [], skip=0, limit=3, include_total=False))
+
+    assert collection.calls == ["find"]
+    assert page.total is None and len(page.items) == 3
+
+
+def test_estimated_total_is_cached_per_filter():
+    collection = PageCollection([{"_id": i} for i in range(5)])
+
+    async def run():
+        first = await fetch_page(collection, {}, [], skip=0, limit=1, estimate_total=True)
+        second = await fetch_page(collection, {}, [], skip=1, limit=1, estimate_total=True)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert collection.calls.count("estimated_document_count") == 1
+    assert first.total == second.total == 5 and second.total_estimated
+
+
+class MotorPageCollection(PageCollection):
+    # Motor returns the aggregation cursor directly instead of from a coroutine.
+    def aggregate(self, pipeline):
+        self.calls.append("aggregate")
+        return FakeCursor(self.aggregate_result(pipeline))
+
+
+def test_aggregation_works_with_motor_collections():
+    collection = MotorPageCollection([{"_id": i} for i in range(5)])
+
+    page = asyncio.run(fetch_page(collection, {"a": 1}, [("_id", 1)], skip=1, limit=2))
+
+    assert page.items == [{"_id": 1}, {"_id": 2}]
+    assert page.total == 5
@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+import pytest
+
+from app.models.experience import Experience
+from app.models.experience_occurrence import ExperienceOccurrence
+from app.repositories.occurrence_repository import OccurrenceRepository
+from app.util.functions import recurrence
+from fakes import FakeCollection
+
+
+@pytest.fixture
+def collections(use_collection):
+    experiences = use_collection(Experience, FakeCollection())
+    occurrences = use_collection(ExperienceOccurrence, FakeCollection())
+    state = FakeCollection()
+    occurrences.database = {"experience_occurrence_state": state}
+    return experiences, occurrences, state
+
+
+def _experience(updated_at):
+    return {
+        "_id": ObjectId(),
+        "recurring_pattern": "FREQ=DAILY",
+        "start_date": datetime(2026, 1, 1, 9),
+        "timezone": "UTC",
+        "trip_title": "Sunrise kayak",
+        "images": ["a.jpg"],
+        "updated_at": updated_at,
+    }
+
+
+def test_changed_experiences_are_re_expanded(collections, monkeypatch):
+    experiences, occurrences, state = collections
+    monkeypatch.setattr("app.core.config.settings.occurrence_horizon_days", 7)
+    experience = _experience(datetime(2026, 1, 1))
+    experiences.docs = [experience]
+
+    stats = asyncio.run(OccurrenceRepository().materialize(now=datetime(2026, 2, 1, 12)))
+
+    assert stats == {"expanded": 1, "extended": 0, "removed": 0, "occurrences": 7}
+    inserts = [w._doc for w in occurrences.writes if type(w).__name__ == "InsertOne"]
+    assert inserts[0]["date"] == datetime(2026, 2, 1, 9)
+    assert inserts[0]["image"] == "a.jpg"
+    assert state.writes[0]._doc["until"] == datetime(2026, 2, 8)
+
+
+def test_unchanged_experiences_only_extend_and_stale_ones_are_removed(collections, monkeypatch):
+    experiences, occurrences, state = collections
+    monkeypatch.setattr("app.core.config.settings.occurrence_horizon_days", 7)
+    experience = _experience(datetime(2026, 1, 1))
+    experiences.docs = [experience]
+    gone = ObjectId()
+    state.docs = [
+        {"_id": experience["_id"], "version": datetime(2026, 1, 1), "until": datetime(2026, 2, 7)},
+        {"_id": gone, "version": datetime(2026, 1, 1), "until": datetime(2026, 2, 7)},
+    ]
+
+    stats = asyncio.run(OccurrenceRepository().materialize(now=datetime(2026, 2, 1, 12)))
+
+    assert stats == {"expanded": 0, "extended": 1, "removed": 1, "occurrences": 1}
+    assert not any(type(w).__name__ == "DeleteMany" for w in occurrences.writes)
+    assert ("delete_many", {"experience_id": {"$in": [str(gone)]}}) in occurrences.writes
+
+
+def test_expansion_past_the_horizon_streams_in_date_then_experience_order(collections, monkeypatch):
+    experiences, _, _ = collections
+    monkeypatch.setattr("app.repositories.occurrence_repository._STREAM_CHUNK_DAYS", 3)
+    daily, weekly = _experience(datetime(2026, 1, 1)), _experience(datetime(2026, 1, 1))
+    weekly["recurring_pattern"] = "FREQ=WEEKLY"
+    experiences.docs = sorted([daily, weekly], key=lambda e: e["_id"], reverse=True)
+
+    async def collect(after=None):
+        stream = OccurrenceRepository()._expand_stream({}, datetime(2026, 1, 1), datetime(2026, 1, 16), after)
+        return [(item["date"], item["experience_id"]) async for item in stream]
+
+    items = asyncio.run(collect())
+    resumed = asyncio.run(collect(after=items[6]))
+
+    assert items == sorted(items)
+    assert len(items) == 15 + 3
+    assert resumed == items[7:]
+
+
+def test_refresh_of_an_unchanged_experience_reuses_its_compiled_rule(collections, monkeypatch):
+    experiences, occurrences, state = collections
+    monkeypatch.setattr("app.core.config.settings.occurrence_horizon_days", 7)
+    experiences.docs = [_experience(datetime(2026, 1, 1))]
+    misses, hits = recurrence._compiled.misses, recurrence._compiled.hits
+
+    asyncio.run(OccurrenceRepository().materialize(now=datetime(2026, 2, 1, 12)))
+    state.docs = [write._doc for write in state.writes]
+    stats = asyncio.run(OccurrenceRepository().materialize(now=datetime(2026, 2, 2, 12)))
+
+    assert stats["extended"] == 1
+    assert recurrence._compiled.misses == misses + 1
+    assert recurrence._compiled.hits == hits + 1
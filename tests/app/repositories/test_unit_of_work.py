@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from app.repositories.unit_of_work import current, load, load_many, round_trip_listener, stream_in, unit_of_work
+
+
+def test_each_document_is_fetched_once_per_scope(fake_model):
+    first, second = str(ObjectId()), str(ObjectId())
+
+    async def run():
+        with unit_of_work() as uow:
+            a = await load(fake_model, first)
+            both = await load_many(fake_model, [first, second])
+            again = await load(fake_model, second)
+        return uow, a, both, again
+
+    uow, a, both, again = asyncio.run(run())
+
+    assert [[str(id) for id in ids] for ids in fake_model.queries] == [[first], [second]]
+    assert both[first] is a and both[second] is again
+    assert uow.identity_hits == 2
+
+
+def test_loads_outside_a_scope_are_not_cached(fake_model):
+    id = str(ObjectId())
+
+    async def run():
+        await load(fake_model, id)
+        await load(fake_model, id)
+
+    asyncio.run(run())
+
+    assert len(fake_model.queries) == 2
+
+
+def test_listener_counts_commands_of_the_current_scope():
+    with unit_of_work() as uow:
+        round_trip_listener.started(SimpleNamespace(command_name="find"))
+        round_trip_listener.started(SimpleNamespace(command_name="find"))
+    round_trip_listener.started(SimpleNamespace(command_name="insert"))
+
+    assert uow.round_trips == 2
+    assert uow.commands == {"find": 2}
+
+
+def test_streamed_body_runs_in_the_request_scope():
+    async def body():
+        for _ in range(3):
+            round_trip_listener.started(SimpleNamespace(command_name="getMore"))
+            yield current()
+
+    async def run():
+        with unit_of_work() as uow:
+            pass
+        # The scope has been closed by the time the body is sent
+        return uow, [scope async for scope in stream_in(uow, body())], current()
+
+    uow, scopes, after = asyncio.run(run())
+
+    assert scopes == [uow] * 3
+    assert uow.commands == {"getMore": 3}
+    assert after is None
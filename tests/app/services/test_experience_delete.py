@@ -0,0 +1,37 @@
+import asyncio
+
+import pytest
+
+from app.services import experience_service
+from app.services.experience_service import ExperienceService
+from app.util.error_handling import ForbiddenError
+
+
+def _service(monkeypatch, state):
+    async def operator_id(auth_id):
+        return "op-1"
+
+    async def transition(*args, **kwargs):
+        return None
+
+    async def get_transition_state(experience_id):
+        return state
+
+    monkeypatch.setattr(experience_service, "get_operator_id_from_auth_id", operator_id)
+    service = ExperienceService()
+    service.repository.transition = transition
+    service.repository.get_transition_state = get_transition_state
+    return service
+
+
+def test_deleting_an_archived_experience_is_a_no_op(monkeypatch):
+    service = _service(monkeypatch, {"operator_id": "op-1", "status": "archived"})
+
+    assert asyncio.run(service.delete_experience("exp-1", "auth-1")) is None
+
+
+def test_deleting_someone_elses_experience_is_forbidden(monkeypatch):
+    service = _service(monkeypatch, {"operator_id": "op-2", "status": "published"})
+
+    with pytest.raises(ForbiddenError):
+        asyncio.run(service.delete_experience("exp-1", "auth-1"))
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime
+
+from app.schemas.experience_instance import ExperienceInstanceListingQuery
+from app.services.experience_instance_service import ExperienceInstanceService
+
+
+def _item(day, experience_id, status="scheduled", booked=0, hour=0):
+    return {
+        "experience_id": experience_id,
+        "trip_title": "Trip",
+        "date": datetime(2026, 5, day, hour),
+        "status": status,
+        "booked_count": booked,
+        "available_count": 8,
+        "location": None,
+        "images": [],
+    }
+
+
+def _occurrence(day, experience_id, hour=9):
+    return _item(day, experience_id, hour=hour)
+
+
+class FakeStream:
+    def __init__(self, items):
+        self.items = items
+        self.read = 0
+
+    async def __call__(self, date_from=None):
+        for item in self.items:
+            if date_from is not None and item["date"] < date_from:
+                continue
+            self.read += 1
+            yield item
+
+
+def _service(physical, virtual):
+    service = ExperienceInstanceService()
+    service.experience_instance_repository.stream = lambda query, after, batch_size: physical(query.date_from)
+    service.occurrence_repository.stream = lambda q, date_from, date_to, after, batch_size: virtual(date_from)
+    return service
+
+
+def test_pages_are_merged_in_order_and_physical_instances_win():
+    # Physical instances sit at midnight; occurrences carry their start time
+    physical = FakeStream([_item(2, "b", booked=3), _item(4, "a", status="cancelled")])
+    virtual = FakeStream([_occurrence(day, "a") for day in (1, 2)] + [_occurrence(2, "b")] + [_occurrence(day, "a") for day in (3, 4, 5)])
+    service = _service(physical, virtual)
+
+    first = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=3)))
+    second = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=3, cursor=first.next_cursor)))
+
+    assert [(i.date.day, i.experience_id, i.booked_count) for i in first.items] == [(1, "a", 0), (2, "a", 0), (2, "b", 3)]
+    assert [(i.date.day, i.experience_id, i.status) for i in second.items] == [(3, "a", "scheduled"), (4, "a", "cancelled"), (5, "a", "scheduled")]
+    assert second.next_cursor is None
+
+
+def test_status_filter_keeps_cancelled_dates_hidden_and_reads_only_a_page():
+    physical = FakeStream([_item(2, "a", status="cancelled")])
+    virtual = FakeStream([_occurrence(day, "a") for day in range(1, 29)])
+    service = _service(physical, virtual)
+
+    page = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=2, status="scheduled")))
+
+    assert [i.date.day for i in page.items] == [1, 3]
+    assert page.next_cursor is not None
+    # The look-ahead item, plus the next one to close its day
+    assert virtual.read <= 5
+
+
+def test_overridden_day_is_listed_once_with_the_physical_status():
+    physical = FakeStream([_item(2, "a", status="cancelled")])
+    virtual = FakeStream([_occurrence(1, "a"), _occurrence(2, "a"), _occurrence(3, "a")])
+    service = _service(physical, virtual)
+
+    page = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=10)))
+
+    assert [(i.date, i.status) for i in page.items] == [
+        (datetime(2026, 5, 1, 9), "scheduled"),
+        (datetime(2026, 5, 2), "cancelled"),
+        (datetime(2026, 5, 3, 9), "scheduled"),
+    ]
+
+
+def test_days_are_ordered_by_experience_and_resume_mid_day():
+    physical = FakeStream([_item(3, "c", booked=2)])
+    virtual = FakeStream([_occurrence(3, "b", hour=7), _occurrence(3, "a", hour=10), _occurrence(3, "c", hour=12), _occurrence(4, "a")])
+    service = _service(physical, virtual)
+
+    first = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=2)))
+    second = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=2, cursor=first.next_cursor)))
+
+    assert [(i.date.day, i.experience_id) for i in first.items] == [(3, "a"), (3, "b")]
+    assert [(i.date.day, i.experience_id, i.booked_count) for i in second.items] == [(3, "c", 2), (4, "a", 0)]
+    assert second.next_cursor is None
+
+
+def test_occurrence_without_a_title_is_listed():
+    untitled = dict(_occurrence(1, "a"), trip_title=None)
+    service = _service(FakeStream([]), FakeStream([untitled]))
+
+    page = asyncio.run(service.list_experience_instances(ExperienceInstanceListingQuery(page_size=10)))
+
+    assert [i.trip_title for i in page.items] == [None]
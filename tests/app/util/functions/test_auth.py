@@ -0,0 +1,153 @@
+import asyncio
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+import jwt
+import pytest
+
+from app.api.routers import auth as auth_router
+from app.util.error_handling import DomainError, UnauthorizedError
+from app.util.functions import auth
+from app.util.functions.auth import AuthContext, ProviderRouter, operator_auth, require_zitadel_client
+from app.util.functions.jwks import jwks_store
+from app.util.functions.roles import require_operator
+from app.util.functions.token_cache import VerifiedTokenCache
+
+
+def _context() -> AuthContext:
+    return AuthContext(
+        user_id="user-1",
+        client_id=auth.settings.zitadel_operator_client_id,
+        issuer="https://issuer.example",
+        claims={},
+        name="Jane",
+        email="jane@example.com",
+        provider="operator_app",
+    )
+
+
+def test_token_is_verified_once_per_request(monkeypatch):
+    calls = []
+
+    async def fake_verify(token, provider_keys=None, allowed_client_ids=None):
+        calls.append(token)
+        return _context()
+
+    monkeypatch.setattr(auth, "_decode_and_verify_token", fake_verify)
+
+    # A second, distinct dependency for the same provider defeats FastAPI's
+    # per-callable dependency cache, so only request.state memoization helps.
+    other_operator_auth = require_zitadel_client(provider_keys=["operator_app"])
+
+    app = FastAPI()
+
+    @app.get("/resource", dependencies=[Depends(require_operator), Depends(other_operator_auth)])
+    async def resource(
+        current_auth: AuthContext = Depends(require_operator),
+        same_auth: AuthContext = Depends(operator_auth),
+    ):
+        return {"user_id": current_auth.user_id, "same": current_auth is same_auth}
+
+    client = TestClient(app)
+    for token in ("token-a", "token-b"):
+        response = client.get("/resource", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert response.json() == {"user_id": "user-1", "same": True}
+
+    assert calls == ["token-a", "token-b"]
+
+
+def test_logout_revokes_the_token_for_later_requests(monkeypatch):
+    cache = VerifiedTokenCache(maxsize=10)
+    monkeypatch.setattr(auth, "token_cache", cache)
+    monkeypatch.setattr(auth_router, "token_cache", cache)
+    verified = []
+
+    async def fake_verify(token, provider_keys=None):
+        verified.append(token)
+        context = _context()
+        context.claims = {"exp": 4102444800}
+        return context
+
+    monkeypatch.setattr(auth, "_verify_token", fake_verify)
+
+    app = FastAPI()
+    app.include_router(auth_router.router, prefix="/auth")
+
+    @app.exception_handler(DomainError)
+    async def domain_error(request, exc):
+        return JSONResponse(status_code=exc.status_code, content={"message": exc.message})
+
+    @app.get("/resource", dependencies=[Depends(operator_auth)])
+    async def resource():
+        return {}
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer token-a"}
+    assert client.get("/resource", headers=headers).status_code == 200
+    assert client.post("/auth/logout", headers=headers).status_code == 204
+    response = client.get("/resource", headers=headers)
+
+    assert response.status_code == 401
+    assert response.json() == {"message": "JWT has been revoked"}
+    # Verified once; the logout reused the cached context and the revoked token never re-verified
+    assert verified == ["token-a"]
+
+
+_PROVIDERS = {
+    "operator_app": {"issuer": "https://a.example", "audience": "", "jwks_url": "https://a.example/keys", "client_id": "op"},
+    "explorer_app": {"issuer": "https://shared.example", "audience": "", "jwks_url": "https://shared.example/ex", "client_id": ""},
+    "internal_service": {"issuer": "https://shared.example", "audience": "", "jwks_url": "https://shared.example/in", "client_id": ""},
+}
+
+
+def _token(claims, kid="k1"):
+    return jwt.encode({"sub": "user-1", **claims}, "secret", algorithm="HS256", headers={"kid": kid})
+
+
+def _router():
+    router = ProviderRouter()
+    router.rebuild(_PROVIDERS)
+    router._settings = auth.settings
+    return router
+
+
+def test_known_issuer_routes_to_its_provider():
+    candidates, kid = _router().route(_token({"iss": "https://a.example", "client_id": "op"}))
+
+    assert [key for key, _ in candidates] == ["operator_app"]
+    assert kid == "k1"
+
+
+def test_unknown_issuer_is_rejected_before_verification():
+    with pytest.raises(UnauthorizedError):
+        _router().route(_token({"iss": "https://evil.example"}))
+
+
+def test_kid_narrows_a_shared_issuer_to_the_jwks_holding_the_key(monkeypatch):
+    monkeypatch.setattr(jwks_store, "has_key", lambda url, kid: url == "https://shared.example/in")
+
+    candidates, _ = _router().route(_token({"iss": "https://shared.example", "client_id": "unknown"}))
+
+    assert [key for key, _ in candidates] == ["internal_service"]
+
+
+def test_ambiguous_issuer_tries_each_candidate(monkeypatch):
+    monkeypatch.setattr(jwks_store, "has_key", lambda url, kid: False)
+    monkeypatch.setattr(auth, "provider_router", _router())
+    tried = []
+
+    async def fake_decode(token, provider, kid):
+        tried.append(provider["jwks_url"])
+        if provider["jwks_url"].endswith("/in"):
+            return {"iss": "https://shared.example", "sub": "user-1", "client_id": "other-app"}
+        return None
+
+    monkeypatch.setattr(auth, "_decode_with_provider", fake_decode)
+    token = _token({"iss": "https://shared.example", "client_id": "other-app"})
+
+    context = asyncio.run(auth._verify_token(token))
+
+    assert tried == ["https://shared.example/ex", "https://shared.example/in"]
+    assert context.provider == "internal_service"
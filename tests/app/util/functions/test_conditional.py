@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from starlette.requests import Request
+
+from app.util.functions.conditional import etag_for_version, is_not_modified, not_modified
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_etag_ignores_sub_millisecond_differences():
+    stored = datetime(2024, 5, 1, 12, 30, 0, 123000)
+    in_memory = datetime(2024, 5, 1, 12, 30, 0, 123456)
+
+    assert etag_for_version("exp-1", stored) == etag_for_version("exp-1", in_memory)
+    assert etag_for_version("exp-1", stored) != etag_for_version("exp-2", stored)
+
+
+def test_if_none_match_takes_precedence_and_uses_weak_comparison():
+    etag = etag_for_version("exp-1", datetime(2024, 5, 1))
+    updated_at = datetime(2024, 5, 1)
+
+    assert is_not_modified(_request(if_none_match=f'"other", W/{etag}'), etag, updated_at)
+    assert not is_not_modified(
+        _request(if_none_match='"other"', if_modified_since="Wed, 01 May 2024 00:00:00 GMT"), etag, updated_at
+    )
+
+
+def test_if_modified_since_compares_at_second_resolution():
+    etag = '"x"'
+    updated_at = datetime(2024, 5, 1, 12, 30, 0, 500000)
+
+    assert is_not_modified(_request(if_modified_since="Wed, 01 May 2024 12:30:00 GMT"), etag, updated_at)
+    assert not is_not_modified(_request(if_modified_since="Wed, 01 May 2024 12:29:59 GMT"), etag, updated_at)
+    assert not is_not_modified(_request(if_modified_since="not a date"), etag, updated_at)
+
+
+def test_not_modified_carries_validators():
+    response = not_modified('"x"', datetime(2024, 5, 1, 12, 30), "private, no-cache")
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"x"'
+    assert response.headers["last-modified"] == "Wed, 01 May 2024 12:30:00 GMT"
+    assert response.headers["cache-control"] == "private, no-cache"
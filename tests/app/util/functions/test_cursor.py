@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from bson import ObjectId
+import pytest
+
+from app.util.error_handling import BadRequestError
+from app.util.functions.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_keeps_bson_types():
+    oid = ObjectId()
+    created_at = datetime(2024, 5, 1, 12, 30)
+
+    cursor = encode_cursor({"s": "-created_at", "v": created_at, "id": oid})
+    payload = decode_cursor(cursor)
+
+    assert "=" not in cursor
+    assert payload["id"] == oid
+    assert payload["v"].replace(tzinfo=None) == created_at
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor!", "bm90IGpzb24", encode_cursor({"s": 1})[:-3] + "x"])
+def test_invalid_cursor_is_a_bad_request(cursor):
+    with pytest.raises(BadRequestError):
+        decode_cursor(cursor)
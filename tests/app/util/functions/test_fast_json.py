@@ -0,0 +1,37 @@
+from datetime import datetime
+import json
+
+from bson import ObjectId
+
+from app.schemas.experience import ExperienceListOutSchema, ExperienceOutSchema
+from app.util.functions.fast_json import dumps
+
+
+def test_constructed_models_are_dumped_without_validation():
+    oid = ObjectId()
+    result = ExperienceListOutSchema.model_construct(
+        items=[{"id": str(oid), "trip_title": "Kayak", "status": "published"}],
+        total=None,
+        page=1,
+        page_size=20,
+    )
+
+    body = json.loads(dumps(result))
+
+    assert body["items"] == [{"id": str(oid), "trip_title": "Kayak", "status": "published"}]
+    assert body["total"] is None and body["next_cursor"] is None
+
+
+def test_excluded_fields_and_bson_values_are_handled():
+    experience = ExperienceOutSchema.model_construct(
+        trip_title="Kayak",
+        operator_id="op-1",
+        search_prefixes=["ka", "kay"],
+        created_at=datetime(2024, 5, 1, 12, 30),
+    )
+
+    body = json.loads(dumps({"experience": experience, "oid": ObjectId("0" * 24)}))
+
+    assert "search_prefixes" not in body["experience"]
+    assert body["experience"]["created_at"].startswith("2024-05-01T12:30")
+    assert body["oid"] == "0" * 24
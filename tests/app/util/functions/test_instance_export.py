@@ -0,0 +1,54 @@
+import asyncio
+from datetime import datetime
+import json
+
+from app.util.functions import instance_export
+from app.util.functions.instance_export import ics, ndjson
+
+
+def _items(count, title="Sunrise kayak"):
+    async def items():
+        for day in range(1, count + 1):
+            yield {
+                "experience_id": "exp-1",
+                "trip_title": title,
+                "date": datetime(2026, 5, day, 7),
+                "status": "cancelled" if day == 2 else "scheduled",
+                "booked_count": day,
+                "available_count": None,
+                "location": {"type": "Point", "coordinates": [13.4, 52.5]},
+                "images": [],
+            }
+
+    return items()
+
+
+def _collect(stream):
+    async def collect():
+        return [chunk async for chunk in stream]
+
+    return asyncio.run(collect())
+
+
+def test_ndjson_sends_the_first_item_alone_then_buffers(monkeypatch):
+    monkeypatch.setattr(instance_export, "FLUSH_BYTES", 400)
+
+    chunks = _collect(ndjson(_items(10)))
+
+    assert chunks[0].count(b"\n") == 1
+    assert 1 < len(chunks) < 10
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line)["booked_count"] for line in lines] == list(range(1, 11))
+
+
+def test_ics_events_are_escaped_folded_and_in_utc():
+    body = b"".join(_collect(ics(_items(2, title="Kayak, sunrise; " + "long " * 20), "Cal"))).decode("utf-8")
+
+    assert body.startswith("BEGIN:VCALENDAR\r\n") and body.endswith("END:VCALENDAR\r\n")
+    assert body.count("BEGIN:VEVENT") == 2
+    assert "DTSTART:20260501T070000Z" in body
+    assert "UID:exp-1-20260502T070000Z@pica-bo" in body
+    assert "STATUS:CANCELLED" in body
+    assert "GEO:52.5;13.4" in body
+    assert all(len(line.encode("utf-8")) <= 75 for line in body.split("\r\n"))
+    assert r"SUMMARY:Kayak\, sunrise\; long" in body.replace("\r\n ", "")
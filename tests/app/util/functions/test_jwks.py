@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.util.functions import jwks
+from app.util.functions.jwks import JWKSKeyStore
+
+URL = "https://issuer.example/keys"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeFetch:
+    """Stands in for ``_fetch_sync``: returns the current key set or raises ``error``."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.error = None
+        self.calls = []
+
+    def __call__(self, jwks_url):
+        self.calls.append(jwks_url)
+        if self.error is not None:
+            raise self.error
+        return dict(self.keys)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # Only the store's clock is faked; the event loop keeps the real one
+    monkeypatch.setattr(jwks, "time", SimpleNamespace(monotonic=clock))
+    # Refresh loops sleep for exactly the configured interval
+    monkeypatch.setattr(jwks, "random", SimpleNamespace(uniform=lambda a, b: 1.0))
+    return clock
+
+
+def _store(fetch, **kwargs):
+    store = JWKSKeyStore(**kwargs)
+    store._fetch_sync = fetch
+    return store
+
+
+def test_start_prefetches_each_url_once_and_serves_from_memory(clock):
+    fetch = FakeFetch({"k1": "key-1"})
+    store = _store(fetch, refresh_interval=3600)
+
+    async def run():
+        await store.start([URL, URL, ""])
+        try:
+            return await store.get_signing_key(URL, "k1"), await store.get_signing_key(URL, "k1")
+        finally:
+            await store.stop()
+
+    assert asyncio.run(run()) == ("key-1", "key-1")
+    assert fetch.calls == [URL]
+
+
+def test_background_refresh_picks_up_new_keys_and_serves_stale_keys_on_failure(clock):
+    fetch = FakeFetch({"k1": "key-1"})
+    store = _store(fetch, refresh_interval=0.01, min_refetch_interval=0.01)
+
+    async def run():
+        await store.start([URL])
+        fetch.keys = {"k2": "key-2"}
+        await asyncio.sleep(0.05)
+        rotated = dict(store._key_set(URL).keys)
+
+        fetch.error = OSError("JWKS endpoint down")
+        calls = len(fetch.calls)
+        await asyncio.sleep(0.05)
+        stale = dict(store._key_set(URL).keys)
+        retried = len(fetch.calls) > calls
+        await store.stop()
+        return rotated, stale, retried
+
+    rotated, stale, retried = asyncio.run(run())
+
+    assert rotated == {"k2": "key-2"}
+    assert stale == {"k2": "key-2"}
+    assert retried
+
+
+def test_unknown_kid_refetches_at_most_once_per_interval(clock):
+    fetch = FakeFetch({"k1": "key-1"})
+    store = _store(fetch, refresh_interval=3600, min_refetch_interval=30)
+
+    async def run():
+        await store.start([URL])
+        results = [await store.get_signing_key(URL, "bogus")]
+        results.append(await store.get_signing_key(URL, "bogus"))
+        calls_while_limited = len(fetch.calls)
+
+        # Rotation after the interval: the new kid is fetched on demand
+        clock.now += 31
+        fetch.keys = {"k1": "key-1", "k2": "key-2"}
+        results.append(await store.get_signing_key(URL, "k2"))
+        await store.stop()
+        return results, calls_while_limited
+
+    results, calls_while_limited = asyncio.run(run())
+
+    assert results == [None, None, "key-2"]
+    # Prefetch plus a single forced refetch for the unknown kid
+    assert calls_while_limited == 2
+    assert len(fetch.calls) == 3
+
+
+def test_failed_prefetch_does_not_prevent_startup(clock):
+    fetch = FakeFetch({})
+    fetch.error = OSError("unreachable")
+    store = _store(fetch, refresh_interval=3600)
+
+    async def run():
+        await store.start([URL])
+        started = store._key_set(URL).refresher is not None
+        await store.stop()
+        return started
+
+    assert asyncio.run(run())
+    assert store._key_set(URL).keys == {}
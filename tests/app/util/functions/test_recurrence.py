@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from app.util.functions import recurrence
+from app.util.functions.recurrence import expand
+
+
+def test_expands_in_the_experience_timezone_to_naive_utc():
+    occurrences = expand(
+        "FREQ=WEEKLY;BYDAY=MO,WE",
+        datetime(2026, 1, 5, 9),
+        "Europe/Berlin",
+        datetime(2026, 1, 1),
+        datetime(2026, 1, 10),
+    )
+
+    assert occurrences == [datetime(2026, 1, 5, 9), datetime(2026, 1, 7, 9)]
+
+
+def test_unparsable_patterns_expand_to_nothing():
+    assert expand("FREQ=SOMETIMES", datetime(2026, 1, 1)) == []
+
+
+def test_rules_and_windows_are_cached_per_experience_version():
+    start, window = datetime(2026, 3, 1, 8), (datetime(2026, 3, 1), datetime(2026, 3, 31))
+    compiled, hits = recurrence._compiled.misses, recurrence._windows.hits
+
+    first = expand("FREQ=DAILY", start, "UTC", *window, key=("exp-1", datetime(2026, 2, 1)))
+    again = expand("FREQ=DAILY", start, "UTC", *window, key=("exp-1", datetime(2026, 2, 1)))
+    other_window = expand("FREQ=DAILY", start, "UTC", window[0], datetime(2026, 3, 10), key=("exp-1", datetime(2026, 2, 1)))
+    edited = expand("FREQ=DAILY;INTERVAL=2", start, "UTC", *window, key=("exp-1", datetime(2026, 2, 2)))
+
+    assert first == again and len(first) == 30
+    assert len(other_window) == 9
+    assert len(edited) == 15
+    assert recurrence._compiled.misses == compiled + 2
+    assert recurrence._windows.hits == hits + 1
+
+
+def test_simple_rules_are_recognised_and_others_fall_back():
+    assert recurrence.parse_simple("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,FR") == (recurrence._WEEKLY, 2, (0, 4), ())
+    assert recurrence.parse_simple("RRULE:FREQ=MONTHLY;BYMONTHDAY=31") == (recurrence._MONTHLY, 1, (), (31,))
+    assert recurrence.parse_simple("FREQ=DAILY;COUNT=5") is None
+    assert recurrence.parse_simple("FREQ=MONTHLY;BYDAY=1MO") is None
+
+
+def test_vectorized_expansion_matches_rrulestr_across_dst():
+    window = (datetime(2026, 2, 1), datetime(2026, 11, 30))
+    rules = [
+        ("FREQ=DAILY;INTERVAL=3", datetime(2025, 5, 6, 6, 45), "America/New_York"),
+        ("FREQ=WEEKLY;INTERVAL=2;BYDAY=SA,SU", datetime(2025, 2, 13, 1), "Europe/Berlin"),
+        ("FREQ=MONTHLY;BYMONTHDAY=1,15,31", datetime(2025, 1, 31, 22), "Asia/Kolkata"),
+        ("FREQ=DAILY;COUNT=400", datetime(2025, 6, 1, 12), "UTC"),
+    ]
+
+    batch = recurrence.expand_many(rules, *window)
+
+    for (pattern, start, tz), occurrences in zip(rules, batch):
+        compiled = recurrence.CompiledRecurrence(pattern, start, tz)
+        rule = recurrence.rrulestr(pattern, dtstart=compiled.start)
+        expected = [
+            recurrence._to_utc_naive(o)
+            for o in rule.between(recurrence._in_timezone(window[0], tz), recurrence._in_timezone(window[1], tz), inc=True)
+        ]
+        assert occurrences.tolist() == expected
+        assert expected
+
+
+def test_batch_expansion_reuses_compiled_rules_per_experience_version():
+    window = (datetime(2026, 4, 1), datetime(2026, 4, 30))
+    rules = [
+        ("FREQ=WEEKLY;BYDAY=TU", datetime(2026, 1, 6, 10), "Europe/Lisbon"),
+        ("FREQ=DAILY;COUNT=200", datetime(2026, 1, 1, 7), "UTC"),
+    ]
+    keys = [("exp-batch-1", datetime(2026, 3, 1)), ("exp-batch-2", datetime(2026, 3, 1))]
+    misses, window_hits = recurrence._compiled.misses, recurrence._windows.hits
+
+    first = recurrence.expand_many(rules, *window, keys)
+    again = recurrence.expand_many(rules, *window, keys)
+
+    assert [a.tolist() for a in first] == [b.tolist() for b in again]
+    assert len(first[0]) == 4 and len(first[1]) == 29
+    assert recurrence._compiled.misses == misses + 2
+    # Only the rrulestr fallback caches its window
+    assert recurrence._windows.hits == window_hits + 1
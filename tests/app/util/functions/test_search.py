@@ -0,0 +1,31 @@
+from app.util.functions.search import index_terms, query_terms, tokenize
+
+
+def _matches(search, texts):
+    terms = set(index_terms(texts))
+    return all(any(term in terms for term in group) for group in query_terms(search))
+
+
+def test_tokenize_folds_case_and_accents():
+    assert tokenize("Crème Brûlée, São-Paulo!") == ["creme", "brulee", "sao", "paulo"]
+
+
+def test_prefixes_match_as_you_type():
+    texts = ["Sunset kayak tour", "sea kayaking"]
+
+    assert _matches("kay", texts)
+    assert _matches("sunset ka", texts)
+    assert not _matches("kayak hike", texts)
+
+
+def test_one_typo_is_tolerated_in_longer_prefixes():
+    texts = ["Sunset kayak tour"]
+
+    assert _matches("kyak", texts)
+    assert _matches("sunste", texts)
+    assert not _matches("kyk", texts)
+
+
+def test_exact_prefix_comes_first_for_ranking():
+    assert query_terms("Kayak")[0][0] == "kayak"
+    assert query_terms("a") == []
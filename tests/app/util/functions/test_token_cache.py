@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import time
+
+import pytest
+
+from app.util.error_handling import UnauthorizedError
+from app.util.functions.auth import AuthContext
+from app.util.functions.token_cache import VerifiedTokenCache
+
+
+def _context(exp: float) -> AuthContext:
+    return AuthContext(
+        user_id="user-1",
+        client_id="app-1",
+        issuer="https://issuer.example",
+        claims={"exp": exp},
+        name="Jane",
+        email="jane@example.com",
+        provider="operator_app",
+    )
+
+
+def test_get_returns_cached_context_until_exp():
+    cache = VerifiedTokenCache(maxsize=10)
+
+    async def run():
+        context = _context(time.time() + 60)
+        await cache.set("token", context)
+        return await cache.get("token"), await cache.get("other")
+
+    hit, miss = asyncio.run(run())
+
+    assert hit is not None and hit.user_id == "user-1"
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_token_is_never_cached():
+    cache = VerifiedTokenCache(maxsize=10)
+
+    async def run():
+        await cache.set("token", _context(time.time() - 1))
+        return await cache.get("token")
+
+    assert asyncio.run(run()) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_revoked_token_is_dropped_and_not_recached():
+    cache = VerifiedTokenCache(maxsize=10)
+
+    async def run():
+        context = _context(time.time() + 60)
+        await cache.set("token", context)
+        await cache.revoke("token")
+        await cache.set("token", context)
+        with pytest.raises(UnauthorizedError):
+            await cache.get("token")
+        return cache.stats()["size"]
+
+    assert asyncio.run(run()) == 0
+    assert cache.is_revoked("token")
+
+
+class FakeRedis:
+    def __init__(self, values):
+        self.values = values
+
+    async def mget(self, *keys):
+        return [self.values.get(key) for key in keys]
+
+
+def test_revocation_marker_in_redis_is_refused_and_remembered():
+    cache = VerifiedTokenCache(maxsize=10, use_redis=True)
+    digest = hashlib.sha256(b"token").hexdigest()
+    cache.attach_redis(FakeRedis({f"auth:revoked:{digest}": "1"}))
+
+    with pytest.raises(UnauthorizedError):
+        asyncio.run(cache.get("token"))
+
+    assert cache.is_revoked("token")
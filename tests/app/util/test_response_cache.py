@@ -0,0 +1,93 @@
+import asyncio
+
+from app.util.response_cache import ResponseCache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def sunion(self, keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.sets.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    def set(self, key, value, ex=None):
+        self.redis.values[key] = value
+
+    def sadd(self, key, member):
+        self.redis.sets.setdefault(key, set()).add(member)
+
+    def expire(self, key, seconds):
+        pass
+
+    async def execute(self):
+        pass
+
+
+def test_purge_drops_only_tagged_entries():
+    cache = ResponseCache("test:local")
+
+    async def run():
+        await cache.set("a", b'{"a":1}', ["experience:1", "listing"])
+        await cache.set("b", b'{"b":1}', ["experience:2"])
+        await cache.purge(["experience:1"])
+        return await cache.get("a"), await cache.get("b")
+
+    a, b = asyncio.run(run())
+
+    assert a is None
+    assert b.body == b'{"b":1}'
+
+
+def test_purge_reaches_redis_and_other_workers():
+    redis = FakeRedis()
+    writer = ResponseCache("test:shared")
+    reader = ResponseCache("test:shared")
+    writer.attach_redis(redis)
+    reader.attach_redis(redis)
+
+    async def run():
+        await writer.set("list", b"[]", ["listing"], {"ETag": '"x"'})
+        cached = await reader.get("list")
+        await writer.purge(["listing"])
+        return cached, await reader.get("list")
+
+    cached, after = asyncio.run(run())
+
+    assert cached.headers == {"ETag": '"x"'}
+    assert reader.stats()["redis_hits"] == 1
+    assert after is None
+    assert redis.values == {}
+
+
+def test_response_read_before_a_purge_is_not_stored():
+    cache = ResponseCache("test:race")
+
+    async def run():
+        generation = cache.generation()
+        # A write purges the experience while the response is being built.
+        await cache.purge(["experience:1"])
+        await cache.set("detail", b"{}", ["experience:1"], generation=generation)
+        await cache.set("other", b"{}", ["experience:2"], generation=generation)
+        return await cache.get("detail"), await cache.get("other")
+
+    stale, other = asyncio.run(run())
+
+    assert stale is None
+    assert other is not None
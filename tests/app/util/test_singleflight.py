@@ -0,0 +1,28 @@
+import asyncio
+import time
+
+from app.util.singleflight import SingleFlight, should_refresh_early
+
+
+def test_concurrent_calls_share_one_load():
+    flight = SingleFlight("test:coalesce")
+    loads = []
+
+    async def load():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(20)))
+
+    results = asyncio.run(run())
+
+    assert results == ["value"] * 20
+    assert len(loads) == 1
+    assert flight.stats()["coalesced"] == 19
+
+
+def test_should_refresh_early_only_near_expiry():
+    assert should_refresh_early(time.time() - 1, delta=0.01)
+    assert not should_refresh_early(time.time() + 3600, delta=0.01)
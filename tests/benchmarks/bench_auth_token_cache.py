@@ -0,0 +1,63 @@
+"""Microbenchmark: full RS256 verification vs. verified-token cache hit.
+
+Run from the repository root::
+
+    PYTHONPATH=. python tests/benchmarks/bench_auth_token_cache.py
+"""
+
+import asyncio
+import json
+import time
+import timeit
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.core.config import settings
+from app.util.functions import auth
+from app.util.functions.jwks import jwks_store
+
+ITERATIONS = 2000
+
+
+def _setup() -> str:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid="bench", alg="RS256", use="sig")
+
+    settings.zitadel_operator_issuer = "https://issuer.example"
+    settings.zitadel_operator_jwks_url = "https://issuer.example/keys"
+    settings.zitadel_operator_audience = ""
+    settings.zitadel_operator_client_id = ""
+    key_set = jwks_store._key_set(settings.zitadel_operator_jwks_url)
+    key_set.keys = {"bench": jwt.PyJWK(jwk)}
+
+    claims = {"iss": settings.zitadel_operator_issuer, "sub": "user-1", "client_id": "app-1", "exp": time.time() + 3600}
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": "bench"})
+
+
+async def _per_call(coro_factory) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await coro_factory()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+async def main() -> None:
+    token = _setup()
+    providers = ["operator_app"]
+
+    verify = await _per_call(lambda: auth._verify_token(token, providers))
+    await auth._decode_and_verify_token(token, providers)  # warm the cache
+    cached = await _per_call(lambda: auth._decode_and_verify_token(token, providers))
+    lookup = timeit.timeit(lambda: {"k": 1}.get("k"), number=ITERATIONS) / ITERATIONS
+
+    print(f"full verification : {verify * 1e6:9.1f} us/token")
+    print(f"cache hit         : {cached * 1e6:9.1f} us/token")
+    print(f"dict lookup       : {lookup * 1e6:9.1f} us/op")
+    print(f"speedup           : {verify / cached:9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""Microbenchmark: serializing a 200-item experience page.
+
+Compares the previous path (validate raw documents into the response schema,
+then let FastAPI validate the response model again and encode it) with the
+raw-projection fast path (map BSON dicts to the compact shape, construct the
+response without validation and encode it with FastJSONResponse). The old
+path additionally hydrated Beanie documents, which is not counted here.
+
+Run from the repository root::
+
+    PYTHONPATH=. python tests/benchmarks/bench_listing_serialization.py
+"""
+
+from datetime import datetime
+import time
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.repositories.experience_repository import ExperienceRepository
+from app.repositories.listing import Page
+from app.schemas.experience import ExperienceListingQuery, ExperienceListOutSchema
+from app.util.functions import fast_json
+
+PAGE_SIZE = 200
+ITERATIONS = 200
+
+
+def _documents() -> list:
+    return [
+        {
+            "_id": ObjectId(),
+            "trip_title": f"Sunset kayak tour #{i}",
+            "short_description": "Paddle along the coast and watch the sun go down over the bay.",
+            "images": [f"https://cdn.example/experiences/{i}/1.jpg", f"https://cdn.example/experiences/{i}/2.jpg"],
+            "price_per_person": 40.0 + i,
+            "location": {"type": "Point", "coordinates": [12.49 + i / 1000, 41.89]},
+            "status": "published",
+            "created_at": datetime(2024, 5, 1, 12, 30),
+        }
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def _before(docs: list) -> bytes:
+    items = []
+    for doc in docs:
+        doc = dict(doc)
+        doc["id"] = str(doc.pop("_id"))
+        items.append(doc)
+    result = ExperienceListOutSchema(items=items, total=len(items), page=1, page_size=PAGE_SIZE)
+    # FastAPI's response_model handling: validate again, then encode
+    validated = TypeAdapter(ExperienceListOutSchema).validate_python(result, from_attributes=True)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def _after(docs: list, repo: ExperienceRepository, query: ExperienceListingQuery) -> bytes:
+    result = repo._to_list_out(query, {}, Page(items=docs, total=len(docs)), None)
+    return fast_json.FastJSONResponse(result).body
+
+
+def _per_page(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    docs = _documents()
+    repo = ExperienceRepository()
+    query = ExperienceListingQuery(page_size=PAGE_SIZE)
+
+    before = _per_page(lambda: _before(docs))
+    after = _per_page(lambda: _after(docs, repo, query))
+
+    print(f"encoder           : {'orjson' if fast_json.orjson else 'json'}")
+    print(f"validate + encode : {before * 1e3:8.2f} ms/page  {PAGE_SIZE / before:10.0f} docs/s")
+    print(f"raw fast path     : {after * 1e3:8.2f} ms/page  {PAGE_SIZE / after:10.0f} docs/s")
+    print(f"speedup           : {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Microbenchmark: per-experience rrulestr expansion vs. the vectorized batch engine.
+
+Expands 10k recurring experiences (a realistic mix of DAILY, WEEKLY and
+MONTHLY rules across a few timezones) over a 90-day window.
+
+Run from the repository root::
+
+    PYTHONPATH=. python tests/benchmarks/bench_recurrence_expansion.py
+"""
+
+from datetime import datetime, timedelta
+import random
+import time
+
+from dateutil.rrule import rrulestr
+
+from app.util.functions.recurrence import _in_timezone, _to_utc_naive, expand_many
+
+EXPERIENCES = 10_000
+WINDOW_START = datetime(2026, 3, 1)
+WINDOW_END = WINDOW_START + timedelta(days=90)
+
+PATTERNS = [
+    "FREQ=DAILY",
+    "FREQ=DAILY;INTERVAL=2",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;BYDAY=SA,SU",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=MONTHLY;BYMONTHDAY=1,15",
+]
+TIMEZONES = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Kolkata"]
+
+
+def _rules():
+    rng = random.Random(7)
+    return [
+        (
+            rng.choice(PATTERNS),
+            datetime(2025, rng.randint(1, 12), rng.randint(1, 28), rng.choice([6, 8, 9, 14, 17]), rng.choice([0, 30])),
+            rng.choice(TIMEZONES),
+        )
+        for _ in range(EXPERIENCES)
+    ]
+
+
+def _rrulestr(rules):
+    out = []
+    for pattern, start_date, tz in rules:
+        start = _in_timezone(start_date, tz)
+        rule = rrulestr(pattern, dtstart=start)
+        ws, we = _in_timezone(WINDOW_START, tz), _in_timezone(WINDOW_END, tz)
+        out.append([_to_utc_naive(o) for o in rule.between(ws, we, inc=True)])
+    return out
+
+
+def main() -> None:
+    rules = _rules()
+
+    start = time.perf_counter()
+    baseline = _rrulestr(rules)
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = expand_many(rules, WINDOW_START, WINDOW_END)
+    vectorized_seconds = time.perf_counter() - start
+
+    assert [o.tolist() for o in vectorized] == baseline
+    occurrences = sum(len(o) for o in baseline)
+    print(f"{EXPERIENCES} experiences, 90 days, {occurrences} occurrences")
+    print(f"rrulestr per experience: {baseline_seconds * 1000:9.1f} ms")
+    print(f"vectorized batch:        {vectorized_seconds * 1000:9.1f} ms")
+    print(f"speedup:                 {baseline_seconds / vectorized_seconds:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""In-memory stand-ins for the Mongo collections and Beanie models used by the tests.
+
+``FakeCollection`` records what a repository sends and answers from
+``docs``; tests that need a particular aggregation answer subclass it and
+override ``aggregate_result``. ``FakeModel`` stands in for a Beanie document
+class where only ``get`` and ``find({"_id": {"$in": ...}})`` are used.
+"""
+
+from types import SimpleNamespace
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = list(docs)
+
+    def sort(self, spec):
+        return self
+
+    def skip(self, n):
+        self.docs = self.docs[n:]
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+    def __aiter__(self):
+        self._it = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    """Records calls; subclasses override ``aggregate_result`` to answer pipelines."""
+
+    name = "things"
+
+    def __init__(self, docs=None):
+        self.docs = list(docs or [])
+        self.calls = []
+        self.pipelines = []
+        self.updates = []
+        self.inserted = []
+        self.writes = []
+        self.existing = None
+        self.updated = None
+        self.database = None
+
+    def aggregate_result(self, pipeline):
+        return []
+
+    async def aggregate(self, pipeline):
+        self.calls.append("aggregate")
+        self.pipelines.append(pipeline)
+        return FakeCursor(self.aggregate_result(pipeline))
+
+    def find(self, filter=None, projection=None):
+        self.calls.append("find")
+        if filter and "_id" in filter:
+            ids = filter["_id"]["$in"]
+            return FakeCursor([doc for doc in self.docs if doc["_id"] in ids])
+        return FakeCursor(self.docs)
+
+    async def find_one(self, filter, projection=None):
+        return self.existing
+
+    async def find_one_and_update(self, filter, update, return_document=None):
+        self.calls.append("find_one_and_update")
+        self.updates.append((filter, update))
+        return self.updated
+
+    async def update_one(self, filter, update):
+        self.updates.append((filter, update))
+
+    async def insert_one(self, doc):
+        self.inserted.append(doc)
+
+    async def insert_many(self, docs):
+        self.inserted.extend(docs)
+
+    async def bulk_write(self, requests, ordered=True):
+        self.writes.extend(requests)
+
+    async def delete_many(self, filter):
+        self.writes.append(("delete_many", filter))
+
+    async def count_documents(self, filter):
+        self.calls.append("count_documents")
+        return len(self.docs)
+
+    async def estimated_document_count(self):
+        self.calls.append("estimated_document_count")
+        return len(self.docs)
+
+
+class FakeQuery:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self):
+        return self.docs
+
+
+class FakeModel:
+    # Ids asked for by each query, in order
+    queries = []
+
+    @classmethod
+    async def get(cls, oid):
+        cls.queries.append([oid])
+        return SimpleNamespace(id=oid)
+
+    @classmethod
+    def find(cls, filter):
+        ids = filter["_id"]["$in"]
+        cls.queries.append(list(ids))
+        return FakeQuery([SimpleNamespace(id=id) for id in ids])